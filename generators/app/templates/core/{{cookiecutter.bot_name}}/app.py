@@ -17,7 +17,10 @@ from botbuilder.core import (
     UserState,
 )
 from botbuilder.core.integration import aiohttp_error_middleware
-from botbuilder.integration.aiohttp import ConfigurationBotFrameworkAuthentication
+from botbuilder.integration.aiohttp import (
+    ConfigurationBotFrameworkAuthentication,
+    aiohttp_http_session_cleanup,
+)
 from botbuilder.schema import Activity
 
 from config import DefaultConfig
@@ -68,6 +71,7 @@ async def messages(req: Request) -> Response:
 
 APP = web.Application(middlewares=[aiohttp_error_middleware])
 APP.router.add_post("/api/messages", messages)
+APP.on_cleanup.append(aiohttp_http_session_cleanup)
 
 if __name__ == "__main__":
     try:
@@ -10,7 +10,11 @@ from aiohttp import web
 from aiohttp.web import Request, Response, json_response
 from botbuilder.core import TurnContext
 from botbuilder.core.integration import aiohttp_error_middleware
-from botbuilder.integration.aiohttp import CloudAdapter, ConfigurationBotFrameworkAuthentication
+from botbuilder.integration.aiohttp import (
+    CloudAdapter,
+    ConfigurationBotFrameworkAuthentication,
+    aiohttp_http_session_cleanup,
+)
 from botbuilder.schema import Activity, ActivityTypes
 
 from bot import MyBot
@@ -75,6 +79,7 @@ async def messages(req: Request) -> Response:
 
 APP = web.Application(middlewares=[aiohttp_error_middleware])
 APP.router.add_post("/api/messages", messages)
+APP.on_cleanup.append(aiohttp_http_session_cleanup)
 
 if __name__ == "__main__":
     try:
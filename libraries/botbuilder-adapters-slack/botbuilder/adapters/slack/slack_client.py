@@ -14,6 +14,7 @@ from slack.web.client import WebClient
 from slack.web.slack_response import SlackResponse
 
 from botbuilder.schema import Activity
+from botframework.connector import HttpSessionManager
 from botbuilder.adapters.slack.slack_client_options import SlackClientOptions
 from botbuilder.adapters.slack.slack_message import SlackMessage
 
@@ -409,15 +410,13 @@ class SlackClient(WebClient):
         if message.blocks:
             request_content["blocks"] = json.dumps(message.blocks)
 
-        session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-        )
-
         http_verb = "POST"
         api_url = POST_EPHEMERAL_MESSAGE_URL if message.ephemeral else POST_MESSAGE_URL
         req_args = {"data": request_content}
 
-        async with session.request(http_verb, api_url, **req_args) as res:
+        async with HttpSessionManager.get_session().request(
+            http_verb, api_url, timeout=aiohttp.ClientTimeout(total=30), **req_args
+        ) as res:
             response_content = {}
             try:
                 response_content = await res.json()
@@ -438,6 +437,4 @@ class SlackClient(WebClient):
             }
             response = SlackResponse(**{**data, **response_data}).validate()
 
-        await session.close()
-
         return response
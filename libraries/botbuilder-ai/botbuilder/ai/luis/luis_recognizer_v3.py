@@ -4,7 +4,6 @@
 import re
 from typing import Dict
 
-import aiohttp
 from botbuilder.ai.luis.activity_util import ActivityUtil
 from botbuilder.ai.luis.luis_util import LuisUtil
 from botbuilder.core import (
@@ -12,6 +11,7 @@ from botbuilder.core import (
     RecognizerResult,
     TurnContext,
 )
+from botframework.connector import HttpSessionManager
 from .luis_recognizer_internal import LuisRecognizerInternal
 from .luis_recognizer_options_v3 import LuisRecognizerOptionsV3
 from .luis_application import LuisApplication
@@ -66,38 +66,35 @@ class LuisRecognizerV3(LuisRecognizerInternal):
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=body, headers=headers, ssl=False
-            ) as result:
-                luis_result = await result.json()
-
-                recognizer_result = RecognizerResult(
-                    text=utterance,
-                    intents=self._get_intents(luis_result["prediction"]),
-                    entities=self._extract_entities_and_metadata(
-                        luis_result["prediction"]
-                    ),
-                )
-
-                if self.luis_recognizer_options_v3.include_instance_data:
-                    recognizer_result.entities[self._metadata_key] = (
-                        recognizer_result.entities[self._metadata_key]
-                        if self._metadata_key in recognizer_result.entities
-                        else {}
-                    )
+        async with HttpSessionManager.get_session().post(
+            url, json=body, headers=headers, ssl=False
+        ) as result:
+            luis_result = await result.json()
 
-                if "sentiment" in luis_result["prediction"]:
-                    recognizer_result.properties["sentiment"] = self._get_sentiment(
-                        luis_result["prediction"]
-                    )
+        recognizer_result = RecognizerResult(
+            text=utterance,
+            intents=self._get_intents(luis_result["prediction"]),
+            entities=self._extract_entities_and_metadata(luis_result["prediction"]),
+        )
+
+        if self.luis_recognizer_options_v3.include_instance_data:
+            recognizer_result.entities[self._metadata_key] = (
+                recognizer_result.entities[self._metadata_key]
+                if self._metadata_key in recognizer_result.entities
+                else {}
+            )
+
+        if "sentiment" in luis_result["prediction"]:
+            recognizer_result.properties["sentiment"] = self._get_sentiment(
+                luis_result["prediction"]
+            )
 
-                await self._emit_trace_info(
-                    turn_context,
-                    luis_result,
-                    recognizer_result,
-                    self.luis_recognizer_options_v3,
-                )
+        await self._emit_trace_info(
+            turn_context,
+            luis_result,
+            recognizer_result,
+            self.luis_recognizer_options_v3,
+        )
 
         return recognizer_result
 
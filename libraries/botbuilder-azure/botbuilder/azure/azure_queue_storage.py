@@ -5,12 +5,30 @@ from azure.core.exceptions import ResourceExistsError
 from azure.storage.queue.aio import QueueClient
 from jsonpickle import encode
 
-from botbuilder.core import QueueStorage
+from botbuilder.core import (
+    JsonPickleStoreItemSerializer,
+    QueueStorage,
+    StoreItemSerializer,
+)
 from botbuilder.schema import Activity
 
 
 class AzureQueueStorage(QueueStorage):
-    def __init__(self, queues_storage_connection_string: str, queue_name: str):
+    def __init__(
+        self,
+        queues_storage_connection_string: str,
+        queue_name: str,
+        serializer: StoreItemSerializer = None,
+    ):
+        """
+        :param queues_storage_connection_string: Connection string of the Azure Storage account.
+        :type queues_storage_connection_string: str
+        :param queue_name: Name of the queue.
+        :type queue_name: str
+        :param serializer: Optional, converts activities to queue messages. Defaults to jsonpickle.
+            Messages are text, so the serializer must not compress.
+        :type serializer: :class:`botbuilder.core.StoreItemSerializer`
+        """
         if not queues_storage_connection_string:
             raise Exception("queues_storage_connection_string cannot be empty.")
         if not queue_name:
@@ -21,6 +39,7 @@ class AzureQueueStorage(QueueStorage):
         )
 
         self.__initialized = False
+        self.__serializer = serializer or JsonPickleStoreItemSerializer()
 
     async def _initialize(self):
         if self.__initialized is False:
@@ -57,7 +76,7 @@ class AzureQueueStorage(QueueStorage):
         await self._initialize()
 
         # Encode the activity as a JSON string.
-        message = encode(activity)
+        message = self.__serializer.dumps(self.__serializer.to_dict(activity))
 
         receipt = await self.__queue_client.send_message(
             message, visibility_timeout=visibility_timeout, time_to_live=time_to_live
@@ -1,11 +1,9 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-import json
-from typing import Dict, List
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Union
 
-from jsonpickle import encode
-from jsonpickle.unpickler import Unpickler
 from azure.core import MatchConditions
 from azure.core.exceptions import (
     HttpResponseError,
@@ -17,7 +15,11 @@ from azure.storage.blob.aio import (
     BlobClient,
     StorageStreamDownloader,
 )
-from botbuilder.core import Storage
+from botbuilder.core import (
+    JsonPickleStoreItemSerializer,
+    Storage,
+    StoreItemSerializer,
+)
 
 
 class BlobStorageSettings:
@@ -32,6 +34,9 @@ class BlobStorageSettings:
     :param connection_string: Connection string of the Blob Storage account.
         Required if not using account_name and account_key.
     :type connection_string: str
+    :param max_concurrency: Maximum number of blob operations a single read, write or delete
+        has in flight at once.
+    :type max_concurrency: int
     """
 
     def __init__(
@@ -40,11 +45,13 @@ class BlobStorageSettings:
         account_name: str = "",
         account_key: str = "",
         connection_string: str = "",
+        max_concurrency: int = 16,
     ):
         self.container_name = container_name
         self.account_name = account_name
         self.account_key = account_key
         self.connection_string = connection_string
+        self.max_concurrency = max_concurrency
 
 
 # New Azure Blob SDK only allows connection strings, but our SDK allows key+name.
@@ -60,6 +67,10 @@ def convert_account_name_and_key_to_connection_string(settings: BlobStorageSetti
     )
 
 
+# The Blob batch API accepts at most 256 sub-requests per batch.
+_MAX_BATCH_SIZE = 256
+
+
 class BlobStorage(Storage):
     """An Azure Blob based storage provider for a bot.
 
@@ -69,12 +80,19 @@ class BlobStorage(Storage):
     If an entity is an StoreItem, the storage object will set the entity's e_tag
     property value to the blob's e_tag upon read. Afterward, an match_condition with the ETag value
     will be generated during Write. New entities start with a null e_tag.
+    The blobs of a multi-key read or write are accessed concurrently, and multi-key deletes are sent
+    with the Blob batch API. Accounts that reject batches, such as those with a hierarchical
+    namespace, get concurrent single blob deletes instead.
 
     :param settings: Settings used to instantiate the Blob service.
     :type settings: :class:`botbuilder.azure.BlobStorageSettings`
+    :param serializer: Optional, converts store items to and from blob content. Defaults to jsonpickle.
+    :type serializer: :class:`botbuilder.core.StoreItemSerializer`
     """
 
-    def __init__(self, settings: BlobStorageSettings):
+    def __init__(
+        self, settings: BlobStorageSettings, serializer: StoreItemSerializer = None
+    ):
         if not settings.container_name:
             raise Exception("Container name is required.")
 
@@ -92,6 +110,9 @@ class BlobStorage(Storage):
         )
 
         self.__initialized = False
+        self.__batch_supported = True
+        self.__max_concurrency = settings.max_concurrency or 1
+        self.__serializer = serializer or JsonPickleStoreItemSerializer()
 
     async def _initialize(self):
         if self.__initialized is False:
@@ -118,16 +139,19 @@ class BlobStorage(Storage):
 
         items = {}
 
-        for key in keys:
+        async def read_blob(key: str):
             blob_client = self.__container_client.get_blob_client(key)
 
             try:
                 items[key] = await self._inner_read_blob(blob_client)
             except HttpResponseError as err:
                 if err.status_code == 404:
-                    continue
+                    return
 
-        return items
+        await self._run_concurrently(read_blob, keys)
+
+        # keep the order of the keys, regardless of which blob arrived first
+        return {key: items[key] for key in keys if key in items}
 
     async def write(self, changes: Dict[str, object]):
         """Stores a new entity in the configured blob container.
@@ -143,7 +167,8 @@ class BlobStorage(Storage):
 
         await self._initialize()
 
-        for name, item in changes.items():
+        async def write_blob(name: str):
+            item = changes[name]
             blob_reference = self.__container_client.get_blob_client(name)
 
             e_tag = None
@@ -164,6 +189,8 @@ class BlobStorage(Storage):
             else:
                 await blob_reference.upload_blob(item_str, overwrite=True)
 
+        await self._run_concurrently(write_blob, list(changes))
+
     async def delete(self, keys: List[str]):
         """Deletes entity blobs from the configured container.
 
@@ -175,7 +202,9 @@ class BlobStorage(Storage):
 
         await self._initialize()
 
-        for key in keys:
+        keys = list(keys)
+
+        async def delete_blob(key: str):
             blob_client = self.__container_client.get_blob_client(key)
             try:
                 await blob_client.delete_blob()
@@ -183,17 +212,72 @@ class BlobStorage(Storage):
             except ResourceNotFoundError:
                 pass
 
-    def _store_item_to_str(self, item: object) -> str:
-        return encode(item)
+        if len(keys) <= 1 or not self.__batch_supported:
+            await self._run_concurrently(delete_blob, keys)
+            return
+
+        batches = [
+            keys[start : start + _MAX_BATCH_SIZE]
+            for start in range(0, len(keys), _MAX_BATCH_SIZE)
+        ]
+        rejected = []
+
+        async def delete_batch(batch: List[str]):
+            try:
+                responses = await self.__container_client.delete_blobs(
+                    *batch, raise_on_any_failure=False
+                )
+            except HttpResponseError:
+                # The account doesn't take batches, don't send it any more of them.
+                self.__batch_supported = False
+                rejected.extend(batch)
+                return
+
+            # The sub-responses are in the order of the blobs in the batch.
+            index = 0
+            async for response in responses:
+                # We can't delete what's already gone.
+                if (
+                    response.status_code != 404
+                    and not 200 <= response.status_code < 300
+                ):
+                    rejected.append(batch[index])
+                index += 1
+
+        await self._run_concurrently(delete_batch, batches)
+
+        # Failed sub-requests are retried on their own, which raises their error if they fail again.
+        await self._run_concurrently(delete_blob, rejected)
+
+    async def _run_concurrently(
+        self, operation: Callable[[object], Awaitable], arguments: List[object]
+    ):
+        """Runs an operation for each argument, with at most max_concurrency of them in flight.
+        All operations are awaited, and the first error in argument order is raised.
+        """
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+
+        async def run(argument: object):
+            async with semaphore:
+                await operation(argument)
+
+        results = await asyncio.gather(
+            *[run(argument) for argument in arguments], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _store_item_to_str(self, item: object) -> Union[str, bytes]:
+        return self.__serializer.dumps(self.__serializer.to_dict(item))
 
     async def _inner_read_blob(self, blob_client: BlobClient):
         blob = await blob_client.download_blob()
 
         return await self._blob_to_store_item(blob)
 
-    @staticmethod
-    async def _blob_to_store_item(blob: StorageStreamDownloader) -> object:
-        item = json.loads(await blob.content_as_text())
+    async def _blob_to_store_item(self, blob: StorageStreamDownloader) -> object:
+        item = self.__serializer.loads(await blob.readall())
         item["e_tag"] = blob.properties.etag.replace('"', "")
-        result = Unpickler().restore(item)
+        result = self.__serializer.from_dict(item)
         return result
@@ -3,17 +3,19 @@
 
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
-from typing import Dict, List
-from threading import Lock
+from typing import Awaitable, Dict, List
+import asyncio
 import json
 from hashlib import sha256
 from azure.core import MatchConditions
 from azure.cosmos import documents, http_constants
-from jsonpickle.pickler import Pickler
-from jsonpickle.unpickler import Unpickler
-import azure.cosmos.cosmos_client as cosmos_client  # pylint: disable=no-name-in-module,import-error
+import azure.cosmos.aio as cosmos_client  # pylint: disable=no-name-in-module,import-error
 import azure.cosmos.exceptions as cosmos_exceptions
 from botbuilder.core.storage import Storage
+from botbuilder.core.store_item_serializer import (
+    JsonPickleStoreItemSerializer,
+    StoreItemSerializer,
+)
 
 
 class CosmosDbPartitionedConfig:
@@ -107,21 +109,33 @@ class CosmosDbKeyEscape:
 
 
 class CosmosDbPartitionedStorage(Storage):
-    """A CosmosDB based storage provider using partitioning for a bot."""
+    """A CosmosDB based storage provider using partitioning for a bot.
 
-    def __init__(self, config: CosmosDbPartitionedConfig):
+    Uses the asynchronous Cosmos DB client, so storage calls don't block the event loop.
+    A multi-key read is a single query, and the items of a multi-key write or delete are
+    sent concurrently.
+    """
+
+    def __init__(
+        self,
+        config: CosmosDbPartitionedConfig,
+        serializer: StoreItemSerializer = None,
+    ):
         """Create the storage object.
 
         :param config:
+        :param serializer: Optional, converts store items to and from documents. Defaults to jsonpickle.
         """
         super(CosmosDbPartitionedStorage, self).__init__()
         self.config = config
+        self.__serializer = serializer or JsonPickleStoreItemSerializer()
         self.client = None
         self.database = None
         self.container = None
         self.compatability_mode_partition_key = False
-        # Lock used for synchronizing container creation
-        self.__lock = Lock()
+        # Lock used for synchronizing container creation, created on first use so that the
+        # storage can be constructed outside of an event loop.
+        self.__lock: asyncio.Lock = None
         if config.key_suffix is None:
             config.key_suffix = ""
         if not config.key_suffix.__eq__(""):
@@ -147,30 +161,44 @@ class CosmosDbPartitionedStorage(Storage):
 
         await self.initialize()
 
+        escaped_keys = [
+            CosmosDbKeyEscape.sanitize_key(
+                key, self.config.key_suffix, self.config.compatibility_mode
+            )
+            for key in keys
+        ]
+
+        if len(escaped_keys) == 1:
+            documents_read = await self.__read_document(escaped_keys[0])
+        else:
+            documents_read = [
+                document
+                async for document in self.container.query_items(
+                    query="SELECT * FROM c WHERE ARRAY_CONTAINS(@ids, c.id)",
+                    parameters=[{"name": "@ids", "value": escaped_keys}],
+                )
+            ]
+
         store_items = {}
+        for document_store_item in documents_read:
+            store_items[document_store_item["realId"]] = self.__create_si(
+                document_store_item
+            )
 
-        for key in keys:
-            try:
-                escaped_key = CosmosDbKeyEscape.sanitize_key(
-                    key, self.config.key_suffix, self.config.compatibility_mode
-                )
+        # keep the order of the keys, regardless of the order of the query results
+        return {key: store_items[key] for key in keys if key in store_items}
 
-                read_item_response = self.container.read_item(
-                    escaped_key, self.__get_partition_key(escaped_key)
-                )
-                document_store_item = read_item_response
-                if document_store_item:
-                    store_items[document_store_item["realId"]] = self.__create_si(
-                        document_store_item
-                    )
-            # When an item is not found a CosmosException is thrown, but we want to
-            # return an empty collection so in this instance we catch and do not rethrow.
-            # Throw for any other exception.
-            except cosmos_exceptions.CosmosResourceNotFoundError:
-                continue
-            except Exception as err:
-                raise err
-        return store_items
+    async def __read_document(self, escaped_key: str) -> List[Dict]:
+        try:
+            document_store_item = await self.container.read_item(
+                escaped_key, self.__get_partition_key(escaped_key)
+            )
+        # When an item is not found a CosmosException is thrown, but we want to
+        # return an empty collection so in this instance we catch and do not rethrow.
+        # Throw for any other exception.
+        except cosmos_exceptions.CosmosResourceNotFoundError:
+            return []
+        return [document_store_item] if document_store_item else []
 
     async def write(self, changes: Dict[str, object]):
         """Save storeitems to storage.
@@ -185,7 +213,7 @@ class CosmosDbPartitionedStorage(Storage):
 
         await self.initialize()
 
-        for key, change in changes.items():
+        async def upsert(key: str, change: object):
             e_tag = None
             if isinstance(change, dict):
                 e_tag = change.get("e_tag", None)
@@ -203,16 +231,15 @@ class CosmosDbPartitionedStorage(Storage):
 
             access_condition = e_tag != "*" and e_tag and e_tag != ""
 
-            try:
-                self.container.upsert_item(
-                    body=doc,
-                    etag=e_tag if access_condition else None,
-                    match_condition=(
-                        MatchConditions.IfNotModified if access_condition else None
-                    ),
-                )
-            except Exception as err:
-                raise err
+            await self.container.upsert_item(
+                body=doc,
+                etag=e_tag if access_condition else None,
+                match_condition=(
+                    MatchConditions.IfNotModified if access_condition else None
+                ),
+            )
+
+        await self.__run_all([upsert(key, change) for key, change in changes.items()])
 
     async def delete(self, keys: List[str]):
         """Remove storeitems from storage.
@@ -222,22 +249,32 @@ class CosmosDbPartitionedStorage(Storage):
         """
         await self.initialize()
 
-        for key in keys:
+        async def delete_item(key: str):
             escaped_key = CosmosDbKeyEscape.sanitize_key(
                 key, self.config.key_suffix, self.config.compatibility_mode
             )
             try:
-                self.container.delete_item(
+                await self.container.delete_item(
                     escaped_key,
                     self.__get_partition_key(escaped_key),
                 )
             except cosmos_exceptions.CosmosResourceNotFoundError:
-                continue
-            except Exception as err:
-                raise err
+                pass
+
+        await self.__run_all([delete_item(key) for key in keys])
 
     async def initialize(self):
-        if not self.container:
+        # The container is only set once fully initialized, so the hot path never takes the lock.
+        if self.container:
+            return
+
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+
+        async with self.__lock:
+            if self.container:
+                return
+
             if not self.client:
                 connection_policy = self.config.cosmos_client_options.get(
                     "connection_policy", documents.ConnectionPolicy()
@@ -245,64 +282,78 @@ class CosmosDbPartitionedStorage(Storage):
 
                 # kwargs 'connection_verify' is to handle CosmosClient overwriting the
                 # ConnectionPolicy.DisableSSLVerification value.
-                self.client = cosmos_client.CosmosClient(
+                client = cosmos_client.CosmosClient(
                     self.config.cosmos_db_endpoint,
                     self.config.auth_key,
-                    self.config.cosmos_client_options.get("consistency_level", None),
+                    consistency_level=self.config.cosmos_client_options.get(
+                        "consistency_level", None
+                    ),
                     **{
                         "connection_policy": connection_policy,
                         "connection_verify": not connection_policy.DisableSSLVerification,
                     },
                 )
+                await client.__aenter__()  # pylint: disable=unnecessary-dunder-call
+                self.client = client
 
             if not self.database:
-                with self.__lock:
-                    if not self.database:
-                        self.database = self.client.create_database_if_not_exists(
-                            self.config.database_id
-                        )
-
-            self.__get_or_create_container()
+                self.database = await self.client.create_database_if_not_exists(
+                    self.config.database_id
+                )
 
-    def __get_or_create_container(self):
-        with self.__lock:
-            partition_key = {
-                "paths": ["/id"],
-                "kind": documents.PartitionKind.Hash,
-            }
-            try:
-                if not self.container:
-                    self.container = self.database.create_container(
-                        self.config.container_id,
-                        partition_key,
-                        offer_throughput=self.config.container_throughput,
-                    )
-            except cosmos_exceptions.CosmosHttpResponseError as err:
-                if err.status_code == http_constants.StatusCodes.CONFLICT:
-                    self.container = self.database.get_container_client(
-                        self.config.container_id
-                    )
-                    properties = self.container.read()
-                    if "partitionKey" not in properties:
+            await self.__get_or_create_container()
+
+    async def close(self):
+        """Closes the connections of the Cosmos DB client."""
+        if self.client:
+            await self.client.close()
+            self.client = None
+            self.database = None
+            self.container = None
+
+    async def __get_or_create_container(self):
+        partition_key = {
+            "paths": ["/id"],
+            "kind": documents.PartitionKind.Hash,
+        }
+        try:
+            self.container = await self.database.create_container(
+                self.config.container_id,
+                partition_key,
+                offer_throughput=self.config.container_throughput,
+            )
+        except cosmos_exceptions.CosmosHttpResponseError as err:
+            if err.status_code == http_constants.StatusCodes.CONFLICT:
+                container = self.database.get_container_client(self.config.container_id)
+                properties = await container.read()
+                if "partitionKey" not in properties:
+                    self.compatability_mode_partition_key = True
+                else:
+                    paths = properties["partitionKey"]["paths"]
+                    if "/partitionKey" in paths:
                         self.compatability_mode_partition_key = True
-                    else:
-                        paths = properties["partitionKey"]["paths"]
-                        if "/partitionKey" in paths:
-                            self.compatability_mode_partition_key = True
-                        elif "/id" not in paths:
-                            raise Exception(
-                                f"Custom Partition Key Paths are not supported. {self.config.container_id} "
-                                "has a custom Partition Key Path of {paths[0]}."
-                            )
+                    elif "/id" not in paths:
+                        raise Exception(
+                            f"Custom Partition Key Paths are not supported. {self.config.container_id} "
+                            "has a custom Partition Key Path of {paths[0]}."
+                        )
+                self.container = container
 
-                else:
-                    raise err
+            else:
+                raise err
+
+    @staticmethod
+    async def __run_all(operations: List[Awaitable]):
+        """Awaits all operations, and raises the first error in operation order."""
+        results = await asyncio.gather(*operations, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     def __get_partition_key(self, key: str) -> str:
         return None if self.compatability_mode_partition_key else key
 
-    @staticmethod
-    def __create_si(result) -> object:
+    def __create_si(self, result) -> object:
         """Create an object from a result out of CosmosDB.
 
         :param result:
@@ -314,13 +365,12 @@ class CosmosDbPartitionedStorage(Storage):
         if result.get("_etag"):
             doc["e_tag"] = result["_etag"]
 
-        result_obj = Unpickler().restore(doc)
+        result_obj = self.__serializer.from_dict(doc)
 
         # create and return the object
         return result_obj
 
-    @staticmethod
-    def __create_dict(store_item: object) -> Dict:
+    def __create_dict(self, store_item: object) -> Dict:
         """Return the dict of an object.
 
         This eliminates non_magic attributes and the e_tag.
@@ -329,7 +379,7 @@ class CosmosDbPartitionedStorage(Storage):
         :return dict:
         """
         # read the content
-        json_dict = Pickler().flatten(store_item)
+        json_dict = self.__serializer.to_dict(store_item)
         if "e_tag" in json_dict:
             del json_dict["e_tag"]
 
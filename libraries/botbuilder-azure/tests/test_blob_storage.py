@@ -1,8 +1,16 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceModifiedError,
+    ResourceNotFoundError,
+)
 from azure.storage.blob.aio import BlobServiceClient
 from botbuilder.core import StoreItem
 from botbuilder.azure import BlobStorage, BlobStorageSettings
@@ -244,3 +252,189 @@ class TestBlobStorage:
         await storage.delete(["foo", "bar"])
         data = await storage.read(["test"])
         assert len(data.keys()) == 1
+
+    @pytest.mark.skipif(not EMULATOR_RUNNING, reason="Needs the emulator to run.")
+    @pytest.mark.asyncio
+    async def test_blob_storage_should_read_write_and_delete_more_keys_than_a_batch(
+        self,
+    ):
+        storage = BlobStorage(BLOB_STORAGE_SETTINGS)
+        keys = [f"test{index}" for index in range(300)]
+        await storage.write({key: SimpleStoreItem() for key in keys})
+
+        data = await storage.read(keys + ["foo"])
+        assert list(data.keys()) == keys
+
+        await storage.delete(keys + ["foo"])
+        data = await storage.read(keys)
+        assert not data.keys()
+
+
+class MockContainerClient:
+    """An in-memory stand-in for the container client, which counts the blob operations in flight."""
+
+    def __init__(self, batch_supported: bool = True):
+        self.blobs = {}
+        self.batch_supported = batch_supported
+        self.batch_calls = 0
+        self.blob_deletes = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._e_tag = 0
+
+    async def create_container(self):
+        pass
+
+    def get_blob_client(self, name: str):
+        return MockBlobClient(self, name)
+
+    async def delete_blobs(self, *names, raise_on_any_failure=True):
+        self.batch_calls += 1
+        if not self.batch_supported:
+            raise HttpResponseError(message="Blob batch isn't supported.")
+
+        async def responses():
+            for name in names:
+                status_code = 202 if self.blobs.pop(name, None) else 404
+                yield SimpleNamespace(status_code=status_code)
+
+        return responses()
+
+    async def run(self, operation):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return operation()
+        finally:
+            self.in_flight -= 1
+
+
+class MockBlobClient:
+    def __init__(self, container: MockContainerClient, name: str):
+        self.container = container
+        self.name = name
+
+    async def download_blob(self):
+        def download():
+            if self.name not in self.container.blobs:
+                error = ResourceNotFoundError(message="The blob doesn't exist.")
+                error.status_code = 404
+                raise error
+            content, e_tag = self.container.blobs[self.name]
+
+            async def readall():
+                return content
+
+            return SimpleNamespace(
+                readall=readall, properties=SimpleNamespace(etag=f'"{e_tag}"')
+            )
+
+        return await self.container.run(download)
+
+    async def upload_blob(self, data, overwrite=False, match_condition=None, etag=None):
+        def upload():
+            if etag is not None and self.container.blobs[self.name][1] != etag:
+                raise ResourceModifiedError(message="The e_tag doesn't match.")
+            self.container._e_tag += 1  # pylint: disable=protected-access
+            self.container.blobs[self.name] = (data, str(self.container._e_tag))
+
+        return await self.container.run(upload)
+
+    async def delete_blob(self):
+        def delete():
+            self.container.blob_deletes += 1
+            if self.container.blobs.pop(self.name, None) is None:
+                raise ResourceNotFoundError(message="The blob doesn't exist.")
+
+        return await self.container.run(delete)
+
+
+def get_mocked_storage(container: MockContainerClient, max_concurrency: int = 4):
+    settings = BlobStorageSettings(
+        container_name="test",
+        connection_string=BLOB_STORAGE_SETTINGS.connection_string,
+        max_concurrency=max_concurrency,
+    )
+    with patch("botbuilder.azure.blob_storage.BlobServiceClient") as service_client:
+        service_client.from_connection_string.return_value.get_container_client.return_value = (
+            container
+        )
+        return BlobStorage(settings)
+
+
+class TestBlobStorageWithMockedClient:
+    @pytest.mark.asyncio
+    async def test_blob_storage_should_read_and_write_concurrently(self):
+        container = MockContainerClient()
+        storage = get_mocked_storage(container)
+        keys = [f"test{index}" for index in range(10)]
+
+        await storage.write(
+            {key: SimpleStoreItem(counter=index) for index, key in enumerate(keys)}
+        )
+        assert container.max_in_flight == 4
+
+        container.max_in_flight = 0
+        data = await storage.read(list(reversed(keys)) + ["foo"])
+        assert container.max_in_flight == 4
+        assert list(data.keys()) == list(reversed(keys))
+        assert [data[key].counter for key in keys] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_blob_storage_should_raise_the_first_failed_write(self):
+        container = MockContainerClient()
+        storage = get_mocked_storage(container)
+        await storage.write({"a": {"counter": 1}, "b": {"counter": 1}})
+        data = await storage.read(["a", "b"])
+        data["a"]["e_tag"] = "stale"
+        data["b"]["counter"] = 2
+
+        with pytest.raises(ResourceModifiedError):
+            await storage.write(data)
+
+        # the other writes still complete
+        assert (await storage.read(["b"]))["b"]["counter"] == 2
+
+    @pytest.mark.asyncio
+    async def test_blob_storage_should_delete_a_single_key_without_a_batch(self):
+        container = MockContainerClient()
+        storage = get_mocked_storage(container)
+        await storage.write({"a": SimpleStoreItem()})
+
+        await storage.delete(["a"])
+        await storage.delete(["a"])
+
+        assert not container.blobs
+        assert container.batch_calls == 0
+        assert container.blob_deletes == 2
+
+    @pytest.mark.asyncio
+    async def test_blob_storage_should_delete_keys_in_batches(self):
+        container = MockContainerClient()
+        storage = get_mocked_storage(container)
+        keys = [f"test{index}" for index in range(300)]
+        await storage.write({key: SimpleStoreItem() for key in keys})
+
+        await storage.delete(keys + ["foo"])
+
+        assert not container.blobs
+        assert container.batch_calls == 2
+        assert container.blob_deletes == 0
+
+    @pytest.mark.asyncio
+    async def test_blob_storage_should_delete_blobs_one_by_one_when_batches_are_rejected(
+        self,
+    ):
+        container = MockContainerClient(batch_supported=False)
+        storage = get_mocked_storage(container)
+        await storage.write({key: SimpleStoreItem() for key in ["a", "b", "c"]})
+
+        await storage.delete(["a", "b", "foo"])
+        assert list(container.blobs.keys()) == ["c"]
+        assert container.batch_calls == 1
+        assert container.blob_deletes == 3
+
+        await storage.delete(["c", "foo"])
+        assert not container.blobs
+        assert container.batch_calls == 1
@@ -27,7 +27,7 @@ async def reset():
     storage = CosmosDbPartitionedStorage(get_settings())
     await storage.initialize()
     try:
-        storage.client.delete_database(get_settings().database_id)
+        await storage.client.delete_database(get_settings().database_id)
     except cosmos_exceptions.HttpResponseError:
         pass
 
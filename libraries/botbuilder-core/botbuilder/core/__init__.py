@@ -16,8 +16,10 @@ from .bot_assert import BotAssert
 from .bot_adapter import BotAdapter
 from .bot_framework_adapter import BotFrameworkAdapter, BotFrameworkAdapterSettings
 from .bot_state import BotState
-from .bot_state_set import BotStateSet
+from .bot_state_set import BotStateSet, BotStateSetError
 from .bot_telemetry_client import BotTelemetryClient, Severity
+from .buffered_transcript_logger import BufferedTranscriptLogger
+from .caching_storage import CachingStorage
 from .card_factory import CardFactory
 from .channel_service_handler import BotActionNotImplementedError, ChannelServiceHandler
 from .cloud_adapter_base import CloudAdapterBase
@@ -37,9 +39,16 @@ from .queue_storage import QueueStorage
 from .recognizer import Recognizer
 from .recognizer_result import RecognizerResult, TopIntent
 from .show_typing_middleware import ShowTypingMiddleware
+from .sqlite_storage import SqliteStorage
+from .sqlite_transcript_store import SqliteTranscriptStore
 from .state_property_accessor import StatePropertyAccessor
 from .state_property_info import StatePropertyInfo
 from .storage import Storage, StoreItem, calculate_change_hash
+from .store_item_serializer import (
+    FastStoreItemSerializer,
+    JsonPickleStoreItemSerializer,
+    StoreItemSerializer,
+)
 from .telemetry_constants import TelemetryConstants
 from .telemetry_logger_constants import TelemetryLoggerConstants
 from .telemetry_logger_middleware import TelemetryLoggerMiddleware
@@ -62,7 +71,10 @@ __all__ = [
     "BotFrameworkAdapterSettings",
     "BotState",
     "BotStateSet",
+    "BotStateSetError",
     "BotTelemetryClient",
+    "BufferedTranscriptLogger",
+    "CachingStorage",
     "calculate_change_hash",
     "CardFactory",
     "ChannelServiceHandler",
@@ -70,9 +82,11 @@ __all__ = [
     "CloudChannelServiceHandler",
     "ComponentRegistration",
     "ConversationState",
+    "FastStoreItemSerializer",
     "conversation_reference_extension",
     "ExtendedUserTokenProvider",
     "IntentScore",
+    "JsonPickleStoreItemSerializer",
     "InvokeResponse",
     "MemoryStorage",
     "MemoryTranscriptStore",
@@ -87,10 +101,13 @@ __all__ = [
     "RecognizerResult",
     "Severity",
     "ShowTypingMiddleware",
+    "SqliteStorage",
+    "SqliteTranscriptStore",
     "StatePropertyAccessor",
     "StatePropertyInfo",
     "Storage",
     "StoreItem",
+    "StoreItemSerializer",
     "TelemetryConstants",
     "TelemetryLoggerConstants",
     "TelemetryLoggerMiddleware",
@@ -0,0 +1,104 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import sqlite3
+from asyncio import get_event_loop
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+
+# SQLite limits the variables of a statement, 999 before version 3.32
+MAX_VARIABLES = 500
+
+
+class _SqliteDatabase:
+    """
+    A SQLite database, accessed from a thread of its own so that queries don't block the event loop.
+
+    :param path: The path of the database file, created if needed
+    :param schema: The statements that create the tables and indexes if they don't exist
+    :param timeout: The seconds a statement waits for the lock held by another connection, for example
+    of another process
+
+    .. remarks::
+        The database is opened in WAL mode, in which readers don't wait for the writer, so that several
+        processes can share it.
+    """
+
+    def __init__(self, path: str, schema: List[str], timeout: float = 30.0):
+        if not path:
+            raise TypeError("_SqliteDatabase: path can't be None")
+
+        self.path = path
+        self._schema = schema
+        self._timeout = timeout
+        self._connection: sqlite3.Connection = None
+        # a single thread runs every statement of the connection, in order
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Runs an operation with the connection, on the thread of the database.
+        """
+        return await get_event_loop().run_in_executor(
+            self._executor, self._run, operation
+        )
+
+    async def run_in_transaction(
+        self, operation: Callable[[sqlite3.Connection], T]
+    ) -> T:
+        """
+        Runs an operation in a write transaction, which is rolled back if the operation raises.
+        """
+
+        def run_in_transaction(connection: sqlite3.Connection) -> T:
+            # the write lock is taken at once, rather than when a read turns into a write
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+        return await self.run(run_in_transaction)
+
+    async def close(self):
+        """
+        Closes the connection. The database is opened again by the next operation.
+        """
+
+        def close(connection: sqlite3.Connection):
+            connection.close()
+            self._connection = None
+
+        if self._connection is not None:
+            await self.run(close)
+
+    def _run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        if self._connection is None:
+            self._connection = self._connect()
+        return operation(self._connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        # the transactions are begun explicitly by run_in_transaction
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self._timeout,
+            isolation_level=None,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in self._schema:
+                connection.execute(statement)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+
+def parameters(count: int) -> str:
+    return ", ".join("?" * count)
@@ -10,13 +10,28 @@ from .turn_context import TurnContext
 
 
 class AutoSaveStateMiddleware(Middleware):
-    def __init__(self, bot_states: Union[List[BotState], BotStateSet] = None):
+    def __init__(
+        self,
+        bot_states: Union[List[BotState], BotStateSet] = None,
+        batch_by_storage: bool = False,
+    ):
+        """
+        Initializes a new instance of the :class:`AutoSaveStateMiddleware` class.
+
+        :param bot_states: The states to save at the end of each turn
+        :type bot_states: Union[List[:class:`BotState`], :class:`BotStateSet`]
+        :param batch_by_storage: Optional, true to save states sharing a :class:`Storage` with a single
+        write call. Ignored when a :class:`BotStateSet` is passed in.
+        :type batch_by_storage: bool
+        """
         if bot_states is None:
             bot_states = []
         if isinstance(bot_states, BotStateSet):
             self.bot_state_set: BotStateSet = bot_states
         else:
-            self.bot_state_set: BotStateSet = BotStateSet(bot_states)
+            self.bot_state_set: BotStateSet = BotStateSet(
+                bot_states, batch_by_storage=batch_by_storage
+            )
 
     def add(self, bot_state: BotState) -> "AutoSaveStateMiddleware":
         if bot_state is None:
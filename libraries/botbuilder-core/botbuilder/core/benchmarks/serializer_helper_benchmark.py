@@ -0,0 +1,114 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""
+Compares :mod:`botbuilder.core.serializer_helper` with building new msrest serializers on every call.
+
+Run with ``python -m botbuilder.core.benchmarks.serializer_helper_benchmark [--number N]``.
+"""
+
+import argparse
+import timeit
+from copy import copy
+from typing import Callable, Dict
+
+from msrest.serialization import Deserializer, Serializer
+
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    Attachment,
+    ChannelAccount,
+    ConversationAccount,
+)
+
+from ..serializer_helper import (
+    DEPENDICIES_DICT,
+    deserializer_helper,
+    serializer_helper,
+)
+
+
+def create_activity() -> Activity:
+    return Activity(
+        type=ActivityTypes.message,
+        id="activity-id",
+        channel_id="msteams",
+        service_url="https://smba.trafficmanager.net/amer/",
+        from_property=ChannelAccount(id="user-id", name="User"),
+        recipient=ChannelAccount(id="bot-id", name="Bot"),
+        conversation=ConversationAccount(id="conversation-id"),
+        text="Hello, this is a benchmark message",
+        attachments=[
+            Attachment(
+                content_type="application/vnd.microsoft.card.hero",
+                content={"title": "Card", "buttons": [{"type": "imBack"}]},
+            )
+        ],
+        channel_data={"tenant": {"id": "tenant-id"}},
+    )
+
+
+def _uncached_serialize(activity: Activity) -> dict:
+    # pylint: disable=protected-access
+    return Serializer(DEPENDICIES_DICT)._serialize(activity)
+
+
+def _uncached_deserialize(data: dict) -> Activity:
+    # pylint: disable=protected-access
+    deserializer = Deserializer(DEPENDICIES_DICT)
+    msrest_cls = deserializer.dependencies[Activity.__name__]
+    serialization_model = copy(msrest_cls._attribute_map)
+    for key, value in msrest_cls._attribute_map.items():
+        if key != value["key"]:
+            serialization_model[value["key"]] = value
+    for prop, prop_value in data.items():
+        if (
+            prop in serialization_model
+            and serialization_model[prop]["type"] in DEPENDICIES_DICT
+            and not prop_value
+        ):
+            data[prop] = None
+    return deserializer(Activity.__name__, data)
+
+
+def run(number: int = 10000) -> Dict[str, float]:
+    """
+    Runs the benchmark.
+
+    :param number: The number of calls timed per case
+    :type number: int
+    :return: The average microseconds per call of each case
+    """
+    activity = create_activity()
+    data = serializer_helper(activity)
+
+    cases: Dict[str, Callable[[], object]] = {
+        "serialize (new Serializer per call)": lambda: _uncached_serialize(activity),
+        "serialize (serializer_helper)": lambda: serializer_helper(activity),
+        "deserialize (new Deserializer per call)": lambda: _uncached_deserialize(
+            dict(data)
+        ),
+        "deserialize (deserializer_helper)": lambda: deserializer_helper(
+            Activity, dict(data)
+        ),
+    }
+
+    results = {}
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=number, repeat=3))
+        results[name] = seconds / number * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    for name, microseconds in run(args.number).items():
+        print(f"{name:<45} {microseconds:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""
+Load tests :class:`StreamingRequestHandler` over an in-process web socket pair, with the scenarios
+of :mod:`botframework.streaming.benchmarks.connection_benchmark`.
+
+Run with ``python -m botbuilder.core.benchmarks.streaming_request_handler_benchmark [--number N] [--output FILE]``.
+The results are written as JSON.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+from botbuilder.schema import Activity, ConversationReference, ResourceResponse
+from botframework.streaming import PayloadStream
+from botframework.streaming.benchmarks.connection_benchmark import (
+    create_argument_parser,
+    run_async,
+    run_in_new_loop,
+    write_results,
+)
+from botframework.streaming.transport.web_socket import WebSocket
+
+from ..bot import Bot
+from ..bot_adapter import BotAdapter
+from ..invoke_response import InvokeResponse
+from ..streaming import StreamingActivityProcessor, StreamingRequestHandler
+from ..turn_context import TurnContext
+
+
+class _BenchmarkBot(Bot):
+    async def on_turn(self, context: TurnContext):
+        # the attachment streams are read as the channel sends them
+        for attachment in context.activity.attachments or []:
+            if isinstance(attachment.content, PayloadStream):
+                async for _ in attachment.content:
+                    pass
+
+
+class _BenchmarkAdapter(BotAdapter, StreamingActivityProcessor):
+    async def process_streaming_activity(
+        self,
+        activity: Activity,
+        bot_callback_handler: Callable[[TurnContext], Awaitable],
+    ) -> InvokeResponse:
+        await self.run_pipeline(TurnContext(self, activity), bot_callback_handler)
+        return None
+
+    async def send_activities(
+        self, context: TurnContext, activities: List[Activity]
+    ) -> List[ResourceResponse]:
+        return [ResourceResponse(id="") for _ in activities]
+
+    async def update_activity(self, context: TurnContext, activity: Activity):
+        return ResourceResponse(id=activity.id)
+
+    async def delete_activity(
+        self, context: TurnContext, reference: ConversationReference
+    ):
+        pass
+
+
+def run(
+    number: int = 1000, coalesce_frames: bool = True
+) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark.
+
+    :param number: The number of requests the shares of the scenarios are taken from
+    :type number: int
+    :return: The measures of each scenario
+    """
+
+    async def serve(web_socket: WebSocket):
+        handler = StreamingRequestHandler(
+            _BenchmarkBot(), _BenchmarkAdapter(), web_socket
+        )
+        asyncio.ensure_future(handler.listen())
+
+    return run_in_new_loop(run_async(number, serve, coalesce_frames))
+
+
+def main():
+    args = create_argument_parser(__doc__).parse_args()
+
+    write_results(run(args.number, args.coalesce_frames), args.output)
+
+
+if __name__ == "__main__":
+    main()
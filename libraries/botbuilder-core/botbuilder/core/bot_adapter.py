@@ -2,7 +2,8 @@
 # Licensed under the MIT License.
 
 from abc import ABC, abstractmethod
-from typing import List, Callable, Awaitable
+from asyncio import ensure_future, gather
+from typing import List, Callable, Awaitable, FrozenSet
 from botbuilder.schema import (
     Activity,
     ConversationReference,
@@ -24,6 +25,10 @@ class BotAdapter(ABC):
     BOT_CALLBACK_HANDLER_KEY = "BotCallbackHandler"
     _INVOKE_RESPONSE_KEY = "BotFrameworkAdapter.InvokeResponse"
 
+    # The types of the activities that send_activities can deliver without waiting for the activities before them,
+    # for example {ActivityTypes.typing, ActivityTypes.trace}. Other activities are delivered in order.
+    parallel_activity_types: FrozenSet[str] = frozenset()
+
     def __init__(
         self, on_turn_error: Callable[[TurnContext, Exception], Awaitable] = None
     ):
@@ -45,6 +50,47 @@ class BotAdapter(ABC):
         """
         raise NotImplementedError()
 
+    async def _send_activities_in_order(
+        self,
+        activities: List[Activity],
+        send_activity: Callable[[Activity], Awaitable[ResourceResponse]],
+    ) -> List[ResourceResponse]:
+        """
+        Sends activities one after the other, except the ones of `parallel_activity_types`.
+
+        :param activities: The activities to send.
+        :type activities: :class:`typing.List[Activity]`
+        :param send_activity: Sends a single activity.
+        :return: The responses, in the order of the activities.
+
+        .. remarks::
+            An activity of `parallel_activity_types` starts when its turn comes, and is delivered alongside the
+            activities after it, which don't wait for its response.
+        """
+        responses: List[ResourceResponse] = [None] * len(activities)
+        parallel_sends = []
+
+        try:
+            for index, activity in enumerate(activities):
+                if activity.type in self.parallel_activity_types:
+                    parallel_sends.append(
+                        (index, ensure_future(send_activity(activity)))
+                    )
+                else:
+                    responses[index] = await send_activity(activity)
+        finally:
+            # the parallel sends complete even when an ordered send fails
+            results = await gather(
+                *[send for _, send in parallel_sends], return_exceptions=True
+            )
+
+        for (index, _), result in zip(parallel_sends, results):
+            if isinstance(result, BaseException):
+                raise result
+            responses[index] = result
+
+        return responses
+
     @abstractmethod
     async def update_activity(self, context: TurnContext, activity: Activity):
         """
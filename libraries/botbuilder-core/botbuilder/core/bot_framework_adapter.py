@@ -676,57 +676,61 @@ class BotFrameworkAdapter(
         self, context: TurnContext, activities: List[Activity]
     ) -> List[ResourceResponse]:
         try:
-            responses: List[ResourceResponse] = []
-            for activity in activities:
-                response: ResourceResponse = None
-                if activity.type == "delay":
-                    try:
-                        delay_in_ms = float(activity.value) / 1000
-                    except TypeError:
-                        raise TypeError(
-                            "Unexpected delay value passed. Expected number or str type."
-                        )
-                    except AttributeError:
-                        raise Exception("activity.value was not found.")
-                    else:
-                        await asyncio.sleep(delay_in_ms)
-                elif activity.type == "invokeResponse":
-                    context.turn_state[self._INVOKE_RESPONSE_KEY] = activity
-                else:
-                    if not getattr(activity, "service_url", None):
-                        raise TypeError(
-                            "BotFrameworkAdapter.send_activity(): service_url can not be None."
-                        )
-                    if (
-                        not hasattr(activity, "conversation")
-                        or not activity.conversation
-                        or not getattr(activity.conversation, "id", None)
-                    ):
-                        raise TypeError(
-                            "BotFrameworkAdapter.send_activity(): conversation.id can not be None."
-                        )
-
-                    if activity.type == "trace" and activity.channel_id != "emulator":
-                        pass
-                    elif activity.reply_to_id:
-                        client = context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY]
-                        response = await client.conversations.reply_to_activity(
-                            activity.conversation.id, activity.reply_to_id, activity
-                        )
-                    else:
-                        client = context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY]
-                        response = await client.conversations.send_to_conversation(
-                            activity.conversation.id, activity
-                        )
-
-                if not response:
-                    response = ResourceResponse(id=activity.id or "")
-
-                responses.append(response)
-            return responses
+            return await self._send_activities_in_order(
+                activities, lambda activity: self._send_activity(context, activity)
+            )
         except Exception as error:
             raise error
 
+    async def _send_activity(
+        self, context: TurnContext, activity: Activity
+    ) -> ResourceResponse:
+        response: ResourceResponse = None
+        if activity.type == "delay":
+            try:
+                delay_in_ms = float(activity.value) / 1000
+            except TypeError:
+                raise TypeError(
+                    "Unexpected delay value passed. Expected number or str type."
+                )
+            except AttributeError:
+                raise Exception("activity.value was not found.")
+            else:
+                await asyncio.sleep(delay_in_ms)
+        elif activity.type == "invokeResponse":
+            context.turn_state[self._INVOKE_RESPONSE_KEY] = activity
+        else:
+            if not getattr(activity, "service_url", None):
+                raise TypeError(
+                    "BotFrameworkAdapter.send_activity(): service_url can not be None."
+                )
+            if (
+                not hasattr(activity, "conversation")
+                or not activity.conversation
+                or not getattr(activity.conversation, "id", None)
+            ):
+                raise TypeError(
+                    "BotFrameworkAdapter.send_activity(): conversation.id can not be None."
+                )
+
+            if activity.type == "trace" and activity.channel_id != "emulator":
+                pass
+            elif activity.reply_to_id:
+                client = context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY]
+                response = await client.conversations.reply_to_activity(
+                    activity.conversation.id, activity.reply_to_id, activity
+                )
+            else:
+                client = context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY]
+                response = await client.conversations.send_to_conversation(
+                    activity.conversation.id, activity
+                )
+
+        if not response:
+            response = ResourceResponse(id=activity.id or "")
+
+        return response
+
     async def delete_conversation_member(
         self, context: TurnContext, member_id: str
     ) -> None:
@@ -3,7 +3,7 @@
 
 from abc import abstractmethod
 from copy import deepcopy
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, Set, Union
 from jsonpickle.pickler import Pickler
 from botbuilder.core.state_property_accessor import StatePropertyAccessor
 from .bot_assert import BotAssert
@@ -15,15 +15,124 @@ from .property_manager import PropertyManager
 class CachedBotState:
     """
     Internal cached bot state.
+
+    .. remarks::
+        When change tracking is enabled, writes made through :meth:`set_value` and :meth:`delete_value`
+        are recorded per property, and only properties handed out by :meth:`get_value` (which may be
+        mutated in place) are hashed. The whole state is hashed only when the raw :attr:`state` dictionary
+        is accessed directly, or when change tracking is disabled.
     """
 
-    def __init__(self, state: Dict[str, object] = None):
-        self.state = state if state is not None else {}
-        self.hash = self.compute_hash(state)
+    _IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+    def __init__(self, state: Dict[str, object] = None, track_changes: bool = False):
+        self._state = state if state is not None else {}
+        self._track_changes = track_changes
+        self._changed_properties: Set[str] = set()
+        self._property_hashes: Dict[str, str] = {}
+        self._force_changed = False
+        self.hash = None if track_changes else self.compute_hash(self._state)
+
+    @property
+    def state(self) -> Dict[str, object]:
+        # The raw dictionary can be mutated arbitrarily by the caller, so from here on the
+        # whole state needs to be compared against a snapshot taken before handing it out.
+        if self._track_changes and self.hash is None:
+            self.hash = self.compute_hash(self._state)
+        return self._state
+
+    @state.setter
+    def state(self, value: Dict[str, object]):
+        self._state = value if value is not None else {}
+        self._force_changed = True
+
+    @property
+    def stored_state(self) -> Dict[str, object]:
+        """
+        The state dictionary to write to storage. Unlike :attr:`state`, this does not opt into
+        hashing the whole state.
+        """
+        return self._state
+
+    @property
+    def changed_properties(self) -> Set[str]:
+        """
+        The names of the properties known to have been set or deleted since the last save.
+        """
+        return set(self._changed_properties)
 
     @property
     def is_changed(self) -> bool:
-        return self.hash != self.compute_hash(self.state)
+        if self._force_changed:
+            return True
+
+        if not self._track_changes:
+            return self.hash != self.compute_hash(self._state)
+
+        if self._changed_properties:
+            return True
+
+        for name, value_hash in self._property_hashes.items():
+            if name not in self._state:
+                return True
+            if value_hash != self.compute_hash(self._state[name]):
+                return True
+
+        return self.hash is not None and self.hash != self.compute_hash(self._state)
+
+    def get_value(self, name: str) -> object:
+        # raises KeyError if the property is not present
+        value = self._state[name]
+        if (
+            self._track_changes
+            and name not in self._property_hashes
+            and name not in self._changed_properties
+            and not isinstance(value, self._IMMUTABLE_TYPES)
+        ):
+            self._property_hashes[name] = self.compute_hash(value)
+        return value
+
+    def set_value(self, name: str, value: object):
+        if (
+            name in self._state
+            and isinstance(value, self._IMMUTABLE_TYPES)
+            and type(self._state[name]) is type(value)
+            and self._state[name] == value
+        ):
+            return
+        self._state[name] = value
+        self._changed_properties.add(name)
+
+    def delete_value(self, name: str):
+        del self._state[name]
+        self._changed_properties.add(name)
+
+    def mark_changed(self):
+        """
+        Flags the state as changed, so the next save writes it regardless of its content.
+        """
+        self._force_changed = True
+
+    def mark_saved(self):
+        """
+        Resets change tracking after the state has been written to storage.
+        """
+        self._force_changed = False
+
+        if not self._track_changes:
+            self.hash = self.compute_hash(self._state)
+            return
+
+        tracked = self._changed_properties.union(self._property_hashes)
+        self._changed_properties = set()
+        self._property_hashes = {
+            name: self.compute_hash(self._state[name])
+            for name in tracked
+            if name in self._state
+            and not isinstance(self._state[name], self._IMMUTABLE_TYPES)
+        }
+        if self.hash is not None:
+            self.hash = self.compute_hash(self._state)
 
     def compute_hash(self, obj: object) -> str:
         return str(Pickler().flatten(obj))
@@ -41,7 +150,9 @@ class BotState(PropertyManager):
         You can define additional scopes for your bot.
     """
 
-    def __init__(self, storage: Storage, context_service_key: str):
+    def __init__(
+        self, storage: Storage, context_service_key: str, track_changes: bool = True
+    ):
         """
         Initializes a new instance of the :class:`BotState` class.
 
@@ -49,6 +160,9 @@ class BotState(PropertyManager):
         :type storage:  :class:`bptbuilder.core.Storage`
         :param context_service_key: The key for the state cache for this :class:`BotState`
         :type context_service_key: str
+        :param track_changes: Optional, true (the default) to track changes per property; false to detect
+        changes by hashing the whole state on load and save
+        :type track_changes: bool
 
         .. remarks::
             This constructor creates a state management object and associated scope. The object uses
@@ -60,6 +174,7 @@ class BotState(PropertyManager):
         self.state_key = "state"
         self._storage = storage
         self._context_service_key = context_service_key
+        self.track_changes = track_changes
 
     def get_cached_state(self, turn_context: TurnContext):
         """
@@ -103,13 +218,11 @@ class BotState(PropertyManager):
         """
         BotAssert.context_not_none(turn_context)
 
-        cached_state = self.get_cached_state(turn_context)
         storage_key = self.get_storage_key(turn_context)
 
-        if force or not cached_state or not cached_state.state:
+        if self.needs_load(turn_context, force):
             items = await self._storage.read([storage_key])
-            val = items.get(storage_key)
-            turn_context.turn_state[self._context_service_key] = CachedBotState(val)
+            self.set_loaded_state(turn_context, items.get(storage_key))
 
     async def save_changes(
         self, turn_context: TurnContext, force: bool = False
@@ -125,13 +238,75 @@ class BotState(PropertyManager):
         """
         BotAssert.context_not_none(turn_context)
 
-        cached_state = self.get_cached_state(turn_context)
+        changes = self.get_pending_changes(turn_context, force)
 
-        if force or (cached_state is not None and cached_state.is_changed):
-            storage_key = self.get_storage_key(turn_context)
-            changes: Dict[str, object] = {storage_key: cached_state.state}
+        if changes:
             await self._storage.write(changes)
-            cached_state.hash = cached_state.compute_hash(cached_state.state)
+            self.mark_changes_saved(turn_context)
+
+    @property
+    def storage(self) -> Storage:
+        """
+        The storage layer this state management object reads from and writes to.
+        """
+        return self._storage
+
+    def needs_load(self, turn_context: TurnContext, force: bool = False) -> bool:
+        """
+        Indicates whether the state for this turn has to be read from storage.
+
+        :param turn_context: The context object for this turn
+        :type turn_context: :class:`TurnContext`
+        :param force: Optional, true to bypass the cache
+        :type force: bool
+        :return: True if the state is not cached in the turn context yet, or force is set
+        """
+        cached_state = self.get_cached_state(turn_context)
+        return force or not cached_state or not cached_state.stored_state
+
+    def set_loaded_state(self, turn_context: TurnContext, value: Dict[str, object]):
+        """
+        Caches state read from storage in the context object for this turn.
+
+        :param turn_context: The context object for this turn
+        :type turn_context: :class:`TurnContext`
+        :param value: The state read from storage, or None if there was no stored state
+        :type value: Dict[str, object]
+        """
+        turn_context.turn_state[self._context_service_key] = CachedBotState(
+            value, self.track_changes
+        )
+
+    def get_pending_changes(
+        self, turn_context: TurnContext, force: bool = False
+    ) -> Dict[str, object]:
+        """
+        Gets the store items that have to be written to storage to save the state for this turn.
+
+        :param turn_context: The context object for this turn
+        :type turn_context: :class:`TurnContext`
+        :param force: Optional, true to save state to storage whether or not there are changes
+        :type force: bool
+        :return: The changes keyed by storage key, or an empty dictionary if there is nothing to save
+        """
+        cached_state = self.get_cached_state(turn_context)
+
+        if cached_state is None or not (force or cached_state.is_changed):
+            return {}
+
+        storage_key = self.get_storage_key(turn_context)
+        return {storage_key: cached_state.stored_state}
+
+    def mark_changes_saved(self, turn_context: TurnContext):
+        """
+        Resets change tracking once the changes from :meth:`get_pending_changes` have been written.
+
+        :param turn_context: The context object for this turn
+        :type turn_context: :class:`TurnContext`
+        """
+        cached_state = self.get_cached_state(turn_context)
+        if cached_state is not None:
+            cached_state.mark_saved()
 
     async def clear_state(self, turn_context: TurnContext):
         """
@@ -147,9 +322,9 @@ class BotState(PropertyManager):
         """
         BotAssert.context_not_none(turn_context)
 
-        #  Explicitly setting the hash will mean IsChanged is always true. And that will force a Save.
-        cache_value = CachedBotState()
-        cache_value.hash = ""
+        #  Explicitly marking the state as changed will mean IsChanged is always true. And that will force a Save.
+        cache_value = CachedBotState(track_changes=self.track_changes)
+        cache_value.mark_changed()
         turn_context.turn_state[self._context_service_key] = cache_value
 
     async def delete(self, turn_context: TurnContext) -> None:
@@ -192,7 +367,7 @@ class BotState(PropertyManager):
 
         # if there is no value, this will throw, to signal to IPropertyAccesor that a default value should be computed
         # This allows this to work with value types
-        return cached_state.state[property_name]
+        return cached_state.get_value(property_name)
 
     async def delete_property_value(
         self, turn_context: TurnContext, property_name: str
@@ -211,7 +386,7 @@ class BotState(PropertyManager):
         if not property_name:
             raise TypeError("BotState.delete_property(): property_name cannot be None.")
         cached_state = self.get_cached_state(turn_context)
-        del cached_state.state[property_name]
+        cached_state.delete_value(property_name)
 
     async def set_property_value(
         self, turn_context: TurnContext, property_name: str, value: object
@@ -232,7 +407,7 @@ class BotState(PropertyManager):
         if not property_name:
             raise TypeError("BotState.delete_property(): property_name cannot be None.")
         cached_state = self.get_cached_state(turn_context)
-        cached_state.state[property_name] = value
+        cached_state.set_value(property_name, value)
 
 
 class BotStatePropertyAccessor(StatePropertyAccessor):
@@ -1,14 +1,52 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List
+import asyncio
+from typing import Awaitable, Dict, List, Tuple
 from .bot_state import BotState
+from .storage import Storage
 from .turn_context import TurnContext
 
 
+class BotStateSetError(Exception):
+    """Raised when more than one state in a :class:`BotStateSet` fails to load or save"""
+
+    def __init__(self, errors: List[BaseException]):
+        super().__init__(
+            f"{len(errors)} bot states failed: "
+            + "; ".join(repr(error) for error in errors)
+        )
+        self.errors = errors
+
+
 class BotStateSet:
-    def __init__(self, bot_states: List[BotState]):
+    def __init__(
+        self,
+        bot_states: List[BotState],
+        concurrent: bool = False,
+        batch_by_storage: bool = False,
+    ):
+        """
+        Initializes a new instance of the :class:`BotStateSet` class.
+
+        :param bot_states: The states to load and save together
+        :type bot_states: List[:class:`BotState`]
+        :param concurrent: Optional, true to load and save all states concurrently instead of one after another
+        :type concurrent: bool
+        :param batch_by_storage: Optional, true to load and save states sharing a :class:`Storage` with
+        a single read or write call. Implies concurrent calls across storages.
+        :type batch_by_storage: bool
+
+        .. remarks::
+            In concurrent and batched modes every state is attempted, even if another one fails.
+            A single failure is raised as is, several failures are raised as a :class:`BotStateSetError`.
+            Batched mode bypasses :meth:`BotState.load` and :meth:`BotState.save_changes`, so states
+            overriding those methods should not be batched. States sharing a storage key are written
+            with separate calls, one after another, so that none of their changes are lost.
+        """
         self.bot_states = list(bot_states)
+        self.concurrent = concurrent
+        self.batch_by_storage = batch_by_storage
 
     def add(self, bot_state: BotState) -> "BotStateSet":
         if bot_state is None:
@@ -18,9 +56,99 @@ class BotStateSet:
         return self
 
     async def load_all(self, turn_context: TurnContext, force: bool = False):
-        for bot_state in self.bot_states:
-            await bot_state.load(turn_context, force)
+        if self.batch_by_storage:
+            await self._load_batched(turn_context, force)
+        elif self.concurrent:
+            await self._gather(
+                [bot_state.load(turn_context, force) for bot_state in self.bot_states]
+            )
+        else:
+            for bot_state in self.bot_states:
+                await bot_state.load(turn_context, force)
 
     async def save_all_changes(self, turn_context: TurnContext, force: bool = False):
+        if self.batch_by_storage:
+            await self._save_batched(turn_context, force)
+        elif self.concurrent:
+            await self._gather(
+                [
+                    bot_state.save_changes(turn_context, force)
+                    for bot_state in self.bot_states
+                ]
+            )
+        else:
+            for bot_state in self.bot_states:
+                await bot_state.save_changes(turn_context, force)
+
+    async def _load_batched(self, turn_context: TurnContext, force: bool):
+        groups: Dict[int, Tuple[Storage, Dict[str, List[BotState]]]] = {}
         for bot_state in self.bot_states:
-            await bot_state.save_changes(turn_context, force)
+            storage_key = bot_state.get_storage_key(turn_context)
+            if bot_state.needs_load(turn_context, force):
+                _, keys = groups.setdefault(
+                    id(bot_state.storage), (bot_state.storage, {})
+                )
+                keys.setdefault(storage_key, []).append(bot_state)
+
+        async def read_group(storage: Storage, keys: Dict[str, List[BotState]]):
+            items = await storage.read(list(keys))
+            for storage_key, bot_states in keys.items():
+                for bot_state in bot_states:
+                    bot_state.set_loaded_state(turn_context, items.get(storage_key))
+
+        await self._gather(
+            [read_group(storage, keys) for storage, keys in groups.values()]
+        )
+
+    async def _save_batched(self, turn_context: TurnContext, force: bool):
+        groups: Dict[
+            int,
+            Tuple[
+                Storage,
+                Dict[str, object],
+                List[BotState],
+                List[Tuple[Dict[str, object], BotState]],
+            ],
+        ] = {}
+        for bot_state in self.bot_states:
+            changes = bot_state.get_pending_changes(turn_context, force)
+            if changes:
+                _, group_changes, bot_states, collisions = groups.setdefault(
+                    id(bot_state.storage), (bot_state.storage, {}, [], [])
+                )
+                if any(key in group_changes for key in changes):
+                    # a single write would keep only one of the states written to this key
+                    collisions.append((changes, bot_state))
+                    continue
+                group_changes.update(changes)
+                bot_states.append(bot_state)
+
+        async def write_group(
+            storage: Storage,
+            changes: Dict[str, object],
+            bot_states: List[BotState],
+            collisions: List[Tuple[Dict[str, object], BotState]],
+        ):
+            await storage.write(changes)
+            for bot_state in bot_states:
+                bot_state.mark_changes_saved(turn_context)
+
+            for state_changes, bot_state in collisions:
+                await storage.write(state_changes)
+                bot_state.mark_changes_saved(turn_context)
+
+        await self._gather(
+            [
+                write_group(storage, changes, bot_states, collisions)
+                for storage, changes, bot_states, collisions in groups.values()
+            ]
+        )
+
+    @staticmethod
+    async def _gather(operations: List[Awaitable]):
+        results = await asyncio.gather(*operations, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise BotStateSetError(errors)
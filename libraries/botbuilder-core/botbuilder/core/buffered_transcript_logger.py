@@ -0,0 +1,151 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""Logs activities to a TranscriptLogger in the background, in batches."""
+
+import logging
+from asyncio import Future, TimerHandle, ensure_future, get_event_loop, shield
+from typing import Dict, List, Tuple
+from botbuilder.schema import Activity
+from .transcript_logger import TranscriptLogger
+
+_logger = logging.getLogger(__name__)
+
+
+class BufferedTranscriptLogger(TranscriptLogger):
+    """Buffers the logged activities and writes them to another logger in the background.
+
+    :param logger: The logger the activities are written to.
+    :param max_batch_size: The activities of a conversation that are written at once.
+    :param flush_interval: The seconds an activity waits for its batch to fill before it is written.
+    :param max_buffered_activities: The activities buffered before logging waits for the writes.
+
+    .. remarks::
+        The activities of a conversation are written in batches with `TranscriptLogger.log_activities`,
+        in the order they were logged. The writes start as soon as a conversation has `max_batch_size`
+        activities, or `flush_interval` seconds after the first buffered activity, and go on until every
+        buffered activity is written. Use `flush` to wait for the buffered activities to be written, for
+        example before the bot shuts down.
+
+        A batch that fails to be written is not retried, its activities are lost. Each failure is logged
+        with the `logging` module, and the batches after it are still written.
+    """
+
+    def __init__(
+        self,
+        logger: TranscriptLogger,
+        max_batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_buffered_activities: int = 1000,
+    ):
+        if not logger:
+            raise TypeError(
+                "BufferedTranscriptLogger requires a TranscriptLogger instance."
+            )
+        if max_batch_size < 1:
+            raise ValueError(
+                "BufferedTranscriptLogger.max_batch_size must be greater than 0"
+            )
+        if max_buffered_activities < max_batch_size:
+            raise ValueError(
+                "BufferedTranscriptLogger.max_buffered_activities must be at least max_batch_size"
+            )
+
+        self.logger = logger
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered_activities = max_buffered_activities
+        self._batches: Dict[Tuple[str, str], List[Activity]] = {}
+        self._buffered = 0
+        self._timer: TimerHandle = None
+        self._writer: Future = None
+        self._error: Exception = None
+
+    @property
+    def buffered(self) -> int:
+        """The number of activities not written yet."""
+        return self._buffered
+
+    async def log_activity(self, activity: Activity) -> None:
+        """Buffers an activity to be written to the transcript.
+        :param activity:Activity being logged.
+        """
+        await self.log_activities([activity])
+
+    async def log_activities(self, activities: List[Activity]) -> None:
+        """Buffers activities to be written to the transcript.
+        :param activities: Activities being logged, in order.
+
+        .. remarks::
+            This returns as soon as the activities are buffered, unless `max_buffered_activities`
+            are waiting to be written.
+        """
+        for activity in activities:
+            if not activity:
+                raise TypeError("activity cannot be None for log_activities()")
+
+            while self._buffered >= self.max_buffered_activities:
+                await self._wait_for_writer()
+
+            key = (activity.channel_id, activity.conversation.id)
+            batch = self._batches.setdefault(key, [])
+            batch.append(activity)
+            self._buffered += 1
+
+            if len(batch) >= self.max_batch_size:
+                self._start_writer()
+
+        if self._batches and self._timer is None and not self._is_writing:
+            self._timer = get_event_loop().call_later(
+                self.flush_interval, self._start_writer
+            )
+
+    async def flush(self) -> None:
+        """Writes the buffered activities and waits for the writes to complete.
+
+        .. remarks::
+            Raises the last error of the writes since the previous flush.
+        """
+        while self._batches or self._is_writing:
+            await self._wait_for_writer()
+
+        error, self._error = self._error, None
+        if error:
+            raise error
+
+    @property
+    def _is_writing(self) -> bool:
+        return self._writer is not None and not self._writer.done()
+
+    async def _wait_for_writer(self):
+        self._start_writer()
+        # a caller that stops waiting doesn't stop the writes
+        await shield(self._writer)
+
+    def _start_writer(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._is_writing:
+            self._writer = ensure_future(self._write_batches())
+
+    async def _write_batches(self):
+        # the batches are written one at a time, which keeps the order of each conversation
+        while self._batches:
+            key = next(iter(self._batches))
+            batch = self._batches.pop(key)
+            if len(batch) > self.max_batch_size:
+                # the rest of the conversation waits behind the other conversations
+                self._batches[key] = batch[self.max_batch_size :]
+                batch = batch[: self.max_batch_size]
+            try:
+                await self.logger.log_activities(batch)
+            except Exception as error:  # pylint: disable=broad-except
+                _logger.exception(
+                    "Failed to write %s activities of conversation %s, they are lost.",
+                    len(batch),
+                    key[1],
+                )
+                self._error = error
+            finally:
+                self._buffered -= len(batch)
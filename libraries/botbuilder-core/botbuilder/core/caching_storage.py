@@ -0,0 +1,295 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import time
+from collections import OrderedDict
+from copy import copy, deepcopy
+from typing import Callable, Dict, List
+from jsonpickle.pickler import Pickler
+from .storage import Storage
+
+
+def _get_e_tag(item: object) -> str:
+    if isinstance(item, dict):
+        return item.get("e_tag", None)
+    return getattr(item, "e_tag", None)
+
+
+def _with_e_tag(item: object, e_tag: str) -> object:
+    if isinstance(item, dict):
+        result = dict(item)
+        if e_tag is None:
+            result.pop("e_tag", None)
+        else:
+            result["e_tag"] = e_tag
+        return result
+
+    result = copy(item)
+    result.e_tag = e_tag
+    return result
+
+
+def _content_of(item: object) -> object:
+    flattened = Pickler().flatten(item)
+    if isinstance(flattened, dict):
+        flattened.pop("e_tag", None)
+    return flattened
+
+
+class _CacheEntry:
+    def __init__(self, item: object, backend_e_tag: str, expires_at: float = None):
+        self.item = item
+        self.backend_e_tag = backend_e_tag
+        self.expires_at = expires_at
+
+
+class _PendingWrite:
+    def __init__(self, item: object, base_e_tag: str):
+        self.item = item
+        self.base_e_tag = base_e_tag
+
+
+class CachingStorage(Storage):
+    """
+    A :class:`Storage` decorator that serves repeated reads from an in-process LRU cache and can
+    coalesce the writes made to a key within a short window into a single write to the inner storage.
+
+    .. remarks::
+        Without a write delay, writes go straight to the inner storage, and the written keys are read back
+        once to cache them with the e_tag assigned by the inner storage. If the write fails, the keys are
+        dropped from the cache.
+
+        With a write delay, writes are validated against the e_tag of the cached item, kept in the cache
+        under a local e_tag, and flushed to the inner storage after the delay with the e_tag originally read
+        from it. After a flush the keys are read back once to pick up their new e_tags. If a flush fails,
+        for example because another process changed the item, the keys are dropped from the cache and the
+        error is raised by the next write to one of them. Call :meth:`flush` before shutting down.
+
+        The cache assumes this process sees most writes to a key, as with conversations pinned to a worker.
+        Writes made by other processes are detected through the e_tag when this process writes the key.
+    """
+
+    def __init__(
+        self,
+        inner: Storage,
+        max_entries: int = 1000,
+        time_to_live: float = None,
+        write_delay: float = None,
+        snapshot: Callable[[object], object] = deepcopy,
+    ):
+        """
+        Initializes a new instance of the :class:`CachingStorage` class.
+
+        :param inner: The storage to cache
+        :type inner: :class:`Storage`
+        :param max_entries: Optional, the number of keys above which the least recently used keys are evicted
+        :type max_entries: int
+        :param time_to_live: Optional, the number of seconds after which a cached key is read again
+        :type time_to_live: float
+        :param write_delay: Optional, the number of seconds writes are held in the cache before being flushed
+        to the inner storage. Writes go straight to the inner storage if not set.
+        :type write_delay: float
+        :param snapshot: Optional, the function used to copy items in and out of the cache
+        :type snapshot: Callable[[object], object]
+        """
+        if inner is None:
+            raise TypeError("CachingStorage: inner storage can't be None")
+
+        super(CachingStorage, self).__init__()
+        self._inner = inner
+        self._max_entries = max_entries
+        self._time_to_live = time_to_live
+        self._write_delay = write_delay
+        self._snapshot = snapshot
+
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._failed_writes: Dict[str, Exception] = {}
+        self._flush_task: asyncio.Future = None
+        self._lock: asyncio.Lock = None
+        self._e_tag = 0
+
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+
+    async def read(self, keys: List[str]) -> Dict[str, object]:
+        if not keys:
+            raise Exception("Keys are required when reading")
+
+        data = {}
+        missing = []
+        for key in keys:
+            entry = self._get_entry(key)
+            if entry is not None:
+                self.hit_count += 1
+                data[key] = self._snapshot(entry.item)
+            else:
+                self.miss_count += 1
+                missing.append(key)
+
+        if missing:
+            items = await self._inner.read(missing)
+            for key, item in items.items():
+                # a write made while reading is more recent than what was read
+                if key not in self._cache:
+                    self._put(key, item, _get_e_tag(item))
+                data[key] = self._snapshot(self._cache[key].item)
+
+        return data
+
+    async def write(self, changes: Dict[str, object]):
+        if changes is None:
+            raise Exception("Changes are required when writing")
+        if not changes:
+            return
+
+        if self._write_delay is None:
+            try:
+                await self._inner.write(changes)
+            except Exception:
+                for key in changes:
+                    self._cache.pop(key, None)
+                raise
+
+            items = await self._inner.read(list(changes))
+            for key in changes:
+                item = items.get(key)
+                if item is None:
+                    self._cache.pop(key, None)
+                else:
+                    self._put(key, item, _get_e_tag(item))
+            return
+
+        async with self._get_lock():
+            for key, change in changes.items():
+                self._buffer_write(key, change)
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def delete(self, keys: List[str]):
+        async with self._get_lock():
+            for key in keys:
+                self._pending.pop(key, None)
+                self._failed_writes.pop(key, None)
+                self._cache.pop(key, None)
+            await self._inner.delete(keys)
+
+    async def flush(self):
+        """
+        Writes the changes held in the cache to the inner storage.
+        """
+        async with self._get_lock():
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            changes = {
+                key: _with_e_tag(write.item, write.base_e_tag)
+                for key, write in pending.items()
+            }
+
+            try:
+                await self._inner.write(changes)
+            except Exception as error:
+                for key in pending:
+                    self._cache.pop(key, None)
+                    self._failed_writes[key] = error
+                raise
+
+            items = await self._inner.read(list(pending))
+            for key, change in changes.items():
+                entry = self._cache.get(key)
+                item = items.get(key)
+                if entry is None:
+                    continue
+                if item is None:
+                    self._cache.pop(key)
+                elif _content_of(item) == _content_of(change):
+                    entry.backend_e_tag = _get_e_tag(item)
+                else:
+                    # changed by someone else since, callers holding the local e_tag will conflict
+                    self._put(key, item, _get_e_tag(item))
+
+    def _buffer_write(self, key: str, change: object):
+        error = self._failed_writes.pop(key, None)
+        if error is not None:
+            raise error
+
+        new_e_tag = _get_e_tag(change)
+        if new_e_tag == "":
+            raise Exception("caching_storage.write(): etag missing")
+
+        entry = self._get_entry(key)
+        current_e_tag = _get_e_tag(entry.item) if entry is not None else None
+        if new_e_tag is None or new_e_tag == "*" or entry is None:
+            base_e_tag = new_e_tag
+        elif new_e_tag == current_e_tag:
+            pending = self._pending.get(key)
+            base_e_tag = pending.base_e_tag if pending else entry.backend_e_tag
+        else:
+            raise KeyError(
+                "Etag conflict.\nOriginal: %s\r\nCurrent: %s"
+                % (new_e_tag, current_e_tag)
+            )
+
+        item = self._snapshot(change)
+        if new_e_tag is not None:
+            self._e_tag += 1
+            item = _with_e_tag(item, f"cache:{self._e_tag}")
+
+        self._pending[key] = _PendingWrite(item, base_e_tag)
+        self._put(key, item, entry.backend_e_tag if entry is not None else base_e_tag)
+
+    async def _flush_later(self):
+        await asyncio.sleep(self._write_delay)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception:  # pylint: disable=broad-except
+            # the error is raised by the next write to one of the keys
+            pass
+
+    def _get_lock(self) -> asyncio.Lock:
+        # created lazily so that the storage can be constructed outside of an event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _get_entry(self, key: str) -> _CacheEntry:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if (
+            entry.expires_at is not None
+            and entry.expires_at <= time.monotonic()
+            and key not in self._pending
+        ):
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return entry
+
+    def _put(self, key: str, item: object, backend_e_tag: str):
+        expires_at = (
+            time.monotonic() + self._time_to_live
+            if self._time_to_live is not None
+            else None
+        )
+        self._cache[key] = _CacheEntry(item, backend_e_tag, expires_at)
+        self._cache.move_to_end(key)
+
+        if self._max_entries is None:
+            return
+
+        # keys with writes that are not flushed yet are never evicted
+        for candidate in list(self._cache):
+            if len(self._cache) <= self._max_entries:
+                break
+            if candidate != key and candidate not in self._pending:
+                del self._cache[candidate]
+                self.eviction_count += 1
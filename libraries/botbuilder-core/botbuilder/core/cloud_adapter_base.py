@@ -64,47 +64,45 @@ class CloudAdapterBase(BotAdapter, ABC):
         if len(activities) == 0:
             raise TypeError("Expecting one or more activities, but the list was empty.")
 
-        responses = []
-
-        for activity in activities:
-            activity.id = None
-
-            response = ResourceResponse()
-
-            if activity.type == "delay":
-                delay_time = int((activity.value or 1000) / 1000)
-                await sleep(delay_time)
-            elif activity.type == ActivityTypes.invoke_response:
-                context.turn_state[self._INVOKE_RESPONSE_KEY] = activity
-            elif (
-                activity.type == ActivityTypes.trace
-                and activity.channel_id != Channels.emulator
-            ):
-                # no-op
-                pass
-            else:
-                connector_client: ConnectorClient = context.turn_state.get(
-                    self.BOT_CONNECTOR_CLIENT_KEY
-                )
-                if not connector_client:
-                    raise Error("Unable to extract ConnectorClient from turn context.")
-
-                if activity.reply_to_id:
-                    response = await connector_client.conversations.reply_to_activity(
-                        activity.conversation.id, activity.reply_to_id, activity
-                    )
-                else:
-                    response = (
-                        await connector_client.conversations.send_to_conversation(
-                            activity.conversation.id, activity
-                        )
-                    )
+        return await self._send_activities_in_order(
+            activities, lambda activity: self._send_activity(context, activity)
+        )
 
-            response = response or ResourceResponse(id=activity.id or "")
+    async def _send_activity(
+        self, context: TurnContext, activity: Activity
+    ) -> ResourceResponse:
+        activity.id = None
+
+        response = ResourceResponse()
+
+        if activity.type == "delay":
+            delay_time = int((activity.value or 1000) / 1000)
+            await sleep(delay_time)
+        elif activity.type == ActivityTypes.invoke_response:
+            context.turn_state[self._INVOKE_RESPONSE_KEY] = activity
+        elif (
+            activity.type == ActivityTypes.trace
+            and activity.channel_id != Channels.emulator
+        ):
+            # no-op
+            pass
+        else:
+            connector_client: ConnectorClient = context.turn_state.get(
+                self.BOT_CONNECTOR_CLIENT_KEY
+            )
+            if not connector_client:
+                raise Error("Unable to extract ConnectorClient from turn context.")
 
-            responses.append(response)
+            if activity.reply_to_id:
+                response = await connector_client.conversations.reply_to_activity(
+                    activity.conversation.id, activity.reply_to_id, activity
+                )
+            else:
+                response = await connector_client.conversations.send_to_conversation(
+                    activity.conversation.id, activity
+                )
 
-        return responses
+        return response or ResourceResponse(id=activity.id or "")
 
     async def update_activity(self, context: TurnContext, activity: Activity):
         if not context:
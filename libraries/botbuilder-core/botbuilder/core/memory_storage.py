@@ -1,22 +1,95 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import time
 from copy import deepcopy
-from typing import Dict, List
+from typing import Callable, Dict, List
+import jsonpickle
 from .storage import Storage, StoreItem
 
 
+def _encoded_size(value: object) -> int:
+    return len(jsonpickle.encode(value))
+
+
 class MemoryStorage(Storage):
-    def __init__(self, dictionary=None):
+    def __init__(
+        self,
+        dictionary=None,
+        snapshot: Callable[[object], object] = deepcopy,
+        copy_on_read: bool = False,
+        max_entries: int = None,
+        max_bytes: int = None,
+        time_to_live: float = None,
+        size_of: Callable[[object], int] = _encoded_size,
+    ):
+        """
+        Initializes a new instance of the :class:`MemoryStorage` class.
+
+        :param dictionary: Optional, the dictionary backing this storage
+        :type dictionary: dict
+        :param snapshot: Optional, the function used to take the copy of a store item that is kept on write.
+        Defaults to :func:`copy.deepcopy`. Pass an identity function to store the written objects themselves.
+        :type snapshot: Callable[[object], object]
+        :param copy_on_read: Optional, true to return snapshots instead of the stored objects from reads
+        :type copy_on_read: bool
+        :param max_entries: Optional, the number of keys above which the least recently used keys are evicted
+        :type max_entries: int
+        :param max_bytes: Optional, the total item size, as measured by size_of, above which the least recently
+        used keys are evicted
+        :type max_bytes: int
+        :param time_to_live: Optional, the number of seconds after its last write after which a key expires
+        :type time_to_live: float
+        :param size_of: Optional, the function used to measure an item for max_bytes. Defaults to the length
+        of its jsonpickle encoding.
+        :type size_of: Callable[[object], int]
+
+        .. remarks::
+            The hit_count, miss_count, eviction_count and expiration_count attributes can be used
+            to size a bounded storage.
+        """
         super(MemoryStorage, self).__init__()
         self.memory = dictionary if dictionary is not None else {}
         self._e_tag = 0
 
+        self._snapshot = snapshot
+        self._copy_on_read = copy_on_read
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._time_to_live = time_to_live
+        self._size_of = size_of
+        self._expirations: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.expiration_count = 0
+
+        # the initial items expire as if they were written now
+        if self._time_to_live is not None:
+            expiration = time.monotonic() + self._time_to_live
+            for key in self.memory:
+                self._expirations[key] = expiration
+        if self._max_bytes is not None:
+            for key, value in self.memory.items():
+                self._sizes[key] = self._size_of(value)
+                self._total_bytes += self._sizes[key]
+        self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        """
+        The total size of the stored items. Only measured when max_bytes is set.
+        """
+        return self._total_bytes
+
     async def delete(self, keys: List[str]):
         try:
             for key in keys:
                 if key in self.memory:
-                    del self.memory[key]
+                    self._remove(key)
         except TypeError as error:
             raise error
 
@@ -26,8 +99,20 @@ class MemoryStorage(Storage):
             return data
         try:
             for key in keys:
+                if key in self.memory and self._is_expired(key):
+                    self._remove(key)
+                    self.expiration_count += 1
+
                 if key in self.memory:
-                    data[key] = self.memory[key]
+                    self.hit_count += 1
+                    self._touch(key)
+                    data[key] = (
+                        self._snapshot(self.memory[key])
+                        if self._copy_on_read
+                        else self.memory[key]
+                    )
+                else:
+                    self.miss_count += 1
         except TypeError as error:
             raise error
 
@@ -39,9 +124,11 @@ class MemoryStorage(Storage):
         if not changes:
             return
         try:
+            # an expired key is absent, its e_tag doesn't conflict with the change
+            self._purge_expired()
+
             # iterate over the changes
             for key, change in changes.items():
-                new_value = deepcopy(change)
                 old_state_etag = None
 
                 # Check if the a matching key already exists in self.memory
@@ -53,14 +140,12 @@ class MemoryStorage(Storage):
                     elif hasattr(old_state, "e_tag"):
                         old_state_etag = old_state.e_tag
 
-                new_state = new_value
-
                 # Set ETag if applicable
                 new_value_etag = None
-                if isinstance(new_value, dict):
-                    new_value_etag = new_value.get("e_tag", None)
-                elif hasattr(new_value, "e_tag"):
-                    new_value_etag = new_value.e_tag
+                if isinstance(change, dict):
+                    new_value_etag = change.get("e_tag", None)
+                elif hasattr(change, "e_tag"):
+                    new_value_etag = change.e_tag
                 if new_value_etag == "":
                     raise Exception("memory_storage.write(): etag missing")
                 if (
@@ -74,6 +159,9 @@ class MemoryStorage(Storage):
                         % (new_value_etag, old_state_etag)
                     )
 
+                # The snapshot is the only copy taken, the e_tag is set on it rather than on the caller's object
+                new_state = self._snapshot(change)
+
                 # If the original object didn't have an e_tag, don't set one (C# behavior)
                 if old_state_etag:
                     if isinstance(new_state, dict):
@@ -82,11 +170,59 @@ class MemoryStorage(Storage):
                         new_state.e_tag = str(self._e_tag)
 
                 self._e_tag += 1
-                self.memory[key] = deepcopy(new_state)
+                self._store(key, new_state)
+
+            self._evict()
 
         except Exception as error:
             raise error
 
+    def _store(self, key: str, value: object):
+        if key in self.memory:
+            self._remove(key)
+
+        self.memory[key] = value
+        if self._time_to_live is not None:
+            self._expirations[key] = time.monotonic() + self._time_to_live
+        if self._max_bytes is not None:
+            self._sizes[key] = self._size_of(value)
+            self._total_bytes += self._sizes[key]
+
+    def _remove(self, key: str):
+        del self.memory[key]
+        self._expirations.pop(key, None)
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+    def _touch(self, key: str):
+        # dictionaries keep insertion order, re-inserting a key makes it the most recently used
+        if self._max_entries is not None or self._max_bytes is not None:
+            self.memory[key] = self.memory.pop(key)
+
+    def _is_expired(self, key: str) -> bool:
+        expiration = self._expirations.get(key)
+        return expiration is not None and expiration <= time.monotonic()
+
+    def _purge_expired(self):
+        # every key gets the same time_to_live on write, so the expirations are in write order
+        now = time.monotonic()
+        while self._expirations:
+            key, expiration = next(iter(self._expirations.items()))
+            if expiration > now:
+                break
+            self._remove(key)
+            self.expiration_count += 1
+
+    def _evict(self):
+        self._purge_expired()
+
+        # the most recently used key is always kept, even if it exceeds max_bytes on its own
+        while len(self.memory) > 1 and (
+            (self._max_entries is not None and len(self.memory) > self._max_entries)
+            or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+        ):
+            self._remove(next(iter(self.memory)))
+            self.eviction_count += 1
+
     # TODO: Check if needed, if not remove
     def __should_write_changes(
         self, old_value: StoreItem, new_value: StoreItem
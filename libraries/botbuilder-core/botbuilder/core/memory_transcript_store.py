@@ -2,40 +2,159 @@
 # Licensed under the MIT License.
 """The memory transcript store stores transcripts in volatile memory."""
 import datetime
-from typing import List, Dict
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import List, Dict, Tuple
 from botbuilder.schema import Activity
 from .transcript_logger import PagedResult, TranscriptInfo, TranscriptStore
 
+_MIN_TIMESTAMP = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+
+
+def _timestamp_key(timestamp: datetime.datetime) -> datetime.datetime:
+    # activities without a timezone are taken as UTC, so that they compare with the others
+    if not timestamp:
+        return _MIN_TIMESTAMP
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp
+
+
+class _Transcript:
+    """The activities of a conversation, ordered by timestamp and then by the order they were logged.
+
+    The oldest activities are removed by moving an offset into the lists, which are trimmed once
+    the removed activities are half of them. Indexes are relative to the offset.
+    """
+
+    def __init__(self):
+        self.keys_by_id: Dict[str, Tuple[datetime.datetime, int]] = {}
+        self.created: datetime.datetime = None
+        self._keys: List[Tuple[datetime.datetime, int]] = []
+        self._activities: List[Activity] = []
+        self._offset = 0
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._offset
+
+    @property
+    def activities(self) -> List[Activity]:
+        return self._activities[self._offset :]
+
+    def add(self, activity: Activity):
+        key = (_timestamp_key(activity.timestamp), self._sequence)
+        self._sequence += 1
+
+        if len(self._keys) == self._offset or self._keys[-1] < key:
+            # activities are mostly logged in timestamp order
+            self._keys.append(key)
+            self._activities.append(activity)
+        else:
+            index = bisect_right(self._keys, key, self._offset)
+            self._keys.insert(index, key)
+            self._activities.insert(index, activity)
+        if activity.id:
+            self.keys_by_id[activity.id] = key
+        if self.created is None:
+            self.created = activity.timestamp
+
+    def remove_oldest(self):
+        key = self._keys[self._offset]
+        activity = self._activities[self._offset]
+        self._activities[self._offset] = None
+        self._offset += 1
+        if self._offset * 2 >= len(self._keys):
+            del self._keys[: self._offset]
+            del self._activities[: self._offset]
+            self._offset = 0
+
+        # an activity logged again keeps the key of its latest copy
+        if activity.id and self.keys_by_id.get(activity.id) == key:
+            del self.keys_by_id[activity.id]
+
+    def index_of(self, key: Tuple[datetime.datetime, int]) -> int:
+        """The index of the first activity at or after the key."""
+        return bisect_left(self._keys, key, self._offset) - self._offset
+
+    def index_after(self, key: Tuple[datetime.datetime, int]) -> int:
+        """The index of the first activity after the key."""
+        return bisect_right(self._keys, key, self._offset) - self._offset
+
+    def page(self, start: int, size: int) -> List[Activity]:
+        start += self._offset
+        return self._activities[start : start + size]
+
 
 # pylint: disable=line-too-long
 class MemoryTranscriptStore(TranscriptStore):
     """This provider is most useful for simulating production storage when running locally against the
     emulator or as part of a unit test.
+
+    :param max_activities_per_conversation: The activities kept for a conversation, the oldest are
+    dropped first. None keeps every activity.
+    :param max_conversations: The conversations kept for a channel, the ones logged to the least
+    recently are dropped first. None keeps every conversation.
     """
 
-    channels: Dict[str, Dict[str, Activity]] = {}
+    PAGE_SIZE = 20
+
+    def __init__(
+        self,
+        max_activities_per_conversation: int = None,
+        max_conversations: int = None,
+    ):
+        self.max_activities_per_conversation = max_activities_per_conversation
+        self.max_conversations = max_conversations
+        self._transcripts: Dict[str, "OrderedDict[str, _Transcript]"] = {}
+
+    @property
+    def channels(self) -> Dict[str, Dict[str, List[Activity]]]:
+        """
+        The activities of each conversation, by channel, ordered by timestamp.
+        It is a copy, changing it doesn't change the store.
+        """
+        return {
+            channel_id: {
+                conversation_id: transcript.activities
+                for conversation_id, transcript in channel.items()
+            }
+            for channel_id, channel in self._transcripts.items()
+        }
 
     async def log_activity(self, activity: Activity) -> None:
         if not activity:
             raise TypeError("activity cannot be None for log_activity()")
 
-        # get channel
-        channel = {}
-        if not activity.channel_id in self.channels:
-            channel = {}
-            self.channels[activity.channel_id] = channel
-        else:
-            channel = self.channels[activity.channel_id]
+        self._add(activity)
+
+    async def log_activities(self, activities: List[Activity]) -> None:
+        for activity in activities:
+            if not activity:
+                raise TypeError("activity cannot be None for log_activities()")
+
+            self._add(activity)
 
-        # Get conversation transcript.
-        transcript = []
-        if activity.conversation.id in channel:
-            transcript = channel[activity.conversation.id]
+    def _add(self, activity: Activity):
+        channel = self._transcripts.setdefault(activity.channel_id, OrderedDict())
+
+        transcript = channel.get(activity.conversation.id)
+        if transcript is None:
+            transcript = channel[activity.conversation.id] = _Transcript()
+            if (
+                self.max_conversations is not None
+                and len(channel) > self.max_conversations
+            ):
+                channel.popitem(last=False)
         else:
-            transcript = []
-            channel[activity.conversation.id] = transcript
+            channel.move_to_end(activity.conversation.id)
 
-        transcript.append(activity)
+        transcript.add(activity)
+        if (
+            self.max_activities_per_conversation is not None
+            and len(transcript) > self.max_activities_per_conversation
+        ):
+            transcript.remove_oldest()
 
     async def get_transcript_activities(
         self,
@@ -51,38 +170,22 @@ class MemoryTranscriptStore(TranscriptStore):
             raise TypeError("Missing conversation_id")
 
         paged_result = PagedResult()
-        if channel_id in self.channels:
-            channel = self.channels[channel_id]
-            if conversation_id in channel:
-                transcript = channel[conversation_id]
-                if continuation_token:
-                    paged_result.items = (
-                        [
-                            x
-                            for x in sorted(
-                                transcript,
-                                key=lambda x: x.timestamp or str(datetime.datetime.min),
-                                reverse=False,
-                            )
-                            if x.timestamp >= start_date
-                        ]
-                        .dropwhile(lambda x: x.id != continuation_token)
-                        .Skip(1)[:20]
-                    )
-                    if paged_result.items.count == 20:
-                        paged_result.continuation_token = paged_result.items[-1].id
-                else:
-                    paged_result.items = [
-                        x
-                        for x in sorted(
-                            transcript,
-                            key=lambda x: x.timestamp or datetime.datetime.min,
-                            reverse=False,
-                        )
-                        if (x.timestamp or datetime.datetime.min) >= start_date
-                    ][:20]
-                    if paged_result.items.count == 20:
-                        paged_result.continuation_token = paged_result.items[-1].id
+        transcript = self._transcripts.get(channel_id, {}).get(conversation_id)
+        if transcript is None:
+            return paged_result
+
+        start = transcript.index_of((_timestamp_key(start_date), -1))
+        if continuation_token:
+            key = transcript.keys_by_id.get(continuation_token)
+            if key is None:
+                # the page ended with an activity that isn't kept anymore
+                paged_result.items = []
+                return paged_result
+            start = max(start, transcript.index_after(key))
+
+        paged_result.items = transcript.page(start, self.PAGE_SIZE)
+        if len(paged_result.items) == self.PAGE_SIZE:
+            paged_result.continuation_token = paged_result.items[-1].id
 
         return paged_result
 
@@ -93,9 +196,9 @@ class MemoryTranscriptStore(TranscriptStore):
         if not conversation_id:
             raise TypeError("conversation_id should not be None")
 
-        if channel_id in self.channels:
-            if conversation_id in self.channels[channel_id]:
-                del self.channels[channel_id][conversation_id]
+        if channel_id in self._transcripts:
+            if conversation_id in self._transcripts[channel_id]:
+                del self._transcripts[channel_id][conversation_id]
 
     async def list_transcripts(
         self, channel_id: str, continuation_token: str = None
@@ -105,48 +208,31 @@ class MemoryTranscriptStore(TranscriptStore):
 
         paged_result = PagedResult()
 
-        if channel_id in self.channels:
-            channel: Dict[str, List[Activity]] = self.channels[channel_id]
+        if channel_id in self._transcripts:
+            channel: Dict[str, _Transcript] = self._transcripts[channel_id]
+
+            transcripts = sorted(
+                [
+                    TranscriptInfo(channel_id, transcript.created, conversation_id)
+                    for conversation_id, transcript in channel.items()
+                ],
+                key=lambda x: _timestamp_key(x.created),
+                reverse=True,
+            )
 
+            start = 0
             if continuation_token:
-                paged_result.items = (
-                    sorted(
-                        [
-                            TranscriptInfo(
-                                channel_id,
-                                c.value()[0].timestamp if c.value() else None,
-                                c.id,
-                            )
-                            for c in channel
-                        ],
-                        key=lambda x: x.created,
-                        reverse=True,
-                    )
-                    .dropwhile(lambda x: x.id != continuation_token)
-                    .Skip(1)
-                    .Take(20)
+                start = next(
+                    (
+                        index + 1
+                        for index, transcript in enumerate(transcripts)
+                        if transcript.id == continuation_token
+                    ),
+                    len(transcripts),
                 )
-                if paged_result.items.count == 20:
-                    paged_result.continuation_token = paged_result.items[-1].id
-            else:
-                paged_result.items = (
-                    sorted(
-                        [
-                            TranscriptInfo(
-                                channel_id,
-                                c.value()[0].timestamp if c.value() else None,
-                                c.id,
-                            )
-                            for c in channel
-                        ],
-                        key=lambda x: x.created,
-                        reverse=True,
-                    )
-                    .dropwhile(lambda x: x.id != continuation_token)
-                    .Skip(1)
-                    .Take(20)
-                )
-                if paged_result.items.count == 20:
-                    paged_result.continuation_token = paged_result.items[-1].id
+
+            paged_result.items = transcripts[start : start + self.PAGE_SIZE]
+            if len(paged_result.items) == self.PAGE_SIZE:
+                paged_result.continuation_token = paged_result.items[-1].id
 
         return paged_result
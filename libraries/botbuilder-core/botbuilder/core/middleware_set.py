@@ -3,7 +3,9 @@
 
 from asyncio import iscoroutinefunction
 from abc import ABC, abstractmethod
-from typing import Awaitable, Callable
+from functools import partial
+from time import perf_counter
+from typing import Awaitable, Callable, Tuple
 
 from .turn_context import TurnContext
 
@@ -28,6 +30,53 @@ class AnonymousReceiveMiddleware(Middleware):
         return self._to_call(context, logic)
 
 
+async def _no_callback():
+    return None
+
+
+class _PipelineRun:
+    """The state of one turn through a :class:`MiddlewareSet`."""
+
+    __slots__ = ("_middleware", "_context", "_callback", "_timing_hook")
+
+    def __init__(
+        self,
+        middleware: Tuple["Middleware", ...],
+        context: TurnContext,
+        callback: Callable[[TurnContext], Awaitable],
+        timing_hook: Callable[["Middleware", TurnContext, float], None],
+    ):
+        self._middleware = middleware
+        self._context = context
+        self._callback = callback
+        self._timing_hook = timing_hook
+
+    def call(self, index: int) -> Awaitable:
+        # returns the awaitable of the next middleware directly, so that no coroutine
+        # is stacked between middlewares
+        if index == len(self._middleware):
+            if self._callback is not None:
+                return self._callback(self._context)
+            return _no_callback()
+
+        if self._timing_hook is not None:
+            return self._call_timed(index)
+        return self._middleware[index].on_turn(
+            self._context, partial(self.call, index + 1)
+        )
+
+    async def _call_timed(self, index: int):
+        start = perf_counter()
+        try:
+            return await self._middleware[index].on_turn(
+                self._context, partial(self.call, index + 1)
+            )
+        finally:
+            self._timing_hook(
+                self._middleware[index], self._context, perf_counter() - start
+            )
+
+
 class MiddlewareSet(Middleware):
     """
     A set of `Middleware` plugins. The set itself is middleware so you can easily package up a set
@@ -35,9 +84,20 @@ class MiddlewareSet(Middleware):
     another middleware set using `set.use(mySet)`.
     """
 
-    def __init__(self):
+    def __init__(
+        self, timing_hook: Callable[[Middleware, TurnContext, float], None] = None
+    ):
+        """
+        Initializes a new instance of the :class:`MiddlewareSet` class.
+
+        :param timing_hook: Optional, called after each middleware with the middleware, the turn context
+        and the seconds its `on_turn` took, including the rest of the pipeline it awaited.
+        :type timing_hook: Callable[[:class:`Middleware`, :class:`TurnContext`, float], None]
+        """
         super(MiddlewareSet, self).__init__()
         self._middleware = []
+        self.timing_hook = timing_hook
+        self._pipeline: Tuple[Middleware, ...] = ()
 
     def use(self, *middleware: Middleware):
         """
@@ -46,13 +106,15 @@ class MiddlewareSet(Middleware):
         :return:
         """
         for idx, mid in enumerate(middleware):
-            if hasattr(mid, "on_turn") and callable(mid.on_turn):
-                self._middleware.append(mid)
-                return self
-            raise TypeError(
-                'MiddlewareSet.use(): invalid middleware at index "%s" being added.'
-                % idx
-            )
+            if not hasattr(mid, "on_turn") or not callable(mid.on_turn):
+                raise TypeError(
+                    'MiddlewareSet.use(): invalid middleware at index "%s" being added.'
+                    % idx
+                )
+
+        self._middleware.extend(middleware)
+        self._pipeline = tuple(self._middleware)
+        return self
 
     async def receive_activity(self, context: TurnContext):
         await self.receive_activity_internal(context, None)
@@ -74,18 +136,5 @@ class MiddlewareSet(Middleware):
         callback: Callable[[TurnContext], Awaitable],
         next_middleware_index: int = 0,
     ):
-        if next_middleware_index == len(self._middleware):
-            if callback is not None:
-                return await callback(context)
-            return None
-        next_middleware = self._middleware[next_middleware_index]
-
-        async def call_next_middleware():
-            return await self.receive_activity_internal(
-                context, callback, next_middleware_index + 1
-            )
-
-        try:
-            return await next_middleware.on_turn(context, call_next_middleware)
-        except Exception as error:
-            raise error
+        run = _PipelineRun(self._pipeline, context, callback, self.timing_hook)
+        return await run.call(next_middleware_index)
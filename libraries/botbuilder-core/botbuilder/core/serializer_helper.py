@@ -1,8 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
-from copy import copy
 from inspect import getmembers
-from typing import Type
+from typing import Dict, FrozenSet, Type
 from enum import Enum
 
 from msrest.serialization import Model, Deserializer, Serializer
@@ -22,37 +21,53 @@ DEPENDICIES += [
 ]
 DEPENDICIES_DICT = {dependency.__name__: dependency for dependency in DEPENDICIES}
 
+# msrest serializers keep no state between calls, so a single instance of each is shared
+_SERIALIZER = Serializer(DEPENDICIES_DICT)
+_DESERIALIZER = Deserializer(DEPENDICIES_DICT)
+
+# per model, the attribute names and wire keys of the properties typed as a schema class
+_MODEL_PROPERTY_KEYS: Dict[Type[Model], FrozenSet[str]] = {}
+
 
 def deserializer_helper(msrest_cls: Type[Model], dict_to_deserialize: dict) -> Model:
-    deserializer = Deserializer(DEPENDICIES_DICT)
     _clean_data_for_serialization(
-        deserializer.dependencies[msrest_cls.__name__], dict_to_deserialize
+        _DESERIALIZER.dependencies[msrest_cls.__name__], dict_to_deserialize
     )
-    return deserializer(msrest_cls.__name__, dict_to_deserialize)
+    return _DESERIALIZER(msrest_cls.__name__, dict_to_deserialize)
 
 
 def serializer_helper(object_to_serialize: Model) -> dict:
     if object_to_serialize is None:
         return None
 
-    serializer = Serializer(DEPENDICIES_DICT)
     # pylint: disable=protected-access
-    return serializer._serialize(object_to_serialize)
+    return _SERIALIZER._serialize(object_to_serialize)
 
 
 def _clean_data_for_serialization(msrest_cls: Type[Model], dict_to_deserialize: dict):
-    # pylint: disable=protected-access
     # Clean channel response of empty strings for expected objects.
     if not isinstance(dict_to_deserialize, dict):
         return
-    serialization_model = copy(msrest_cls._attribute_map)
-    for key, value in msrest_cls._attribute_map.items():
-        if key != value["key"]:
-            serialization_model[value["key"]] = value
+    model_keys = _get_model_property_keys(msrest_cls)
     for prop, prop_value in dict_to_deserialize.items():
-        if (
-            prop in serialization_model
-            and serialization_model[prop]["type"] in DEPENDICIES_DICT
-            and not prop_value
-        ):
+        if not prop_value and prop in model_keys:
             dict_to_deserialize[prop] = None
+
+
+def _get_model_property_keys(msrest_cls: Type[Model]) -> FrozenSet[str]:
+    model_keys = _MODEL_PROPERTY_KEYS.get(msrest_cls)
+    if model_keys is None:
+        # pylint: disable=protected-access
+        attribute_map = msrest_cls._attribute_map
+        # a wire key shadows the attribute of the same name, as it did when both shared one map
+        serialization_model = dict(attribute_map)
+        for key, value in attribute_map.items():
+            if key != value["key"]:
+                serialization_model[value["key"]] = value
+        model_keys = frozenset(
+            key
+            for key, value in serialization_model.items()
+            if value["type"] in DEPENDICIES_DICT
+        )
+        _MODEL_PROPERTY_KEYS[msrest_cls] = model_keys
+    return model_keys
@@ -0,0 +1,157 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import sqlite3
+from typing import Dict, List, Tuple
+from uuid import uuid4
+from ._sqlite_database import MAX_VARIABLES, _SqliteDatabase, parameters
+from .storage import Storage
+from .store_item_serializer import (
+    _STATE_TAG,
+    JsonPickleStoreItemSerializer,
+    StoreItemSerializer,
+)
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS storage"
+    " (key TEXT PRIMARY KEY NOT NULL, e_tag TEXT NOT NULL, data BLOB NOT NULL)"
+]
+
+
+def _attributes_of(item: object) -> dict:
+    # jsonpickle keeps the attributes of objects with __getstate__ apart from their class
+    if isinstance(item, dict) and isinstance(item.get(_STATE_TAG), dict):
+        return item[_STATE_TAG]
+    return item if isinstance(item, dict) else None
+
+
+class SqliteStorage(Storage):
+    """
+    A storage provider that keeps the store items in a SQLite database file.
+
+    :param path: The path of the database file, created if needed
+    :type path: str
+    :param serializer: Optional, converts store items to and from the stored data. Defaults to jsonpickle.
+    :type serializer: :class:`botbuilder.core.StoreItemSerializer`
+    :param timeout: Optional, the seconds a write waits for the writes of other processes
+    :type timeout: float
+
+    .. remarks::
+        The database is opened in WAL mode, so the processes of a bot on one host can share it. The
+        statements run on a thread of their own, which keeps the event loop free.
+        Every write gives the item a new e_tag, which is set on the items that are read. Writing an
+        item with an e_tag other than "*" fails with a KeyError if the item was written since it was
+        read, and the other changes of that write aren't kept.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        serializer: StoreItemSerializer = None,
+        timeout: float = 30.0,
+    ):
+        super(SqliteStorage, self).__init__()
+        self._database = _SqliteDatabase(path, _SCHEMA, timeout)
+        self._serializer = serializer or JsonPickleStoreItemSerializer()
+
+    async def read(self, keys: List[str]) -> Dict[str, object]:
+        if not keys:
+            raise Exception("Keys are required when reading")
+
+        keys = list(keys)
+
+        def read(connection: sqlite3.Connection) -> List[Tuple[str, str, bytes]]:
+            rows = []
+            for start in range(0, len(keys), MAX_VARIABLES):
+                batch = keys[start : start + MAX_VARIABLES]
+                rows.extend(
+                    connection.execute(
+                        "SELECT key, e_tag, data FROM storage"
+                        f" WHERE key IN ({parameters(len(batch))})",
+                        batch,
+                    )
+                )
+            return rows
+
+        items = {}
+        for key, e_tag, data in await self._database.run(read):
+            item = self._serializer.loads(data)
+            attributes = _attributes_of(item)
+            if attributes is not None:
+                attributes["e_tag"] = e_tag
+            items[key] = self._serializer.from_dict(item)
+
+        # keep the order of the keys
+        return {key: items[key] for key in keys if key in items}
+
+    async def write(self, changes: Dict[str, object]):
+        if changes is None:
+            raise Exception("Changes are required when writing")
+        if not changes:
+            return
+
+        rows = []
+        for key, change in changes.items():
+            e_tag = None
+            if isinstance(change, dict):
+                e_tag = change.get("e_tag", None)
+            elif hasattr(change, "e_tag"):
+                e_tag = change.e_tag
+            if e_tag == "":
+                raise Exception("sqlite_storage.write(): etag missing")
+
+            item = self._serializer.to_dict(change)
+            attributes = _attributes_of(item)
+            if attributes is not None:
+                # the e_tag is kept in its own column
+                attributes.pop("e_tag", None)
+            rows.append(
+                (
+                    key,
+                    None if e_tag == "*" else e_tag,
+                    self._serializer.dumps(item),
+                    uuid4().hex,
+                )
+            )
+
+        def write(connection: sqlite3.Connection):
+            for key, e_tag, data, new_e_tag in rows:
+                if e_tag is not None:
+                    current = connection.execute(
+                        "SELECT e_tag FROM storage WHERE key = ?", (key,)
+                    ).fetchone()
+                    if current is not None and current[0] != e_tag:
+                        raise KeyError(
+                            "Etag conflict.\nOriginal: %s\r\nCurrent: %s"
+                            % (e_tag, current[0])
+                        )
+
+                connection.execute(
+                    "INSERT INTO storage (key, e_tag, data) VALUES (?, ?, ?)"
+                    " ON CONFLICT (key) DO UPDATE SET e_tag = excluded.e_tag, data = excluded.data",
+                    (key, new_e_tag, data),
+                )
+
+        await self._database.run_in_transaction(write)
+
+    async def delete(self, keys: List[str]):
+        if keys is None:
+            raise Exception("SqliteStorage.delete: keys parameter can't be null")
+
+        keys = list(keys)
+
+        def delete(connection: sqlite3.Connection):
+            for start in range(0, len(keys), MAX_VARIABLES):
+                batch = keys[start : start + MAX_VARIABLES]
+                connection.execute(
+                    f"DELETE FROM storage WHERE key IN ({parameters(len(batch))})",
+                    batch,
+                )
+
+        await self._database.run_in_transaction(delete)
+
+    async def close(self):
+        """
+        Closes the database. It is opened again by the next operation.
+        """
+        await self._database.close()
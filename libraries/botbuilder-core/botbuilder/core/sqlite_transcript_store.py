@@ -0,0 +1,200 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""The SQLite transcript store stores transcripts in a SQLite database file."""
+import datetime
+import json
+import sqlite3
+from typing import List
+from botbuilder.schema import Activity
+from ._sqlite_database import _SqliteDatabase
+from .transcript_logger import PagedResult, TranscriptInfo, TranscriptStore
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS activities"
+    " (sequence INTEGER PRIMARY KEY, channel_id TEXT NOT NULL, conversation_id TEXT NOT NULL,"
+    " timestamp INTEGER NOT NULL, id TEXT, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS activities_by_conversation"
+    " ON activities (channel_id, conversation_id, timestamp, sequence)",
+    "CREATE INDEX IF NOT EXISTS activities_by_id"
+    " ON activities (channel_id, conversation_id, id)",
+]
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _timestamp_key(timestamp: datetime.datetime) -> int:
+    # microseconds since the epoch, activities without a timezone are taken as UTC
+    if not timestamp:
+        timestamp = datetime.datetime.min
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return (timestamp - _EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def _from_timestamp_key(key: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(microseconds=key)
+
+
+class SqliteTranscriptStore(TranscriptStore):
+    """Stores the transcripts in a SQLite database file, which the processes of a bot on one host can share.
+
+    :param path: The path of the database file, created if needed
+    :type path: str
+    :param timeout: Optional, the seconds a write waits for the writes of other processes
+    :type timeout: float
+
+    .. remarks::
+        The activities are indexed by channel, conversation and timestamp, and are paged in timestamp
+        order. The statements run on a thread of their own, which keeps the event loop free.
+    """
+
+    PAGE_SIZE = 20
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self._database = _SqliteDatabase(path, _SCHEMA, timeout)
+
+    async def log_activity(self, activity: Activity) -> None:
+        if not activity:
+            raise TypeError("activity cannot be None for log_activity()")
+
+        await self.log_activities([activity])
+
+    async def log_activities(self, activities: List[Activity]) -> None:
+        rows = []
+        for activity in activities:
+            if not activity:
+                raise TypeError("activity cannot be None for log_activities()")
+
+            rows.append(
+                (
+                    activity.channel_id,
+                    activity.conversation.id,
+                    _timestamp_key(activity.timestamp),
+                    activity.id,
+                    json.dumps(activity.serialize()),
+                )
+            )
+
+        def log(connection: sqlite3.Connection):
+            connection.executemany(
+                "INSERT INTO activities (channel_id, conversation_id, timestamp, id, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        await self._database.run_in_transaction(log)
+
+    async def get_transcript_activities(
+        self,
+        channel_id: str,
+        conversation_id: str,
+        continuation_token: str = None,
+        start_date: datetime = datetime.datetime.min,
+    ) -> "PagedResult[Activity]":
+        if not channel_id:
+            raise TypeError("Missing channel_id")
+
+        if not conversation_id:
+            raise TypeError("Missing conversation_id")
+
+        def get_page(connection: sqlite3.Connection) -> List[str]:
+            # the page starts after the activity of the continuation token
+            after = (_timestamp_key(start_date), -1)
+            if continuation_token:
+                row = connection.execute(
+                    "SELECT timestamp, sequence FROM activities"
+                    " WHERE channel_id = ? AND conversation_id = ? AND id = ?"
+                    " ORDER BY sequence DESC LIMIT 1",
+                    (channel_id, conversation_id, continuation_token),
+                ).fetchone()
+                if row is None:
+                    return []
+                after = max(after, tuple(row))
+
+            return [
+                data
+                for (data,) in connection.execute(
+                    "SELECT data FROM activities"
+                    " WHERE channel_id = ? AND conversation_id = ?"
+                    " AND (timestamp > ? OR (timestamp = ? AND sequence > ?))"
+                    " ORDER BY timestamp, sequence LIMIT ?",
+                    (
+                        channel_id,
+                        conversation_id,
+                        after[0],
+                        after[0],
+                        after[1],
+                        self.PAGE_SIZE,
+                    ),
+                )
+            ]
+
+        paged_result = PagedResult()
+        paged_result.items = [
+            Activity.deserialize(json.loads(data))
+            for data in await self._database.run(get_page)
+        ]
+        if len(paged_result.items) == self.PAGE_SIZE:
+            paged_result.continuation_token = paged_result.items[-1].id
+
+        return paged_result
+
+    async def delete_transcript(self, channel_id: str, conversation_id: str) -> None:
+        if not channel_id:
+            raise TypeError("channel_id should not be None")
+
+        if not conversation_id:
+            raise TypeError("conversation_id should not be None")
+
+        def delete(connection: sqlite3.Connection):
+            connection.execute(
+                "DELETE FROM activities WHERE channel_id = ? AND conversation_id = ?",
+                (channel_id, conversation_id),
+            )
+
+        await self._database.run_in_transaction(delete)
+
+    async def list_transcripts(
+        self, channel_id: str, continuation_token: str = None
+    ) -> "PagedResult[TranscriptInfo]":
+        if not channel_id:
+            raise TypeError("Missing channel_id")
+
+        def get_page(connection: sqlite3.Connection) -> List[tuple]:
+            transcripts = (
+                "SELECT conversation_id, MIN(timestamp) AS created FROM activities"
+                " WHERE channel_id = ? GROUP BY conversation_id"
+            )
+            if not continuation_token:
+                return connection.execute(
+                    f"{transcripts} ORDER BY created DESC, conversation_id DESC LIMIT ?",
+                    (channel_id, self.PAGE_SIZE),
+                ).fetchall()
+
+            # the page starts after the conversation of the continuation token
+            return connection.execute(
+                f"WITH transcripts AS ({transcripts})"
+                " SELECT transcripts.conversation_id, transcripts.created"
+                " FROM transcripts, transcripts AS token"
+                " WHERE token.conversation_id = ?"
+                " AND (transcripts.created < token.created OR (transcripts.created = token.created"
+                " AND transcripts.conversation_id < token.conversation_id))"
+                " ORDER BY transcripts.created DESC, transcripts.conversation_id DESC LIMIT ?",
+                (channel_id, continuation_token, self.PAGE_SIZE),
+            ).fetchall()
+
+        paged_result = PagedResult()
+        paged_result.items = [
+            TranscriptInfo(channel_id, _from_timestamp_key(created), conversation_id)
+            for conversation_id, created in await self._database.run(get_page)
+        ]
+        if len(paged_result.items) == self.PAGE_SIZE:
+            paged_result.continuation_token = paged_result.items[-1].id
+
+        return paged_result
+
+    async def close(self):
+        """
+        Closes the database. It is opened again by the next operation.
+        """
+        await self._database.close()
@@ -0,0 +1,210 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import gzip
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Set, Union
+from jsonpickle.pickler import Pickler
+from jsonpickle.unpickler import Unpickler, loadclass
+from jsonpickle.util import importable_name
+from msrest.serialization import Model
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+_OBJECT_TAG = "py/object"
+_STATE_TAG = "py/state"
+_TAG_PREFIX = "py/"
+_OBJECT_GETSTATE = getattr(object, "__getstate__", None)
+
+
+class StoreItemSerializer(ABC):
+    """
+    Converts store items to and from the data kept by a storage provider.
+
+    .. remarks::
+        :meth:`to_dict` and :meth:`from_dict` convert between store items and JSON compatible data.
+        :meth:`dumps` and :meth:`loads` convert between that data and the text or bytes written to storage.
+    """
+
+    @abstractmethod
+    def to_dict(self, item: object) -> object:
+        """
+        Converts a store item to JSON compatible data.
+        :param item:
+        :return:
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def from_dict(self, data: object) -> object:
+        """
+        Converts JSON compatible data back to a store item.
+        :param data:
+        :return:
+        """
+        raise NotImplementedError()
+
+    def dumps(self, data: object) -> Union[str, bytes]:
+        """
+        Encodes JSON compatible data for storage.
+        :param data:
+        :return:
+        """
+        return json.dumps(data)
+
+    def loads(self, raw: Union[str, bytes]) -> object:
+        """
+        Decodes data written by :meth:`dumps`.
+        :param raw:
+        :return:
+        """
+        return json.loads(raw)
+
+
+class JsonPickleStoreItemSerializer(StoreItemSerializer):
+    """
+    Serializes store items with jsonpickle. This is the default of the storage providers.
+    """
+
+    def to_dict(self, item: object) -> object:
+        return Pickler().flatten(item)
+
+    def from_dict(self, data: object) -> object:
+        return Unpickler().restore(data)
+
+
+class _NotFast(Exception):
+    pass
+
+
+class FastStoreItemSerializer(JsonPickleStoreItemSerializer):
+    """
+    Serializes store items made of plain dicts, lists, scalars and msrest models without jsonpickle
+    introspection, and optionally gzip-compresses large items.
+
+    .. remarks::
+        The data written is the same as jsonpickle's, so it can be read by :class:`JsonPickleStoreItemSerializer`,
+        and data written by jsonpickle can be read by this serializer. Items containing anything else, such as
+        datetimes or other classes, or a list or object found twice, are passed to jsonpickle as a whole.
+        Compressed items are gzip streams, which can't be mistaken for JSON text, so compressed and uncompressed
+        items can be read side by side. Only use compression with storage that accepts bytes.
+    """
+
+    def __init__(self, compression_threshold: int = None, compression_level: int = 6):
+        """
+        Initializes a new instance of the :class:`FastStoreItemSerializer` class.
+
+        :param compression_threshold: Optional, the encoded size in bytes above which items are compressed.
+        Items are never compressed if not set.
+        :type compression_threshold: int
+        :param compression_level: Optional, the gzip compression level
+        :type compression_level: int
+        """
+        self._compression_threshold = compression_threshold
+        self._compression_level = compression_level
+        self._classes: Dict[str, type] = {}
+
+    def to_dict(self, item: object) -> object:
+        try:
+            return self._flatten(item, set())
+        except _NotFast:
+            return super().to_dict(item)
+
+    def from_dict(self, data: object) -> object:
+        try:
+            return self._restore(data)
+        except _NotFast:
+            return super().from_dict(data)
+
+    def dumps(self, data: object) -> Union[str, bytes]:
+        text = json.dumps(data)
+        if self._compression_threshold is None:
+            return text
+
+        encoded = text.encode("utf-8")
+        if len(encoded) <= self._compression_threshold:
+            return text
+        return gzip.compress(encoded, compresslevel=self._compression_level)
+
+    def loads(self, raw: Union[str, bytes]) -> object:
+        if isinstance(raw, (bytes, bytearray)):
+            if raw[:2] == _GZIP_MAGIC:
+                raw = gzip.decompress(raw)
+            raw = raw.decode("utf-8")
+        return json.loads(raw)
+
+    def _flatten(self, obj: object, seen: Set[int]) -> object:
+        obj_type = type(obj)
+        if obj_type in _PLAIN_TYPES:
+            return obj
+        if obj_type is list or isinstance(obj, Model):
+            # jsonpickle writes a list or an object met again as a "py/id" reference to the first one
+            if id(obj) in seen:
+                raise _NotFast()
+            seen.add(id(obj))
+        if obj_type is list:
+            return [self._flatten(value, seen) for value in obj]
+        if obj_type is dict:
+            result = {}
+            for key, value in obj.items():
+                if type(key) is not str or key.startswith(_TAG_PREFIX):
+                    raise _NotFast()
+                result[key] = self._flatten(value, seen)
+            return result
+        if isinstance(obj, Model):
+            state = {
+                key: self._flatten(value, seen) for key, value in vars(obj).items()
+            }
+            getstate = getattr(obj_type, "__getstate__", None)
+            if getstate is None:
+                state[_OBJECT_TAG] = importable_name(obj_type)
+                return state
+            if getstate is _OBJECT_GETSTATE:
+                return {_OBJECT_TAG: importable_name(obj_type), _STATE_TAG: state}
+        raise _NotFast()
+
+    def _restore(self, data: object) -> object:
+        data_type = type(data)
+        if data_type in _PLAIN_TYPES:
+            return data
+        if data_type is list:
+            return [self._restore(value) for value in data]
+        if data_type is not dict:
+            raise _NotFast()
+
+        if _OBJECT_TAG not in data:
+            result = {}
+            for key, value in data.items():
+                if key.startswith(_TAG_PREFIX):
+                    raise _NotFast()
+                result[key] = self._restore(value)
+            return result
+
+        cls = self._load_class(data[_OBJECT_TAG])
+        if _STATE_TAG in data:
+            if len(data) != 2 or type(data[_STATE_TAG]) is not dict:
+                raise _NotFast()
+            state = data[_STATE_TAG]
+        else:
+            state = {key: value for key, value in data.items() if key != _OBJECT_TAG}
+
+        instance = cls.__new__(cls)
+        for key, value in state.items():
+            if key.startswith(_TAG_PREFIX):
+                raise _NotFast()
+            instance.__dict__[key] = self._restore(value)
+        return instance
+
+    def _load_class(self, name: str) -> type:
+        cls = self._classes.get(name)
+        if cls is None:
+            cls = loadclass(name)
+            if (
+                not isinstance(cls, type)
+                or not issubclass(cls, Model)
+                or hasattr(cls, "__setstate__")
+            ):
+                raise _NotFast()
+            self._classes[name] = cls
+        return cls
@@ -4,6 +4,7 @@
 from .bot_framework_http_adapter_base import BotFrameworkHttpAdapterBase
 from .streaming_activity_processor import StreamingActivityProcessor
 from .streaming_http_client import StreamingHttpDriver
+from .streaming_request_dispatcher import StreamingRequestDispatcher
 from .streaming_request_handler import StreamingRequestHandler
 from .version_info import VersionInfo
 
@@ -11,6 +12,7 @@ __all__ = [
     "BotFrameworkHttpAdapterBase",
     "StreamingActivityProcessor",
     "StreamingHttpDriver",
+    "StreamingRequestDispatcher",
     "StreamingRequestHandler",
     "VersionInfo",
 ]
@@ -0,0 +1,104 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import CancelledError, Future, ensure_future, get_event_loop
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Tuple
+
+
+class StreamingRequestDispatcher:
+    """
+    Runs the turns received by streaming connections, in order within a conversation and concurrently
+    across conversations.
+
+    :param max_concurrency: The number of turns that run at once
+    :type max_concurrency: int
+
+    .. remarks::
+        A conversation runs one turn at a time, in the order the turns were dispatched. Conversations
+        with turns waiting for a slot take the free slots in turns, so that a conversation with many
+        activities can't hold the others back. A dispatcher can be shared by several connections to
+        cap their turns together.
+    """
+
+    def __init__(self, max_concurrency: int = 32):
+        if max_concurrency < 1:
+            raise ValueError(
+                "StreamingRequestDispatcher.max_concurrency must be greater than 0"
+            )
+
+        self.max_concurrency = max_concurrency
+        self._turns: Dict[str, Deque[Tuple[Callable[[], Awaitable], Future]]] = {}
+        self._ready: Deque[str] = deque()
+        self._running = 0
+
+    @property
+    def running(self) -> int:
+        """
+        The number of turns running.
+        """
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        """
+        The number of turns waiting to run.
+        """
+        return sum(len(turns) for turns in self._turns.values())
+
+    async def dispatch(
+        self, conversation_id: str, turn: Callable[[], Awaitable]
+    ) -> object:
+        """
+        Runs a turn after the turns dispatched before it for the same conversation.
+
+        :param conversation_id: The id of the conversation of the turn
+        :type conversation_id: str
+        :param turn: Starts the turn
+        :return: The result of the turn
+        """
+        result = get_event_loop().create_future()
+
+        turns = self._turns.get(conversation_id)
+        if turns is None:
+            # the conversation has no turn running or waiting, so it waits for a slot
+            turns = self._turns[conversation_id] = deque()
+            self._ready.append(conversation_id)
+        turns.append((turn, result))
+
+        self._start_turns()
+        return await result
+
+    def _start_turns(self):
+        while self._running < self.max_concurrency and self._ready:
+            conversation_id = self._ready.popleft()
+            turn, result = self._turns[conversation_id].popleft()
+
+            self._running += 1
+            ensure_future(self._run_turn(conversation_id, turn, result))
+
+    async def _run_turn(
+        self, conversation_id: str, turn: Callable[[], Awaitable], result: Future
+    ):
+        try:
+            # the caller can stop waiting before the turn starts
+            if not result.done():
+                value = await turn()
+                if not result.done():
+                    result.set_result(value)
+        except CancelledError:
+            result.cancel()
+            raise
+        except Exception as error:
+            if not result.done():
+                result.set_exception(error)
+        finally:
+            self._running -= 1
+
+            # the next turn of the conversation waits behind the other conversations
+            if self._turns[conversation_id]:
+                self._ready.append(conversation_id)
+            else:
+                del self._turns[conversation_id]
+
+            self._start_turns()
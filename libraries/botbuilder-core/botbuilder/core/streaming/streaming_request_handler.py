@@ -24,6 +24,7 @@ from botframework.streaming.transport import DisconnectedEventArgs
 from botframework.streaming.transport.web_socket import WebSocket, WebSocketServer
 
 from .streaming_activity_processor import StreamingActivityProcessor
+from .streaming_request_dispatcher import StreamingRequestDispatcher
 from .version_info import VersionInfo
 
 
@@ -40,6 +41,7 @@ class StreamingRequestHandler(RequestHandler):
         activity_processor: StreamingActivityProcessor,
         web_socket: WebSocket,
         logger: Logger = None,
+        dispatcher: StreamingRequestDispatcher = None,
     ):
         if not bot:
             raise TypeError(f"'bot: {bot.__class__.__name__}' argument can't be None")
@@ -51,6 +53,7 @@ class StreamingRequestHandler(RequestHandler):
         self._bot = bot
         self._activity_processor = activity_processor
         self._logger = logger
+        self._dispatcher = dispatcher or StreamingRequestDispatcher()
         self._conversations: Dict[str, datetime] = {}
         self._user_agent = StreamingRequestHandler._get_user_agent()
         self._server = WebSocketServer(web_socket, self)
@@ -139,10 +142,12 @@ class StreamingRequestHandler(RequestHandler):
                     activity.attachments = stream_attachments
 
             # Now that the request has been converted into an activity we can send it to the adapter.
-            adapter_response = (
-                await self._activity_processor.process_streaming_activity(
+            # The dispatcher keeps the activities of a conversation in order and caps the turns running at once.
+            adapter_response = await self._dispatcher.dispatch(
+                activity.conversation.id,
+                lambda: self._activity_processor.process_streaming_activity(
                     activity, self._bot.on_turn
-                )
+                ),
             )
 
             # Now we convert the invokeResponse returned by the adapter into a StreamingResponse we can send back
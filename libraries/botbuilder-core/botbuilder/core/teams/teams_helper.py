@@ -22,16 +22,17 @@ DEPENDICIES += [
 ]
 DEPENDICIES_DICT = {dependency.__name__: dependency for dependency in DEPENDICIES}
 
+_SERIALIZER = Serializer(DEPENDICIES_DICT)
+_DESERIALIZER = Deserializer(DEPENDICIES_DICT)
+
 
 def deserializer_helper(msrest_cls: Type[Model], dict_to_deserialize: dict) -> Model:
-    deserializer = Deserializer(DEPENDICIES_DICT)
-    return deserializer(msrest_cls.__name__, dict_to_deserialize)
+    return _DESERIALIZER(msrest_cls.__name__, dict_to_deserialize)
 
 
 def serializer_helper(object_to_serialize: Model) -> dict:
     if object_to_serialize is None:
         return None
 
-    serializer = Serializer(DEPENDICIES_DICT)
     # pylint: disable=protected-access
-    return serializer._serialize(object_to_serialize)
+    return _SERIALIZER._serialize(object_to_serialize)
@@ -30,6 +30,17 @@ class TranscriptLogger(ABC):
         """
         raise NotImplementedError
 
+    async def log_activities(self, activities: List[Activity]) -> None:
+        """Log activities to the transcript, in order.
+        :param activities: Activities being logged.
+
+        .. remarks::
+            Logs the activities one at a time with `log_activity`. Stores that can write several
+            activities at once override this.
+        """
+        for activity in activities:
+            await self.log_activity(activity)
+
 
 class TranscriptLoggerMiddleware(Middleware):
     """Logs incoming and outgoing activities to a TranscriptStore."""
@@ -134,13 +145,17 @@ class TranscriptLoggerMiddleware(Middleware):
             await logic()
 
         # Flush transcript at end of turn
+        activities = []
         while not transcript.empty():
             activity = transcript.get()
             if activity is None:
                 break
-            await self.logger.log_activity(activity)
+            activities.append(activity)
             transcript.task_done()
 
+        if activities:
+            await self.logger.log_activities(activities)
+
     async def log_activity(self, transcript: Queue, activity: Activity) -> None:
         """Logs the activity.
         :param transcript: transcript.
@@ -17,6 +17,33 @@ from botbuilder.schema import (
 )
 from .re_escape import escape
 
+_JSON_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+class _NotJson(Exception):
+    pass
+
+
+def _copy_json(value: object, seen: set) -> object:
+    # copies plain JSON data faster than deepcopy, which handles any object
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value
+    if id(value) in seen:
+        # deepcopy keeps the shared references
+        raise _NotJson()
+    seen.add(id(value))
+    if value_type is list:
+        return [_copy_json(item, seen) for item in value]
+    if value_type is dict:
+        result = {}
+        for key, item in value.items():
+            if type(key) is not str:
+                raise _NotJson()
+            result[key] = _copy_json(item, seen)
+        return result
+    raise _NotJson()
+
 
 class TurnContext:
     # Same constant as in the BF Adapter, duplicating here to avoid circular dependency
@@ -193,7 +220,9 @@ class TurnContext:
 
         output = [
             activity_validator(
-                TurnContext.apply_conversation_reference(deepcopy(act), ref)
+                TurnContext.apply_conversation_reference(
+                    TurnContext._copy_outgoing_activity(act), ref
+                )
             )
             for act in activities
         ]
@@ -317,6 +346,26 @@ class TurnContext:
 
         return await self.send_activity(trace_activity)
 
+    @staticmethod
+    def _copy_outgoing_activity(activity: Activity) -> Activity:
+        """
+        Copies an activity before it is sent, so that the send handlers don't change the caller's activity.
+
+        .. remarks::
+            The content of the attachments, such as an Adaptive Card, is often large. When it's plain JSON
+            data it is copied without deepcopy, which is much slower.
+        """
+        # deepcopy reuses the objects already in its memo
+        memo = {}
+        for attachment in activity.attachments or []:
+            content = getattr(attachment, "content", None)
+            if content is not None and id(content) not in memo:
+                try:
+                    memo[id(content)] = _copy_json(content, set())
+                except _NotJson:
+                    pass
+        return deepcopy(activity, memo)
+
     @staticmethod
     def get_conversation_reference(activity: Activity) -> ConversationReference:
         """
@@ -35,6 +35,7 @@ setup(
     packages=[
         "botbuilder.core",
         "botbuilder.core.adapters",
+        "botbuilder.core.benchmarks",
         "botbuilder.core.inspection",
         "botbuilder.core.integration",
         "botbuilder.core.skills",
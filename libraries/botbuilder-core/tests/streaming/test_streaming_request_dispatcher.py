@@ -0,0 +1,91 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+from typing import List
+
+import aiounittest
+
+from botbuilder.core.streaming import StreamingRequestDispatcher
+
+
+class TestStreamingRequestDispatcher(aiounittest.AsyncTestCase):
+    async def test_max_concurrency_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            StreamingRequestDispatcher(max_concurrency=0)
+
+    async def test_turns_of_a_conversation_run_in_order(self):
+        sut = StreamingRequestDispatcher()
+        events: List[str] = []
+
+        def create_turn(name: str, delay: float):
+            async def turn():
+                events.append(f"start {name}")
+                await asyncio.sleep(delay)
+                events.append(f"end {name}")
+                return name
+
+            return turn
+
+        results = await asyncio.gather(
+            sut.dispatch("a", create_turn("a1", 0.02)),
+            sut.dispatch("a", create_turn("a2", 0)),
+            sut.dispatch("b", create_turn("b1", 0)),
+        )
+
+        self.assertEqual(["a1", "a2", "b1"], results)
+        self.assertLess(events.index("end a1"), events.index("start a2"))
+        # the other conversation doesn't wait for the first one
+        self.assertLess(events.index("end b1"), events.index("end a1"))
+        self.assertEqual(0, sut.running)
+        self.assertEqual(0, sut.waiting)
+
+    async def test_concurrency_is_capped(self):
+        sut = StreamingRequestDispatcher(max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def turn():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            *[sut.dispatch(f"conversation-{index}", turn) for index in range(6)]
+        )
+
+        self.assertEqual(2, max_running)
+
+    async def test_conversations_take_turns(self):
+        sut = StreamingRequestDispatcher(max_concurrency=1)
+        order: List[str] = []
+
+        def create_turn(name: str):
+            async def turn():
+                order.append(name)
+                await asyncio.sleep(0)
+
+            return turn
+
+        # the chatty conversation dispatches all its turns first
+        dispatched = [sut.dispatch("chatty", create_turn(f"c{i}")) for i in range(3)]
+        dispatched += [sut.dispatch("quiet", create_turn("q0"))]
+        dispatched += [sut.dispatch("other", create_turn("o0"))]
+        await asyncio.gather(*dispatched)
+
+        self.assertEqual(["c0", "q0", "o0", "c1", "c2"], order)
+
+    async def test_errors_are_raised_to_the_caller(self):
+        sut = StreamingRequestDispatcher()
+
+        async def failing_turn():
+            raise RuntimeError("turn failed")
+
+        async def turn():
+            return "ok"
+
+        with self.assertRaises(RuntimeError):
+            await sut.dispatch("a", failing_turn)
+        self.assertEqual("ok", await sut.dispatch("a", turn))
@@ -1,12 +1,23 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import json
 from unittest.mock import Mock
-from typing import Any
+from typing import Any, Awaitable, Callable, List
+from uuid import uuid4
 
 import aiounittest
 
-from botbuilder.core.streaming import StreamingRequestHandler
+from botbuilder.core.benchmarks import streaming_request_handler_benchmark
+from botbuilder.core.streaming import (
+    StreamingActivityProcessor,
+    StreamingRequestDispatcher,
+    StreamingRequestHandler,
+)
+from botbuilder.schema import Activity
+from botframework.streaming import ReceiveRequest
+from botframework.streaming.payloads import ContentStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.transport.web_socket import (
     WebSocket,
     WebSocketState,
@@ -42,6 +53,26 @@ class MockWebSocket(WebSocket):
         return WebSocketState.OPEN
 
 
+class RecordingDispatcher(StreamingRequestDispatcher):
+    def __init__(self):
+        super().__init__()
+        self.conversation_ids: List[str] = []
+
+    async def dispatch(
+        self, conversation_id: str, turn: Callable[[], Awaitable]
+    ) -> object:
+        self.conversation_ids.append(conversation_id)
+        return await super().dispatch(conversation_id, turn)
+
+
+class MockActivityProcessor(StreamingActivityProcessor):
+    def __init__(self):
+        self.activities: List[Activity] = []
+
+    async def process_streaming_activity(self, activity, bot_callback_handler):
+        self.activities.append(activity)
+
+
 class TestStramingRequestHandler(aiounittest.AsyncTestCase):
     async def test_listen(self):
         mock_bot = Mock()
@@ -54,3 +85,36 @@ class TestStramingRequestHandler(aiounittest.AsyncTestCase):
         await sut.listen()
 
         assert mock_web_socket.receive_called
+
+    def test_benchmark_runs(self):
+        results = streaming_request_handler_benchmark.run(number=20)
+
+        assert len(results) == 3
+        assert all(measures["requests_per_second"] > 0 for measures in results.values())
+
+    async def test_process_request_dispatches_by_conversation(self):
+        body = json.dumps(
+            {
+                "type": "message",
+                "serviceUrl": "urn:test",
+                "conversation": {"id": "conversation-id"},
+            }
+        ).encode()
+        identifier = uuid4()
+        assembler = PayloadStreamAssembler(None, identifier, length=len(body))
+        content_stream = ContentStream(identifier, assembler)
+        content_stream.stream.give_buffer(body)
+        request = ReceiveRequest(verb="POST", path="/api/messages")
+        request.streams.append(content_stream)
+
+        dispatcher = RecordingDispatcher()
+        activity_processor = MockActivityProcessor()
+        sut = StreamingRequestHandler(
+            Mock(), activity_processor, MockWebSocket(), dispatcher=dispatcher
+        )
+
+        response = await sut.process_request(request, None, None)
+
+        assert response.status_code == 200
+        assert dispatcher.conversation_ids == ["conversation-id"]
+        assert activity_processor.activities[0].conversation.id == "conversation-id"
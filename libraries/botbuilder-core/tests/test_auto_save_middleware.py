@@ -1,7 +1,17 @@
+from unittest.mock import MagicMock
 import aiounittest
-from botbuilder.core import AutoSaveStateMiddleware, BotState, TurnContext
+from botbuilder.core import (
+    AutoSaveStateMiddleware,
+    BotState,
+    BotStateSet,
+    BotStateSetError,
+    ConversationState,
+    MemoryStorage,
+    TurnContext,
+    UserState,
+)
 from botbuilder.core.adapters import TestAdapter
-from botbuilder.schema import Activity
+from botbuilder.schema import Activity, ChannelAccount, ConversationAccount
 
 
 async def aux_func():
@@ -37,6 +47,32 @@ class BotStateMock(BotState):
         return ""
 
 
+class FailingBotStateMock(BotStateMock):
+    async def save_changes(
+        self, turn_context: TurnContext, force: bool = False
+    ) -> None:
+        self.write_called = True
+        raise ValueError(self.state)
+
+
+class SharedKeyBotState(BotState):
+    def get_storage_key(
+        self, turn_context: TurnContext  # pylint: disable=unused-argument
+    ) -> str:
+        return "shared"
+
+
+def create_context() -> TurnContext:
+    return TurnContext(
+        TestAdapter(),
+        Activity(
+            channel_id="test",
+            conversation=ConversationAccount(id="convo1"),
+            from_property=ChannelAccount(id="user1"),
+        ),
+    )
+
+
 class TestAutoSaveMiddleware(aiounittest.AsyncTestCase):
     async def test_should_add_and_call_load_all_on_single_plugin(self):
         adapter = TestAdapter()
@@ -113,3 +149,88 @@ class TestAutoSaveMiddleware(aiounittest.AsyncTestCase):
         assert (
             not middleware.bot_state_set.bot_states
         ), "should not have added any BotState."
+
+    async def test_should_save_states_one_after_another_by_default(self):
+        context = create_context()
+        foo_state = FailingBotStateMock("foo")
+        bar_state = BotStateMock({"bar": "foo"})
+        autosave_middleware = AutoSaveStateMiddleware([foo_state, bar_state])
+
+        with self.assertRaises(ValueError):
+            await autosave_middleware.on_turn(context, aux_func)
+        assert not bar_state.write_called, "write called after 'foo_state' failed."
+
+    async def test_should_save_all_states_when_one_fails(self):
+        context = create_context()
+        foo_state = FailingBotStateMock("foo")
+        bar_state = BotStateMock({"bar": "foo"})
+        autosave_middleware = AutoSaveStateMiddleware(
+            BotStateSet([foo_state, bar_state], concurrent=True)
+        )
+
+        with self.assertRaises(ValueError):
+            await autosave_middleware.on_turn(context, aux_func)
+        assert bar_state.write_called, "write not called for 'bar_state' plugin."
+
+    async def test_should_aggregate_errors_of_concurrent_saves(self):
+        context = create_context()
+        bot_state_set = BotStateSet(
+            [FailingBotStateMock("foo"), FailingBotStateMock("bar")], concurrent=True
+        )
+
+        with self.assertRaises(BotStateSetError) as error:
+            await bot_state_set.save_all_changes(context)
+        self.assertEqual(2, len(error.exception.errors))
+
+    async def test_should_batch_states_sharing_a_storage(self):
+        storage = MemoryStorage()
+        storage.read = MagicMock(side_effect=storage.read)
+        storage.write = MagicMock(side_effect=storage.write)
+        conversation_state = ConversationState(storage)
+        user_state = UserState(storage)
+        bot_state_set = BotStateSet(
+            [conversation_state, user_state], batch_by_storage=True
+        )
+
+        context = create_context()
+        await bot_state_set.load_all(context)
+        self.assertEqual(1, storage.read.call_count)
+
+        await conversation_state.create_property("a").set(context, "convo value")
+        await user_state.create_property("b").set(context, "user value")
+        await bot_state_set.save_all_changes(context)
+        self.assertEqual(1, storage.write.call_count)
+
+        await bot_state_set.save_all_changes(context)
+        self.assertEqual(1, storage.write.call_count)
+
+        context = create_context()
+        read_count = storage.read.call_count
+        await bot_state_set.load_all(context)
+        self.assertEqual(read_count + 1, storage.read.call_count)
+        self.assertEqual(
+            "convo value", await conversation_state.create_property("a").get(context)
+        )
+        self.assertEqual(
+            "user value", await user_state.create_property("b").get(context)
+        )
+
+    async def test_should_write_states_sharing_a_storage_key_separately(self):
+        storage = MemoryStorage()
+        storage.write = MagicMock(side_effect=storage.write)
+        first_state = SharedKeyBotState(storage, "first")
+        second_state = SharedKeyBotState(storage, "second")
+        bot_state_set = BotStateSet([first_state, second_state], batch_by_storage=True)
+
+        context = create_context()
+        await bot_state_set.load_all(context)
+        await first_state.create_property("a").set(context, "first value")
+        await second_state.create_property("b").set(context, "second value")
+        await bot_state_set.save_all_changes(context)
+
+        self.assertEqual(2, storage.write.call_count)
+        written = [call.args[0]["shared"] for call in storage.write.call_args_list]
+        self.assertEqual("first value", written[0]["a"])
+        self.assertEqual("second value", written[1]["b"])
+        self.assertFalse(first_state.get_cached_state(context).is_changed)
+        self.assertFalse(second_state.get_cached_state(context).is_changed)
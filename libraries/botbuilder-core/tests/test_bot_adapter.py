@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
 import uuid
 from typing import List
 import aiounittest
@@ -9,9 +10,11 @@ from botbuilder.core import TurnContext
 from botbuilder.core.adapters import TestAdapter
 from botbuilder.schema import (
     Activity,
+    ActivityTypes,
     ConversationAccount,
     ConversationReference,
     ChannelAccount,
+    ResourceResponse,
 )
 
 from simple_adapter import SimpleAdapter
@@ -84,3 +87,91 @@ class TestBotAdapter(aiounittest.AsyncTestCase):
             raise Exception
 
         await adapter.process_request(TestMessage.message(), handler)
+
+    async def test_send_activities_in_order(self):
+        adapter = SimpleAdapter()
+        sent = []
+
+        async def send_activity(activity: Activity) -> ResourceResponse:
+            await asyncio.sleep(0.01 if activity.text == "first" else 0)
+            sent.append(activity.text)
+            return ResourceResponse(id=activity.text)
+
+        activities = [
+            Activity(type=ActivityTypes.message, text="first"),
+            Activity(type=ActivityTypes.typing, text="typing"),
+            Activity(type=ActivityTypes.message, text="second"),
+        ]
+        responses = (
+            await adapter._send_activities_in_order(  # pylint: disable=protected-access
+                activities, send_activity
+            )
+        )
+
+        self.assertEqual(["first", "typing", "second"], sent)
+        self.assertEqual(sent, [response.id for response in responses])
+
+    async def test_send_parallel_activities(self):
+        adapter = SimpleAdapter()
+        adapter.parallel_activity_types = frozenset([ActivityTypes.typing])
+        typing_sent = asyncio.Event()
+        sent = []
+
+        async def send_activity(activity: Activity) -> ResourceResponse:
+            if activity.type == ActivityTypes.typing:
+                # the message after the typing activity doesn't wait for it
+                await typing_sent.wait()
+            else:
+                typing_sent.set()
+            sent.append(activity.text)
+            return ResourceResponse(id=activity.text)
+
+        activities = [
+            Activity(type=ActivityTypes.typing, text="typing"),
+            Activity(type=ActivityTypes.message, text="message"),
+        ]
+        responses = (
+            await adapter._send_activities_in_order(  # pylint: disable=protected-access
+                activities, send_activity
+            )
+        )
+
+        self.assertEqual(["message", "typing"], sent)
+        self.assertEqual(["typing", "message"], [response.id for response in responses])
+
+    async def test_send_parallel_activities_error(self):
+        adapter = SimpleAdapter()
+        adapter.parallel_activity_types = frozenset([ActivityTypes.trace])
+
+        async def send_activity(activity: Activity) -> ResourceResponse:
+            if activity.type == ActivityTypes.trace:
+                raise Exception("trace failed")
+            return ResourceResponse(id=activity.text)
+
+        with self.assertRaises(Exception) as context:
+            await adapter._send_activities_in_order(  # pylint: disable=protected-access
+                [
+                    Activity(type=ActivityTypes.trace),
+                    Activity(type=ActivityTypes.message, text="message"),
+                ],
+                send_activity,
+            )
+        self.assertEqual("trace failed", str(context.exception))
+
+    async def test_send_parallel_activities_cancelled(self):
+        adapter = SimpleAdapter()
+        adapter.parallel_activity_types = frozenset([ActivityTypes.typing])
+
+        async def send_activity(activity: Activity) -> ResourceResponse:
+            if activity.type == ActivityTypes.typing:
+                raise asyncio.CancelledError()
+            return ResourceResponse(id=activity.text)
+
+        with self.assertRaises(asyncio.CancelledError):
+            await adapter._send_activities_in_order(  # pylint: disable=protected-access
+                [
+                    Activity(type=ActivityTypes.typing),
+                    Activity(type=ActivityTypes.message, text="message"),
+                ],
+                send_activity,
+            )
@@ -502,3 +502,94 @@ class TestBotState(aiounittest.AsyncTestCase):
 
         assert result is not None
         assert result == test_bot_state.get_cached_state(turn_context)
+
+    async def test_in_place_change_of_property_is_saved(self):
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+
+        storage = MemoryStorage({})
+        storage.write = MagicMock(side_effect=storage.write)
+
+        # Turn 0
+        bot_state1 = ConversationState(storage)
+        await bot_state1.create_property("test-name").set(
+            turn_context, TestPocoState(value="test-value")
+        )
+        await bot_state1.save_changes(turn_context)
+        self.assertEqual(storage.write.call_count, 1)
+
+        # Turn 1
+        bot_state2 = ConversationState(storage)
+        poco = await bot_state2.create_property("test-name").get(turn_context)
+        await bot_state2.save_changes(turn_context)
+        self.assertEqual(storage.write.call_count, 1)
+
+        poco.value = "changed-value"
+        await bot_state2.save_changes(turn_context)
+        self.assertEqual(storage.write.call_count, 2)
+
+        # Turn 2
+        bot_state3 = ConversationState(storage)
+        value = (await bot_state3.create_property("test-name").get(turn_context)).value
+        self.assertEqual("changed-value", value)
+
+    async def test_untouched_properties_are_not_hashed(self):
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+
+        storage = MemoryStorage({})
+
+        bot_state1 = ConversationState(storage)
+        await bot_state1.create_property("a").set(turn_context, TestPocoState("a"))
+        await bot_state1.create_property("b").set(turn_context, TestPocoState("b"))
+        await bot_state1.save_changes(turn_context)
+
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+        bot_state2 = ConversationState(storage)
+        await bot_state2.create_property("a").get(turn_context)
+        cached = bot_state2.get_cached_state(turn_context)
+        cached.compute_hash = MagicMock(side_effect=cached.compute_hash)
+
+        self.assertFalse(cached.is_changed)
+        self.assertEqual(cached.compute_hash.call_count, 1)
+
+        await bot_state2.create_property("b").set(turn_context, TestPocoState("c"))
+        self.assertTrue(cached.is_changed)
+        self.assertEqual({"b"}, cached.changed_properties)
+
+    async def test_raw_state_changes_are_saved(self):
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+
+        storage = MemoryStorage({})
+
+        bot_state1 = ConversationState(storage)
+        await bot_state1.load(turn_context)
+        bot_state1.get(turn_context)["test-name"] = "test-value"
+        await bot_state1.save_changes(turn_context)
+
+        bot_state2 = ConversationState(storage)
+        value = await bot_state2.create_property("test-name").get(turn_context)
+        self.assertEqual("test-value", value)
+
+    async def test_full_hash_change_detection(self):
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+
+        storage = MemoryStorage({})
+        storage.write = MagicMock(side_effect=storage.write)
+
+        bot_state = ConversationState(storage)
+        bot_state.track_changes = False
+        test_property = bot_state.create_property("test-name")
+
+        await test_property.set(turn_context, "test-value")
+        await bot_state.save_changes(turn_context)
+        self.assertEqual(storage.write.call_count, 1)
+
+        await test_property.set(turn_context, "test-value")
+        await bot_state.save_changes(turn_context)
+        self.assertEqual(storage.write.call_count, 1)
+
+        self.assertIsNotNone(bot_state.get_cached_state(turn_context).hash)
@@ -0,0 +1,169 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+from typing import List
+
+import aiounittest
+
+from botbuilder.core import (
+    BufferedTranscriptLogger,
+    MemoryTranscriptStore,
+    TranscriptLogger,
+    TranscriptLoggerMiddleware,
+)
+from botbuilder.core.adapters import TestAdapter, TestFlow
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    ConversationAccount,
+    ConversationReference,
+)
+
+
+class BatchRecordingLogger(TranscriptLogger):
+    def __init__(self):
+        self.batches: List[List[Activity]] = []
+        self.fail = False
+
+    async def log_activity(self, activity: Activity) -> None:
+        await self.log_activities([activity])
+
+    async def log_activities(self, activities: List[Activity]) -> None:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise Exception("write failed")
+        self.batches.append(activities)
+
+
+def create_activity(conversation_id: str, text: str) -> Activity:
+    return Activity(
+        type=ActivityTypes.message,
+        channel_id="test",
+        conversation=ConversationAccount(id=conversation_id),
+        text=text,
+    )
+
+
+class TestBufferedTranscriptLogger(aiounittest.AsyncTestCase):
+    async def test_should_batch_activities_per_conversation(self):
+        logger = BatchRecordingLogger()
+        sut = BufferedTranscriptLogger(logger, flush_interval=60)
+
+        await sut.log_activity(create_activity("a", "1"))
+        await sut.log_activity(create_activity("b", "1"))
+        await sut.log_activities([create_activity("a", "2"), create_activity("a", "3")])
+
+        # nothing is written during the turn
+        self.assertEqual([], logger.batches)
+        self.assertEqual(4, sut.buffered)
+
+        await sut.flush()
+
+        self.assertEqual(0, sut.buffered)
+        self.assertEqual(
+            [["1", "2", "3"], ["1"]],
+            [[activity.text for activity in batch] for batch in logger.batches],
+        )
+
+    async def test_should_write_full_batches(self):
+        logger = BatchRecordingLogger()
+        sut = BufferedTranscriptLogger(logger, max_batch_size=2, flush_interval=60)
+
+        await sut.log_activities([create_activity("a", str(i)) for i in range(3)])
+        await sut.log_activity(create_activity("b", "0"))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(
+            [["0", "1"], ["0"], ["2"]],
+            [[activity.text for activity in batch] for batch in logger.batches],
+        )
+        await sut.flush()
+
+    async def test_should_write_after_flush_interval(self):
+        logger = BatchRecordingLogger()
+        sut = BufferedTranscriptLogger(logger, flush_interval=0.01)
+
+        await sut.log_activity(create_activity("a", "1"))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, len(logger.batches))
+        self.assertEqual(0, sut.buffered)
+
+    async def test_should_wait_when_full(self):
+        logger = BatchRecordingLogger()
+        sut = BufferedTranscriptLogger(
+            logger, max_batch_size=2, flush_interval=60, max_buffered_activities=2
+        )
+
+        await sut.log_activities([create_activity("a", str(i)) for i in range(5)])
+
+        # logging waited for the first batches to be written
+        self.assertEqual(2, len(logger.batches))
+        self.assertEqual(1, sut.buffered)
+        await sut.flush()
+
+    async def test_flush_should_raise_write_errors(self):
+        logger = BatchRecordingLogger()
+        logger.fail = True
+        sut = BufferedTranscriptLogger(logger, flush_interval=60)
+
+        await sut.log_activity(create_activity("a", "1"))
+
+        with self.assertRaises(Exception) as context:
+            await sut.flush()
+        self.assertEqual("write failed", str(context.exception))
+        self.assertEqual(0, sut.buffered)
+
+        # the error is raised once
+        await sut.flush()
+
+    async def test_should_write_later_batches_after_a_failed_write(self):
+        logger = BatchRecordingLogger()
+        logger.fail = True
+        sut = BufferedTranscriptLogger(logger, max_batch_size=1, flush_interval=60)
+
+        with self.assertLogs(
+            "botbuilder.core.buffered_transcript_logger", level="ERROR"
+        ) as logs:
+            await sut.log_activity(create_activity("a", "1"))
+            await sut.log_activity(create_activity("b", "1"))
+            await asyncio.sleep(0.01)
+        self.assertEqual(2, len(logs.records))
+        self.assertEqual(0, sut.buffered)
+
+        logger.fail = False
+        await sut.log_activities([create_activity("a", "2"), create_activity("b", "2")])
+        with self.assertRaises(Exception):
+            await sut.flush()
+
+        self.assertEqual(
+            [["2"], ["2"]],
+            [[activity.text for activity in batch] for batch in logger.batches],
+        )
+        self.assertEqual(0, sut.buffered)
+
+    async def test_should_log_turns_through_middleware(self):
+        transcript_store = MemoryTranscriptStore()
+        sut = BufferedTranscriptLogger(transcript_store, flush_interval=60)
+        conversation_id = ""
+
+        async def aux_logic(context):
+            nonlocal conversation_id
+            conversation_id = context.activity.conversation.id
+            await context.send_activity(f"echo:{context.activity.text}")
+
+        adapter = TestAdapter(aux_logic, ConversationReference(channel_id="buffered"))
+        adapter.use(TranscriptLoggerMiddleware(sut))
+
+        test_flow = TestFlow(None, adapter)
+        step1 = await test_flow.send("foo")
+        await step1.assert_reply("echo:foo")
+        await sut.flush()
+
+        paged_result = await transcript_store.get_transcript_activities(
+            "buffered", conversation_id
+        )
+        self.assertEqual(
+            ["foo", "echo:foo"], [activity.text for activity in paged_result.items]
+        )
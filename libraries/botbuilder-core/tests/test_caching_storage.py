@@ -0,0 +1,204 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from unittest.mock import MagicMock
+import pytest
+
+from botbuilder.core import CachingStorage, MemoryStorage
+from botbuilder.testing import StorageBaseTests
+
+
+def get_storage(write_delay: float = None):
+    return CachingStorage(MemoryStorage(), write_delay=write_delay)
+
+
+def get_counting_storage(**kwargs):
+    inner = MemoryStorage()
+    inner.read = MagicMock(side_effect=inner.read)
+    inner.write = MagicMock(side_effect=inner.write)
+    return inner, CachingStorage(inner, **kwargs)
+
+
+@pytest.mark.parametrize("write_delay", [None, 60])
+class TestCachingStorageBaseTests:
+    @pytest.mark.asyncio
+    async def test_return_empty_object_when_reading_unknown_key(self, write_delay):
+        test_ran = await StorageBaseTests.return_empty_object_when_reading_unknown_key(
+            get_storage(write_delay)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_handle_null_keys_when_reading(self, write_delay):
+        test_ran = await StorageBaseTests.handle_null_keys_when_reading(
+            get_storage(write_delay)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_handle_null_keys_when_writing(self, write_delay):
+        test_ran = await StorageBaseTests.handle_null_keys_when_writing(
+            get_storage(write_delay)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_create_object(self, write_delay):
+        test_ran = await StorageBaseTests.create_object(get_storage(write_delay))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_handle_crazy_keys(self, write_delay):
+        test_ran = await StorageBaseTests.handle_crazy_keys(get_storage(write_delay))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_update_object(self, write_delay):
+        test_ran = await StorageBaseTests.update_object(get_storage(write_delay))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_delete_object(self, write_delay):
+        test_ran = await StorageBaseTests.delete_object(get_storage(write_delay))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_perform_batch_operations(self, write_delay):
+        test_ran = await StorageBaseTests.perform_batch_operations(
+            get_storage(write_delay)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_proceeds_through_waterfall(self, write_delay):
+        test_ran = await StorageBaseTests.proceeds_through_waterfall(
+            get_storage(write_delay)
+        )
+
+        assert test_ran
+
+
+class TestCachingStorage:
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_serve_repeated_reads_from_cache(self):
+        inner, storage = get_counting_storage()
+        await inner.write({"a": {"count": 1, "e_tag": "*"}})
+
+        first = await storage.read(["a"])
+        first["a"]["count"] = 2
+        second = await storage.read(["a"])
+
+        assert inner.read.call_count == 1
+        assert second["a"]["count"] == 1
+        assert storage.hit_count == 1
+        assert storage.miss_count == 1
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_cache_written_items_after_write_through(
+        self,
+    ):
+        inner, storage = get_counting_storage()
+        await inner.write({"a": {"count": 1, "e_tag": "*"}})
+
+        for count in range(2, 5):
+            item = (await storage.read(["a"]))["a"]
+            item["count"] = count
+            await storage.write({"a": item})
+
+        # one miss, then each write is read back once and the next turn hits the cache
+        assert storage.miss_count == 1
+        assert storage.hit_count == 2
+        assert inner.read.call_count == 4
+        assert (await inner.read(["a"]))["a"]["count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_drop_failed_write_through(self):
+        inner, storage = get_counting_storage()
+        await inner.write({"a": {"count": 1, "e_tag": "*"}})
+        await inner.write({"a": {"count": 1, "e_tag": "*"}})
+
+        item = (await storage.read(["a"]))["a"]
+        await inner.write({"a": {"count": 10, "e_tag": "*"}})
+        item["count"] = 2
+        with pytest.raises(KeyError):
+            await storage.write({"a": item})
+
+        item = (await storage.read(["a"]))["a"]
+        assert item["count"] == 10
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_coalesce_writes(self):
+        inner, storage = get_counting_storage(write_delay=60)
+        await inner.write({"a": {"count": 0, "e_tag": "*"}})
+        write_count = inner.write.call_count
+
+        for count in range(1, 4):
+            item = (await storage.read(["a"]))["a"]
+            item["count"] = count
+            await storage.write({"a": item})
+
+        assert inner.write.call_count == write_count
+        assert inner.read.call_count == 1
+
+        await storage.flush()
+        assert inner.write.call_count == write_count + 1
+        assert (await inner.read(["a"]))["a"]["count"] == 3
+
+        # the e_tag handed out before the flush is still valid afterwards
+        item = (await storage.read(["a"]))["a"]
+        await storage.flush()
+        item["count"] = 4
+        await storage.write({"a": item})
+        await storage.flush()
+        assert (await inner.read(["a"]))["a"]["count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_reject_stale_e_tag_when_coalescing(self):
+        storage = get_storage(write_delay=60)
+        await storage.write({"a": {"count": 0, "e_tag": "*"}})
+
+        first = (await storage.read(["a"]))["a"]
+        second = (await storage.read(["a"]))["a"]
+        await storage.write({"a": first})
+
+        with pytest.raises(KeyError):
+            await storage.write({"a": second})
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_raise_failed_flush_on_next_write(self):
+        inner, storage = get_counting_storage(write_delay=60)
+        await inner.write({"a": {"count": 0, "e_tag": "*"}})
+        await inner.write({"a": {"count": 0, "e_tag": "*"}})
+
+        item = (await storage.read(["a"]))["a"]
+        await inner.write({"a": {"count": 10, "e_tag": "*"}})
+        item["count"] = 1
+        await storage.write({"a": item})
+
+        with pytest.raises(KeyError):
+            await storage.flush()
+        with pytest.raises(KeyError):
+            await storage.write({"a": item})
+
+        item = (await storage.read(["a"]))["a"]
+        assert item["count"] == 10
+
+    @pytest.mark.asyncio
+    async def test_caching_storage_should_evict_least_recently_used_key(self):
+        inner, storage = get_counting_storage(max_entries=1)
+        await inner.write({"a": {"count": 1}, "b": {"count": 2}})
+
+        await storage.read(["a"])
+        await storage.read(["b"])
+        await storage.read(["a"])
+
+        assert inner.read.call_count == 3
+        assert storage.eviction_count == 2
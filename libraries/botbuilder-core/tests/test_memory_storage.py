@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from unittest.mock import patch
 import pytest
 
 from botbuilder.core import MemoryStorage, StoreItem
@@ -198,3 +199,115 @@ class TestMemoryStorage:
         await storage.delete(["foo", "bar"])
         data = await storage.read(["test"])
         assert len(data.keys()) == 1
+
+
+class TestBoundedMemoryStorage:
+    @pytest.mark.asyncio
+    async def test_memory_storage_write_should_copy_once(self):
+        copies = []
+
+        def snapshot(value):
+            copies.append(value)
+            return dict(value)
+
+        storage = MemoryStorage(snapshot=snapshot)
+        item = {"counter": 1}
+        await storage.write({"test": item})
+
+        assert copies == [item]
+        assert storage.memory["test"] is not item
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_copy_on_read_should_not_return_stored_item(self):
+        storage = MemoryStorage({"test": {"counter": 1}}, copy_on_read=True)
+
+        data = await storage.read(["test"])
+        data["test"]["counter"] = 2
+
+        data = await storage.read(["test"])
+        assert data["test"]["counter"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_evict_least_recently_used_key(self):
+        storage = MemoryStorage(max_entries=2)
+        await storage.write({"a": {"value": 1}, "b": {"value": 2}})
+        await storage.read(["a"])
+        await storage.write({"c": {"value": 3}})
+
+        data = await storage.read(["a", "b", "c"])
+        assert set(data.keys()) == {"a", "c"}
+        assert storage.eviction_count == 1
+        assert storage.hit_count == 3
+        assert storage.miss_count == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_evict_over_max_bytes(self):
+        storage = MemoryStorage(max_bytes=3, size_of=lambda value: value["size"])
+        await storage.write({"a": {"size": 2}})
+        await storage.write({"b": {"size": 2}})
+
+        assert list(storage.memory.keys()) == ["b"]
+        assert storage.total_bytes == 2
+        assert storage.eviction_count == 1
+
+        await storage.delete(["b"])
+        assert storage.total_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_expire_keys(self):
+        with patch("botbuilder.core.memory_storage.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            storage = MemoryStorage(time_to_live=10)
+            await storage.write({"a": {"value": 1}})
+            monotonic.return_value = 105.0
+            await storage.write({"b": {"value": 2}})
+
+            monotonic.return_value = 112.0
+            data = await storage.read(["a", "b"])
+
+        assert set(data.keys()) == {"b"}
+        assert "a" not in storage.memory
+        assert storage.expiration_count == 1
+        assert storage.miss_count == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_expire_initial_keys(self):
+        with patch("botbuilder.core.memory_storage.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            storage = MemoryStorage({"a": {"value": 1}}, time_to_live=10)
+
+            monotonic.return_value = 105.0
+            assert set((await storage.read(["a"])).keys()) == {"a"}
+
+            monotonic.return_value = 111.0
+            data = await storage.read(["a"])
+
+        assert not data
+        assert "a" not in storage.memory
+        assert storage.expiration_count == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_purge_expired_keys_on_write(self):
+        with patch("botbuilder.core.memory_storage.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            storage = MemoryStorage(time_to_live=10)
+            await storage.write({"a": {"value": 1}, "b": {"value": 2}})
+
+            monotonic.return_value = 111.0
+            await storage.write({"c": {"value": 3}})
+
+        assert list(storage.memory.keys()) == ["c"]
+        assert storage.expiration_count == 2
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_not_conflict_with_expired_e_tag(self):
+        with patch("botbuilder.core.memory_storage.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            storage = MemoryStorage(time_to_live=10)
+            await storage.write({"a": {"value": 1, "e_tag": "1"}})
+
+            monotonic.return_value = 111.0
+            await storage.write({"a": {"value": 2, "e_tag": "2"}})
+            data = await storage.read(["a"])
+
+        assert data["a"]["value"] == 2
@@ -89,6 +89,145 @@ class TestMemoryTranscriptStore(aiounittest.AsyncTestCase):
         )
         self.assertEqual(result.items, None)
 
+    async def test_get_activities_in_timestamp_order(self):
+        memory_transcript = MemoryTranscriptStore()
+        conversation_id = "_timestamp_order"
+        date = datetime.datetime.now()
+        activities = self.create_activities(conversation_id, date, count=3)
+        for activity in activities:
+            await memory_transcript.log_activity(activity)
+        result = await memory_transcript.get_transcript_activities(
+            "test", conversation_id
+        )
+        self.assertEqual(
+            sorted(activities, key=lambda x: x.timestamp),
+            result.items,
+        )
+
+    async def test_get_activities_pages(self):
+        memory_transcript = MemoryTranscriptStore()
+        conversation_id = "_pages"
+        date = datetime.datetime.now()
+        activities = self.create_activities(conversation_id, date, count=25)
+        await memory_transcript.log_activities(activities)
+        expected = sorted(activities, key=lambda x: x.timestamp)
+
+        first_page = await memory_transcript.get_transcript_activities(
+            "test", conversation_id
+        )
+        self.assertEqual(expected[:20], first_page.items)
+        self.assertEqual(expected[19].id, first_page.continuation_token)
+
+        second_page = await memory_transcript.get_transcript_activities(
+            "test", conversation_id, first_page.continuation_token
+        )
+        self.assertEqual(expected[20:40], second_page.items)
+        self.assertEqual(expected[39].id, second_page.continuation_token)
+
+        last_page = await memory_transcript.get_transcript_activities(
+            "test", conversation_id, second_page.continuation_token
+        )
+        self.assertEqual(expected[40:], last_page.items)
+        self.assertIsNone(last_page.continuation_token)
+
+    async def test_get_activities_from_start_date(self):
+        memory_transcript = MemoryTranscriptStore()
+        conversation_id = "_start_date"
+        date = datetime.datetime.now()
+        activities = self.create_activities(conversation_id, date, count=5)
+        await memory_transcript.log_activities(activities)
+
+        start_date = date + datetime.timedelta(minutes=4)
+        result = await memory_transcript.get_transcript_activities(
+            "test", conversation_id, start_date=start_date
+        )
+        self.assertEqual(
+            sorted(
+                [x for x in activities if x.timestamp >= start_date],
+                key=lambda x: x.timestamp,
+            ),
+            result.items,
+        )
+
+    async def test_stores_are_separate(self):
+        memory_transcript = MemoryTranscriptStore()
+        conversation_id = "_separate"
+        date = datetime.datetime.now()
+        await memory_transcript.log_activities(
+            self.create_activities(conversation_id, date, count=1)
+        )
+        result = await MemoryTranscriptStore().get_transcript_activities(
+            "test", conversation_id
+        )
+        self.assertIsNone(result.items)
+
+    async def test_retention(self):
+        memory_transcript = MemoryTranscriptStore(
+            max_activities_per_conversation=3, max_conversations=2
+        )
+        date = datetime.datetime.now()
+        activities = self.create_activities("_first", date, count=5)
+        await memory_transcript.log_activities(activities)
+        await memory_transcript.log_activities(
+            self.create_activities("_second", date, count=1)
+        )
+        await memory_transcript.log_activities(
+            self.create_activities("_third", date, count=1)
+        )
+
+        result = await memory_transcript.list_transcripts("test")
+        self.assertEqual(
+            ["_second", "_third"], sorted(transcript.id for transcript in result.items)
+        )
+
+        memory_transcript = MemoryTranscriptStore(max_activities_per_conversation=3)
+        await memory_transcript.log_activities(activities)
+        result = await memory_transcript.get_transcript_activities("test", "_first")
+        # the oldest activities are dropped
+        self.assertEqual(
+            sorted(activities, key=lambda x: x.timestamp)[-3:], result.items
+        )
+
+    async def test_retention_pages(self):
+        memory_transcript = MemoryTranscriptStore(max_activities_per_conversation=25)
+        conversation_id = "_retention_pages"
+        date = datetime.datetime.now()
+        activities = self.create_activities(conversation_id, date, count=30)
+
+        # the activities kept are the most recent ones by timestamp when each activity is logged
+        expected = []
+        for sequence, activity in enumerate(activities):
+            await memory_transcript.log_activity(activity)
+            expected = sorted(
+                expected + [(activity.timestamp, sequence, activity)],
+                key=lambda x: x[:2],
+            )[-25:]
+        expected = [activity for _, _, activity in expected]
+
+        items = []
+        continuation_token = None
+        while True:
+            page = await memory_transcript.get_transcript_activities(
+                "test", conversation_id, continuation_token
+            )
+            items += page.items
+            continuation_token = page.continuation_token
+            if not continuation_token:
+                break
+        self.assertEqual(expected, items)
+        self.assertEqual(expected, memory_transcript.channels["test"][conversation_id])
+
+    async def test_channels(self):
+        memory_transcript = MemoryTranscriptStore()
+        date = datetime.datetime.now()
+        activities = self.create_activities("_first", date, count=2)
+        await memory_transcript.log_activities(activities)
+
+        self.assertEqual(
+            {"test": {"_first": sorted(activities, key=lambda x: x.timestamp)}},
+            memory_transcript.channels,
+        )
+
     def create_activities(self, conversation_id: str, date: datetime, count: int = 5):
         activities: List[Activity] = []
         time_stamp = date
@@ -264,3 +264,65 @@ class TestMiddlewareSet(aiounittest.AsyncTestCase):
             raise AssertionError(
                 "MiddlewareSet.use(): should not have added an invalid middleware."
             )
+
+    async def test_use_registers_all_middleware(self):
+        calls = []
+
+        async def first(context, logic):
+            calls.append("first")
+            return await logic()
+
+        async def second(context, logic):
+            calls.append("second")
+            return await logic()
+
+        middleware_set = MiddlewareSet().use(
+            AnonymousReceiveMiddleware(first), AnonymousReceiveMiddleware(second)
+        )
+
+        await middleware_set.receive_activity(None)
+        assert calls == ["first", "second"]
+
+    async def test_middleware_added_after_a_turn_runs(self):
+        calls = []
+
+        async def first(context, logic):
+            calls.append("first")
+            return await logic()
+
+        async def second(context, logic):
+            calls.append("second")
+            return await logic()
+
+        middleware_set = MiddlewareSet().use(AnonymousReceiveMiddleware(first))
+        await middleware_set.receive_activity(None)
+        middleware_set.use(AnonymousReceiveMiddleware(second))
+        await middleware_set.receive_activity(None)
+
+        assert calls == ["first", "first", "second"]
+
+    async def test_timing_hook(self):
+        timings = []
+
+        async def processor(context, logic):
+            return await logic()
+
+        async def failing_processor(context, logic):
+            raise ValueError("middleware failed")
+
+        first = AnonymousReceiveMiddleware(processor)
+        second = AnonymousReceiveMiddleware(failing_processor)
+        middleware_set = MiddlewareSet(
+            timing_hook=lambda middleware, context, duration: timings.append(
+                (middleware, context, duration)
+            )
+        ).use(first, second)
+
+        with self.assertRaises(ValueError):
+            await middleware_set.receive_activity("context")
+
+        assert [(middleware, context) for middleware, context, _ in timings] == [
+            (second, "context"),
+            (first, "context"),
+        ]
+        assert timings[1][2] >= timings[0][2] >= 0
@@ -0,0 +1,48 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import aiounittest
+
+from botbuilder.core.benchmarks import serializer_helper_benchmark
+from botbuilder.core.serializer_helper import deserializer_helper, serializer_helper
+from botbuilder.schema import Activity, ChannelAccount
+
+
+class TestSerializerHelper(aiounittest.AsyncTestCase):
+    def test_round_trip(self):
+        activity = serializer_helper_benchmark.create_activity()
+
+        data = serializer_helper(activity)
+        result = deserializer_helper(Activity, data)
+
+        assert data["from"] == {"id": "user-id", "name": "User"}
+        assert result.from_property == ChannelAccount(id="user-id", name="User")
+        assert serializer_helper(result) == data
+
+    def test_empty_objects_are_cleaned(self):
+        data = {
+            "type": "message",
+            "from": "",
+            "relatesTo": {},
+            "text": "",
+            "recipient": {"id": "bot-id"},
+        }
+
+        result = deserializer_helper(Activity, data)
+
+        assert data["from"] is None
+        assert data["relatesTo"] is None
+        assert data["text"] == ""
+        assert result.from_property is None
+        assert result.relates_to is None
+        assert result.text == ""
+        assert result.recipient == ChannelAccount(id="bot-id")
+
+    def test_serialize_none(self):
+        assert serializer_helper(None) is None
+
+    def test_benchmark_runs(self):
+        results = serializer_helper_benchmark.run(number=1)
+
+        assert len(results) == 4
+        assert all(microseconds > 0 for microseconds in results.values())
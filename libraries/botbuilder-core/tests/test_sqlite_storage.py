@@ -0,0 +1,148 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import pytest
+
+from botbuilder.core import FastStoreItemSerializer, SqliteStorage, StoreItem
+from botbuilder.testing import StorageBaseTests
+
+
+def get_storage(tmp_path, **kwargs):
+    return SqliteStorage(str(tmp_path / "storage.db"), **kwargs)
+
+
+class SimpleStoreItem(StoreItem):
+    def __init__(self, counter=1, e_tag="*"):
+        super(SimpleStoreItem, self).__init__()
+        self.counter = counter
+        self.e_tag = e_tag
+
+
+class TestSqliteStorageBaseTests:
+    @pytest.mark.asyncio
+    async def test_return_empty_object_when_reading_unknown_key(self, tmp_path):
+        test_ran = await StorageBaseTests.return_empty_object_when_reading_unknown_key(
+            get_storage(tmp_path)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_handle_null_keys_when_reading(self, tmp_path):
+        test_ran = await StorageBaseTests.handle_null_keys_when_reading(
+            get_storage(tmp_path)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_handle_null_keys_when_writing(self, tmp_path):
+        test_ran = await StorageBaseTests.handle_null_keys_when_writing(
+            get_storage(tmp_path)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_does_not_raise_when_writing_no_items(self, tmp_path):
+        test_ran = await StorageBaseTests.does_not_raise_when_writing_no_items(
+            get_storage(tmp_path)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_create_object(self, tmp_path):
+        test_ran = await StorageBaseTests.create_object(get_storage(tmp_path))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_handle_crazy_keys(self, tmp_path):
+        test_ran = await StorageBaseTests.handle_crazy_keys(get_storage(tmp_path))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_update_object(self, tmp_path):
+        test_ran = await StorageBaseTests.update_object(get_storage(tmp_path))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_delete_object(self, tmp_path):
+        test_ran = await StorageBaseTests.delete_object(get_storage(tmp_path))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_delete_unknown_object(self, tmp_path):
+        test_ran = await StorageBaseTests.delete_unknown_object(get_storage(tmp_path))
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_perform_batch_operations(self, tmp_path):
+        test_ran = await StorageBaseTests.perform_batch_operations(
+            get_storage(tmp_path)
+        )
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_proceeds_through_waterfall(self, tmp_path):
+        test_ran = await StorageBaseTests.proceeds_through_waterfall(
+            get_storage(tmp_path)
+        )
+
+        assert test_ran
+
+
+class TestSqliteStorage:
+    @pytest.mark.asyncio
+    async def test_sqlite_storage_should_reject_stale_e_tag(self, tmp_path):
+        storage = get_storage(tmp_path)
+        await storage.write({"a": SimpleStoreItem(), "b": SimpleStoreItem()})
+
+        first = await storage.read(["a", "b"])
+        second = await storage.read(["a", "b"])
+        first["a"].counter = 2
+        await storage.write({"a": first["a"]})
+
+        second["a"].counter = 3
+        second["b"].counter = 3
+        with pytest.raises(KeyError):
+            await storage.write({"b": second["b"], "a": second["a"]})
+
+        # the changes of a failed write aren't kept
+        data = await storage.read(["a", "b"])
+        assert data["a"].counter == 2
+        assert data["b"].counter == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_storage_should_be_shared_by_instances(self, tmp_path):
+        first = get_storage(tmp_path)
+        second = get_storage(tmp_path, serializer=FastStoreItemSerializer())
+
+        await first.write({"a": {"counter": 1, "e_tag": "*"}})
+        item = (await second.read(["a"]))["a"]
+        item["counter"] += 1
+        await second.write({"a": item})
+
+        assert (await first.read(["a"]))["a"]["counter"] == 2
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_storage_should_read_many_keys(self, tmp_path):
+        storage = get_storage(tmp_path)
+        keys = [f"key-{index}" for index in range(1200)]
+        await storage.write({key: {"key": key} for key in keys})
+
+        data = await storage.read(list(reversed(keys)) + ["unknown"])
+
+        assert list(data) == list(reversed(keys))
+
+        await storage.delete(keys)
+        assert not await storage.read(keys)
@@ -0,0 +1,182 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import datetime
+import uuid
+from typing import List
+
+import pytest
+
+from botbuilder.core import SqliteTranscriptStore
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    ChannelAccount,
+    ConversationAccount,
+)
+from botframework.connector import Channels
+
+
+def get_store(tmp_path):
+    return SqliteTranscriptStore(str(tmp_path / "transcripts.db"))
+
+
+def create_activities(conversation_id: str, date: datetime, count: int = 5):
+    activities: List[Activity] = []
+    for i in range(count):
+        # every other activity is logged out of timestamp order
+        activities.append(
+            Activity(
+                type=ActivityTypes.message,
+                timestamp=date + datetime.timedelta(minutes=2 * i + 1),
+                id=str(uuid.uuid4()),
+                text=str(i),
+                channel_id=Channels.test,
+                from_property=ChannelAccount(id=f"User{i}"),
+                conversation=ConversationAccount(id=conversation_id),
+                recipient=ChannelAccount(id="bot1", name="2"),
+                service_url="http://foo.com/api/messages",
+            )
+        )
+        activities.append(
+            Activity(
+                type=ActivityTypes.message,
+                timestamp=date,
+                id=str(uuid.uuid4()),
+                text=str(i),
+                channel_id=Channels.test,
+                from_property=ChannelAccount(id="Bot1", name="2"),
+                conversation=ConversationAccount(id=conversation_id),
+                recipient=ChannelAccount(id=f"User{i}"),
+                service_url="http://foo.com/api/messages",
+            )
+        )
+    return activities
+
+
+def ids_of(activities: List[Activity]) -> List[str]:
+    return [activity.id for activity in activities]
+
+
+def sorted_by_timestamp(activities: List[Activity]) -> List[Activity]:
+    return sorted(activities, key=lambda activity: activity.timestamp)
+
+
+class TestSqliteTranscriptStore:
+    @pytest.mark.asyncio
+    async def test_null_transcript_store(self, tmp_path):
+        with pytest.raises(TypeError):
+            await get_store(tmp_path).log_activity(None)
+
+    @pytest.mark.asyncio
+    async def test_get_activities_in_timestamp_order(self, tmp_path):
+        store = get_store(tmp_path)
+        date = datetime.datetime.now(datetime.timezone.utc)
+        activities = create_activities("conversation", date, count=3)
+        for activity in activities:
+            await store.log_activity(activity)
+
+        result = await store.get_transcript_activities(Channels.test, "conversation")
+
+        assert ids_of(result.items) == ids_of(sorted_by_timestamp(activities))
+        assert result.items[0].conversation.id == "conversation"
+        assert result.continuation_token is None
+
+    @pytest.mark.asyncio
+    async def test_get_activities_pages(self, tmp_path):
+        store = get_store(tmp_path)
+        date = datetime.datetime.now(datetime.timezone.utc)
+        activities = create_activities("conversation", date, count=25)
+        await store.log_activities(activities)
+        expected = ids_of(sorted_by_timestamp(activities))
+
+        pages = []
+        continuation_token = None
+        while True:
+            page = await store.get_transcript_activities(
+                Channels.test, "conversation", continuation_token
+            )
+            pages.append(ids_of(page.items))
+            continuation_token = page.continuation_token
+            if not continuation_token:
+                break
+
+        assert pages == [expected[:20], expected[20:40], expected[40:]]
+
+    @pytest.mark.asyncio
+    async def test_get_activities_from_start_date(self, tmp_path):
+        store = get_store(tmp_path)
+        date = datetime.datetime.now(datetime.timezone.utc)
+        activities = create_activities("conversation", date, count=5)
+        await store.log_activities(activities)
+
+        start_date = date + datetime.timedelta(minutes=4)
+        result = await store.get_transcript_activities(
+            Channels.test, "conversation", start_date=start_date
+        )
+
+        assert ids_of(result.items) == ids_of(
+            sorted_by_timestamp(
+                [
+                    activity
+                    for activity in activities
+                    if activity.timestamp >= start_date
+                ]
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_transcript(self, tmp_path):
+        store = get_store(tmp_path)
+        date = datetime.datetime.now(datetime.timezone.utc)
+        await store.log_activities(create_activities("deleted", date, count=1))
+        await store.log_activities(create_activities("kept", date, count=1))
+
+        await store.delete_transcript(Channels.test, "deleted")
+
+        assert not (
+            await store.get_transcript_activities(Channels.test, "deleted")
+        ).items
+        assert (await store.get_transcript_activities(Channels.test, "kept")).items
+
+    @pytest.mark.asyncio
+    async def test_list_transcripts(self, tmp_path):
+        store = get_store(tmp_path)
+        date = datetime.datetime.now(datetime.timezone.utc)
+        for index in range(25):
+            await store.log_activities(
+                create_activities(
+                    f"conversation-{index:02}",
+                    date + datetime.timedelta(hours=index),
+                    count=1,
+                )
+            )
+
+        first_page = await store.list_transcripts(Channels.test)
+        second_page = await store.list_transcripts(
+            Channels.test, first_page.continuation_token
+        )
+
+        assert [transcript.id for transcript in first_page.items] == [
+            f"conversation-{index:02}" for index in range(24, 4, -1)
+        ]
+        assert first_page.items[0].created == date + datetime.timedelta(hours=24)
+        assert [transcript.id for transcript in second_page.items] == [
+            f"conversation-{index:02}" for index in range(4, -1, -1)
+        ]
+        assert second_page.continuation_token is None
+
+    @pytest.mark.asyncio
+    async def test_transcripts_should_be_shared_by_instances(self, tmp_path):
+        first = get_store(tmp_path)
+        second = get_store(tmp_path)
+        date = datetime.datetime.now(datetime.timezone.utc)
+        activities = create_activities("conversation", date, count=1)
+
+        await first.log_activities(activities)
+        result = await second.get_transcript_activities(Channels.test, "conversation")
+
+        assert ids_of(result.items) == ids_of(sorted_by_timestamp(activities))
+
+        await first.close()
+        await second.close()
@@ -0,0 +1,108 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from datetime import datetime, timezone
+import aiounittest
+import jsonpickle
+
+from botbuilder.core import (
+    FastStoreItemSerializer,
+    JsonPickleStoreItemSerializer,
+    StoreItem,
+)
+from botbuilder.schema import Activity, ChannelAccount
+
+
+class SimpleStoreItem(StoreItem):
+    def __init__(self, counter=1, e_tag="*"):
+        super(SimpleStoreItem, self).__init__()
+        self.counter = counter
+        self.e_tag = e_tag
+
+
+def create_activity() -> Activity:
+    return Activity(
+        type="message",
+        text="hello",
+        from_property=ChannelAccount(id="user1", name="User"),
+        channel_data={"values": [1, 2.5, None, True]},
+    )
+
+
+class TestStoreItemSerializer(aiounittest.AsyncTestCase):
+    def test_fast_serializer_writes_jsonpickle_data(self):
+        serializer = FastStoreItemSerializer()
+        items = [
+            {"dialog_stack": [{"id": "main", "state": {"step": 1}}], "e_tag": "*"},
+            create_activity(),
+        ]
+
+        for item in items:
+            self.assertEqual(
+                JsonPickleStoreItemSerializer().to_dict(item),
+                serializer.to_dict(item),
+            )
+
+    def test_fast_serializer_reads_jsonpickle_data(self):
+        serializer = FastStoreItemSerializer()
+        activity = create_activity()
+
+        restored = serializer.from_dict(jsonpickle.decode(jsonpickle.encode(activity)))
+
+        self.assertIsInstance(restored, Activity)
+        self.assertIsInstance(restored.from_property, ChannelAccount)
+        self.assertEqual(activity.serialize(), restored.serialize())
+
+    def test_fast_serializer_falls_back_to_jsonpickle(self):
+        serializer = FastStoreItemSerializer()
+        timestamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        items = [
+            SimpleStoreItem(counter=3),
+            {"timestamp": timestamp},
+            {1: "not a string key"},
+        ]
+
+        for item in items:
+            data = serializer.to_dict(item)
+            self.assertEqual(JsonPickleStoreItemSerializer().to_dict(item), data)
+
+            restored = serializer.from_dict(data)
+            self.assertEqual(
+                jsonpickle.encode(item),
+                jsonpickle.encode(restored),
+            )
+
+    def test_fast_serializer_keeps_shared_references(self):
+        serializer = FastStoreItemSerializer()
+        values = [1, 2]
+        account = ChannelAccount(id="user1")
+        items = [
+            {"first": values, "second": values},
+            {"first": {"nested": [values]}, "second": values},
+            Activity(from_property=account, recipient=account),
+        ]
+
+        for item in items:
+            data = serializer.to_dict(item)
+            self.assertEqual(JsonPickleStoreItemSerializer().to_dict(item), data)
+
+        restored = serializer.from_dict(serializer.to_dict(items[0]))
+        self.assertIs(restored["first"], restored["second"])
+
+    def test_fast_serializer_compresses_large_items(self):
+        serializer = FastStoreItemSerializer(compression_threshold=100)
+        small = {"text": "small"}
+        large = {"text": "large" * 100}
+
+        small_raw = serializer.dumps(serializer.to_dict(small))
+        large_raw = serializer.dumps(serializer.to_dict(large))
+
+        self.assertIsInstance(small_raw, str)
+        self.assertIsInstance(large_raw, bytes)
+        self.assertLess(len(large_raw), len(large["text"]))
+        self.assertEqual(small, serializer.from_dict(serializer.loads(small_raw)))
+        self.assertEqual(large, serializer.from_dict(serializer.loads(large_raw)))
+        self.assertEqual(
+            small,
+            serializer.loads(JsonPickleStoreItemSerializer().dumps(small).encode()),
+        )
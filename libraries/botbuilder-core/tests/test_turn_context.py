@@ -7,6 +7,7 @@ import aiounittest
 from botbuilder.schema import (
     Activity,
     ActivityTypes,
+    Attachment,
     ChannelAccount,
     ConversationAccount,
     Entity,
@@ -416,3 +417,75 @@ class TestBotContext(aiounittest.AsyncTestCase):
             "name-text", "value-text", "valueType-text", "label-text"
         )
         assert called
+
+    async def test_send_activities_should_not_change_the_callers_activity(self):
+        context = TurnContext(SimpleAdapter(), ACTIVITY)
+        card = {"type": "AdaptiveCard", "body": [{"type": "TextBlock", "text": "a"}]}
+        activity = Activity(
+            type=ActivityTypes.message,
+            text="card",
+            attachments=[
+                Attachment(
+                    content_type="application/vnd.microsoft.card.adaptive",
+                    content=card,
+                )
+            ],
+            entities=[Entity(type="test")],
+        )
+        sent_activity = None
+
+        async def send_handler(context, activities, next_handler_coroutine):
+            nonlocal sent_activity
+            sent_activity = activities[0]
+            activities[0].attachments[0].content_type = "changed"
+            activities[0].attachments.append(Attachment(content_type="added"))
+            activities[0].entities[0].type = "changed"
+            return await next_handler_coroutine()
+
+        context.on_send_activities(send_handler)
+        await context.send_activity(activity)
+
+        assert sent_activity is not activity
+        assert sent_activity.conversation.id == ACTIVITY.conversation.id
+        assert activity.conversation is None
+        assert len(activity.attachments) == 1
+        assert (
+            activity.attachments[0].content_type
+            == "application/vnd.microsoft.card.adaptive"
+        )
+        assert activity.entities[0].type == "test"
+
+    async def test_send_activities_should_not_change_the_callers_card(self):
+        context = TurnContext(SimpleAdapter(), ACTIVITY)
+        card = {"type": "AdaptiveCard", "body": [{"type": "TextBlock", "text": "a"}]}
+        activity = Activity(
+            type=ActivityTypes.message,
+            attachments=[
+                Attachment(
+                    content_type="application/vnd.microsoft.card.adaptive",
+                    content=card,
+                ),
+                Attachment(content_type="test", content=card),
+            ],
+        )
+        sent_activity = None
+
+        async def send_handler(context, activities, next_handler_coroutine):
+            nonlocal sent_activity
+            sent_activity = activities[0]
+            activities[0].attachments[0].content["body"][0]["text"] = "changed"
+            activities[0].attachments[0].content["body"].append({"type": "Image"})
+            return await next_handler_coroutine()
+
+        context.on_send_activities(send_handler)
+        await context.send_activity(activity)
+
+        assert card == {
+            "type": "AdaptiveCard",
+            "body": [{"type": "TextBlock", "text": "a"}],
+        }
+        assert sent_activity.attachments[0].content["body"][0]["text"] == "changed"
+        # the attachments sharing a card still share its copy
+        assert (
+            sent_activity.attachments[0].content is sent_activity.attachments[1].content
+        )
@@ -7,6 +7,7 @@
 
 from .aiohttp_channel_service import aiohttp_channel_service_routes
 from .aiohttp_channel_service_exception_middleware import aiohttp_error_middleware
+from .aiohttp_http_session import aiohttp_http_session_cleanup
 from .bot_framework_http_client import BotFrameworkHttpClient
 from .bot_framework_http_adapter import BotFrameworkHttpAdapter
 from .cloud_adapter import CloudAdapter
@@ -20,6 +21,7 @@ from .configuration_bot_framework_authentication import (
 __all__ = [
     "aiohttp_channel_service_routes",
     "aiohttp_error_middleware",
+    "aiohttp_http_session_cleanup",
     "BotFrameworkHttpClient",
     "BotFrameworkHttpAdapter",
     "CloudAdapter",
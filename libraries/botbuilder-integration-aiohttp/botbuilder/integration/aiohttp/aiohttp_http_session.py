@@ -0,0 +1,18 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from aiohttp.web import Application
+
+from botframework.connector import HttpSessionManager
+
+
+async def aiohttp_http_session_cleanup(
+    app: Application,  # pylint: disable=unused-argument
+):
+    """
+    Closes the HTTP session shared by the outbound calls of the bot when the aiohttp application shuts down.
+
+    .. remarks::
+        Register it with `app.on_cleanup.append(aiohttp_http_session_cleanup)`.
+    """
+    await HttpSessionManager.close()
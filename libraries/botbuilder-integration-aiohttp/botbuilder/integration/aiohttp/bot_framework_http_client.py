@@ -6,7 +6,6 @@ import json
 from typing import Dict, List, Tuple
 from logging import Logger
 
-import aiohttp
 from botbuilder.core import InvokeResponse
 from botbuilder.core.skills import BotFrameworkClient
 from botbuilder.schema import (
@@ -17,6 +16,7 @@ from botbuilder.schema import (
     ChannelAccount,
     RoleTypes,
 )
+from botframework.connector import HttpSessionManager
 from botframework.connector.auth import (
     ChannelProvider,
     CredentialProvider,
@@ -65,7 +65,7 @@ class BotFrameworkHttpClient(BotFrameworkClient):
 
         # Get token for the skill call
         token = (
-            app_credentials.get_access_token()
+            await app_credentials.get_access_token_async()
             if app_credentials.microsoft_app_id
             else None
         )
@@ -127,15 +127,13 @@ class BotFrameworkHttpClient(BotFrameworkClient):
 
         json_content = json.dumps(activity.serialize())
 
-        async with aiohttp.ClientSession() as session:
-            resp = await session.post(
-                to_url,
-                data=json_content.encode("utf-8"),
-                headers=headers_dict,
-            )
-
-        resp.raise_for_status()
-        data = (await resp.read()).decode()
+        async with HttpSessionManager.get_session().post(
+            to_url,
+            data=json_content.encode("utf-8"),
+            headers=headers_dict,
+        ) as resp:
+            resp.raise_for_status()
+            data = (await resp.read()).decode()
         return resp.status, json.loads(data) if data else None
 
     async def post_buffered_activity(
@@ -1,19 +1,21 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from aiohttp import ClientSession, ClientResponse, ClientResponseError
+from aiohttp import ClientResponse, ClientResponseError
 
 from botframework.connector import (
     HttpClientBase,
     HttpClientFactory,
     HttpRequest,
     HttpResponseBase,
+    HttpSessionManager,
 )
 
 
 class _HttpResponseImpl(HttpResponseBase):
-    def __init__(self, client_response: ClientResponse) -> None:
+    def __init__(self, client_response: ClientResponse, content: bytes) -> None:
         self._client_response = client_response
+        self._content = content
 
     @property
     def status_code(self):
@@ -27,17 +29,19 @@ class _HttpResponseImpl(HttpResponseBase):
             return False
 
     async def read_content_str(self) -> str:
-        return (await self._client_response.read()).decode()
+        return self._content.decode()
 
 
 class _HttpClientImplementation(HttpClientBase):
     async def post(self, *, request: HttpRequest) -> HttpResponseBase:
-        async with ClientSession() as session:
-            aio_response = await session.post(
-                request.request_uri, data=request.content, headers=request.headers
-            )
-
-        return _HttpResponseImpl(aio_response)
+        session = HttpSessionManager.get_session()
+        async with session.post(
+            request.request_uri, data=request.content, headers=request.headers
+        ) as aio_response:
+            # read before the connection goes back to the pool
+            content = await aio_response.read()
+
+        return _HttpResponseImpl(aio_response, content)
 
 
 class AioHttpClientFactory(HttpClientFactory):
@@ -0,0 +1,51 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import aiounittest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from botbuilder.integration.aiohttp import aiohttp_http_session_cleanup
+from botbuilder.integration.aiohttp.skills import AioHttpClientFactory
+from botframework.connector import HttpRequest, HttpSessionManager
+
+
+class TestAiohttpHttpSession(aiounittest.AsyncTestCase):
+    async def test_session_is_closed_on_app_cleanup(self):
+        app = web.Application()
+        app.on_cleanup.append(aiohttp_http_session_cleanup)
+        server = TestServer(app)
+        await server.start_server()
+
+        session = HttpSessionManager.get_session()
+        await server.close()
+
+        self.assertTrue(session.closed)
+        self.assertIsNot(session, HttpSessionManager.get_session())
+        await HttpSessionManager.close()
+
+    async def test_http_client_reads_response_from_shared_session(self):
+        async def handler(request):
+            return web.Response(text=await request.text(), status=202)
+
+        app = web.Application()
+        app.router.add_post("/echo", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = AioHttpClientFactory().create_client()
+
+            response = await client.post(
+                request=HttpRequest(
+                    request_uri=str(server.make_url("/echo")),
+                    content="content",
+                    headers={"Content-Type": "text/plain"},
+                )
+            )
+
+            self.assertEqual(202, response.status_code)
+            self.assertTrue(await response.is_succesful())
+            self.assertEqual("content", await response.read_content_str())
+        finally:
+            await HttpSessionManager.close()
+            await server.close()
@@ -1,8 +1,11 @@
 from unittest.mock import Mock
 
 import aiounittest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from botbuilder.schema import ConversationAccount, ChannelAccount, RoleTypes
 from botbuilder.integration.aiohttp import BotFrameworkHttpClient
+from botframework.connector import HttpSessionManager
 from botframework.connector.auth import CredentialProvider, Activity
 
 
@@ -70,3 +73,35 @@ class TestBotFrameworkHttpClient(aiounittest.AsyncTestCase):
 
         assert activity.recipient.id == skill_recipient_id
         assert activity.recipient.role is RoleTypes.skill
+
+    async def test_post_content_uses_shared_session(self):
+        ports = set()
+
+        async def handler(request):
+            ports.add(request.transport.get_extra_info("peername")[1])
+            body = await request.json()
+            return web.json_response({"id": body["id"]}, status=201)
+
+        app = web.Application()
+        app.router.add_post("/api/messages", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = BotFrameworkHttpClient(
+                credential_provider=Mock(spec=CredentialProvider)
+            )
+            to_url = str(server.make_url("/api/messages"))
+
+            for activity_id in ["1", "2"]:
+                activity = Activity(
+                    id=activity_id, conversation=ConversationAccount(id="conv")
+                )
+                # pylint: disable=protected-access
+                status, content = await client._post_content(to_url, None, activity)
+
+                self.assertEqual(201, status)
+                self.assertEqual({"id": activity_id}, content)
+            self.assertEqual(1, len(ports))
+        finally:
+            await HttpSessionManager.close()
+            await server.close()
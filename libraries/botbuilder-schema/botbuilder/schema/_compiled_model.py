@@ -0,0 +1,206 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Dict, List, Tuple
+
+from msrest.serialization import Deserializer, Model, Serializer
+
+_STR = 0
+_BOOL = 1
+_MODEL = 2
+_MODEL_LIST = 3
+_OTHER = 4
+
+# the msrest key syntax for flattened and escaped keys
+_UNSUPPORTED_KEY_CHARACTERS = (".", "\\")
+
+
+class CompiledModel(Model):
+    """
+    A msrest :class:`Model` whose :meth:`serialize` and :meth:`deserialize` use a codec compiled
+    once per class from its `_attribute_map`, instead of walking the map on every call.
+
+    .. remarks::
+        The output is the same as msrest's. Strings, booleans and nested compiled models are
+        converted directly, every other value is handed to a shared msrest serializer.
+        Calls with extra arguments, input that isn't a dict, and any input the codec fails on
+        go through msrest, which also raises its usual errors.
+    """
+
+    def serialize(self, keep_readonly=False, **kwargs):
+        if not kwargs:
+            codec = _get_codec(type(self))
+            if codec is not None:
+                try:
+                    return codec.serialize(self, keep_readonly)
+                except Exception:  # pylint: disable=broad-except
+                    pass
+        return super().serialize(keep_readonly=keep_readonly, **kwargs)
+
+    @classmethod
+    def deserialize(cls, data, content_type=None):
+        if (
+            content_type is None and type(data) is dict
+        ):  # pylint: disable=unidiomatic-typecheck
+            codec = _get_codec(cls)
+            if codec is not None:
+                try:
+                    return codec.deserialize(data)
+                except Exception:  # pylint: disable=broad-except
+                    pass
+        return super().deserialize(data, content_type=content_type)
+
+
+_CODECS: Dict[type, "_ModelCodec"] = {}
+
+
+def _get_codec(model_cls: type) -> "_ModelCodec":
+    try:
+        return _CODECS[model_cls]
+    except KeyError:
+        pass
+
+    codec = None
+    if issubclass(model_cls, CompiledModel) and _is_compilable(model_cls):
+        codec = _ModelCodec(model_cls)
+    _CODECS[model_cls] = codec
+    if codec is not None:
+        # nested codecs are compiled after registering this one, so that cycles resolve
+        codec.compile()
+    return codec
+
+
+def _is_compilable(model_cls: type) -> bool:
+    # pylint: disable=protected-access
+    attribute_map = model_cls._attribute_map
+    keys = [desc["key"] for desc in attribute_map.values()]
+    return (
+        not model_cls.is_xml_model()
+        and not model_cls.__dict__.get("_subtype_map")
+        and not any(model_cls._validation.values())
+        and "additional_properties" not in attribute_map
+        and len(set(keys)) == len(keys)
+        and all(
+            key and not any(char in key for char in _UNSUPPORTED_KEY_CHARACTERS)
+            for key in keys
+        )
+    )
+
+
+class _ModelCodec:
+    def __init__(self, model_cls: type):
+        # pylint: disable=protected-access
+        self._model_cls = model_cls
+        self._dependencies = model_cls._infer_class_models()
+        self._serializer = Serializer(self._dependencies)
+        self._deserializer = Deserializer(self._dependencies)
+        self._known_keys = frozenset(
+            desc["key"] for desc in model_cls._attribute_map.values()
+        )
+        self._fields: List[Tuple[str, str, int, str, dict, "_ModelCodec"]] = []
+
+    def compile(self):
+        # pylint: disable=protected-access
+        for attr, desc in self._model_cls._attribute_map.items():
+            data_type = desc["type"]
+            kind = _OTHER
+            nested = None
+            if data_type == "str":
+                kind = _STR
+            elif data_type == "bool":
+                kind = _BOOL
+            elif data_type.startswith("[") and data_type.endswith("]"):
+                nested = self._get_dependency_codec(data_type[1:-1])
+                if nested is not None:
+                    kind = _MODEL_LIST
+            else:
+                nested = self._get_dependency_codec(data_type)
+                if nested is not None:
+                    kind = _MODEL
+            self._fields.append((attr, desc["key"], kind, data_type, desc, nested))
+
+    def _get_dependency_codec(self, type_name: str) -> "_ModelCodec":
+        dependency = self._dependencies.get(type_name)
+        if isinstance(dependency, type) and issubclass(dependency, CompiledModel):
+            return _get_codec(dependency)
+        return None
+
+    def serialize(self, model: Model, keep_readonly: bool) -> dict:
+        # pylint: disable=unidiomatic-typecheck
+        values = model.__dict__
+        serialized = {}
+        for attr, key, kind, data_type, desc, _ in self._fields:
+            value = values[attr]
+            if value is None:
+                continue
+            value_type = type(value)
+            if kind == _STR and value_type is str:
+                serialized[key] = value
+            elif kind == _BOOL and value_type is bool:
+                serialized[key] = value
+            elif kind == _MODEL and _get_codec(value_type) is not None:
+                serialized[key] = _CODECS[value_type].serialize(value, keep_readonly)
+            elif kind == _MODEL_LIST and value_type is list:
+                serialized[key] = [
+                    self._serialize_item(item, data_type[1:-1], desc, keep_readonly)
+                    for item in value
+                ]
+            else:
+                serialized[key] = self._serializer.serialize_data(
+                    value,
+                    data_type,
+                    keep_readonly=keep_readonly,
+                    is_xml=False,
+                    serialization_ctxt=desc,
+                )
+        return serialized
+
+    def _serialize_item(
+        self, item: object, data_type: str, desc: dict, keep_readonly: bool
+    ) -> object:
+        if item is None:
+            return None
+        codec = _get_codec(type(item))
+        if codec is not None:
+            return codec.serialize(item, keep_readonly)
+        return self._serializer.serialize_data(
+            item,
+            data_type,
+            keep_readonly=keep_readonly,
+            is_xml=False,
+            serialization_ctxt=desc,
+        )
+
+    def deserialize(self, data: dict) -> Model:
+        # pylint: disable=unidiomatic-typecheck
+        attrs = {}
+        for attr, key, kind, data_type, _, nested in self._fields:
+            value = data.get(key)
+            value_type = type(value)
+            if value is None:
+                attrs[attr] = None
+            elif kind == _STR and value_type is str:
+                attrs[attr] = value
+            elif kind == _BOOL and value_type is bool:
+                attrs[attr] = value
+            elif kind == _MODEL and value_type is dict:
+                attrs[attr] = nested.deserialize(value)
+            elif kind == _MODEL_LIST and value_type is list:
+                attrs[attr] = [
+                    (
+                        nested.deserialize(item)
+                        if type(item) is dict
+                        else self._deserializer.deserialize_data(item, data_type[1:-1])
+                    )
+                    for item in value
+                ]
+            else:
+                attrs[attr] = self._deserializer.deserialize_data(value, data_type)
+
+        model = self._model_cls(**attrs)
+        additional_properties = {
+            key: value for key, value in data.items() if key not in self._known_keys
+        }
+        if additional_properties:
+            model.additional_properties = additional_properties
+        return model
@@ -9,6 +9,8 @@ from enum import Enum
 from msrest.serialization import Model
 from msrest.exceptions import HttpOperationError
 
+from ._compiled_model import CompiledModel
+
 
 class ActivityEventNames(str, Enum):
     continue_conversation = "ContinueConversation"
@@ -111,7 +113,7 @@ class ResourceResponse(Model):
         self.id = id
 
 
-class Activity(Model):
+class Activity(CompiledModel):
     """An Activity is the basic communication type for the Bot Framework 3.0
     protocol.
 
@@ -937,7 +939,7 @@ class AnimationCard(Model):
         self.value = value
 
 
-class Attachment(Model):
+class Attachment(CompiledModel):
     """An attachment within an activity.
 
     :param content_type: mimetype/Contenttype for the file
@@ -1274,7 +1276,7 @@ class CardImage(Model):
         self.tap = tap
 
 
-class ChannelAccount(Model):
+class ChannelAccount(CompiledModel):
     """Channel account information needed to route a message.
 
     :param id: Channel id for the user or bot on this channel (Example:
@@ -1316,7 +1318,7 @@ class ChannelAccount(Model):
         self.properties = properties
 
 
-class ConversationAccount(Model):
+class ConversationAccount(CompiledModel):
     """Conversation account represents the identity of the conversation within a channel.
 
     :param is_group: Indicates whether the conversation contains more than two
@@ -1521,7 +1523,7 @@ class ExpectedReplies(Model):
         self.activities = activities
 
 
-class Entity(Model):
+class Entity(CompiledModel):
     """Metadata object pertaining to an activity.
 
     :param type: Type of this entity (RFC 3987 IRI)
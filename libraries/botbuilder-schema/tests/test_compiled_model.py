@@ -0,0 +1,192 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+
+import aiounittest
+from msrest.exceptions import DeserializationError
+from msrest.serialization import Model
+
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    Attachment,
+    CardAction,
+    ChannelAccount,
+    ConversationAccount,
+    ConversationReference,
+    Entity,
+    Mention,
+    MessageReaction,
+    SuggestedActions,
+    TextHighlight,
+)
+from botbuilder.schema._compiled_model import CompiledModel
+from botbuilder.schema.teams import TeamsChannelAccount
+
+
+def msrest_serialize(model: Model) -> dict:
+    return Model.serialize(model)
+
+
+def msrest_deserialize(model_cls: type, data: object) -> Model:
+    return super(CompiledModel, model_cls).deserialize(data)
+
+
+def create_activities():
+    now = datetime(2024, 5, 1, 12, 30, 15, 123000, tzinfo=timezone.utc)
+    return [
+        Activity(),
+        Activity(type=ActivityTypes.message, text="hi"),
+        Activity(
+            type=ActivityTypes.message,
+            id="activity-id",
+            timestamp=now,
+            local_timestamp=now.astimezone(timezone(timedelta(hours=-7))),
+            local_timezone="America/Los_Angeles",
+            service_url="https://smba.trafficmanager.net/amer/",
+            channel_id="msteams",
+            from_property=ChannelAccount(
+                id="user-id", name="User", aad_object_id="aad", role="user"
+            ),
+            conversation=ConversationAccount(
+                is_group=True,
+                conversation_type="channel",
+                id="conversation-id",
+                tenant_id="tenant-id",
+                properties={"custom": [1, 2.5, None, "x"]},
+            ),
+            recipient=ChannelAccount(id="bot-id", name="Bot", role="bot"),
+            text_format="markdown",
+            attachment_layout="carousel",
+            members_added=[ChannelAccount(id="a"), None, ChannelAccount(id="b")],
+            reactions_added=[MessageReaction(type="like")],
+            history_disclosed=False,
+            locale="en-US",
+            text="Hello <at>User</at> ☃",
+            speak="<speak>Hello</speak>",
+            input_hint="acceptingInput",
+            suggested_actions=SuggestedActions(
+                to=["user-id"],
+                actions=[CardAction(type="imBack", title="Yes", value="yes")],
+            ),
+            attachments=[
+                Attachment(
+                    content_type="application/vnd.microsoft.card.adaptive",
+                    content={"type": "AdaptiveCard", "body": [{"text": "x"}]},
+                    name="card",
+                )
+            ],
+            entities=[
+                Entity(type="clientInfo"),
+                Mention(
+                    mentioned=ChannelAccount(id="user-id"),
+                    text="<at>User</at>",
+                    type="mention",
+                ),
+            ],
+            channel_data={"tenant": {"id": "tenant-id"}, "flags": [True, 0]},
+            reply_to_id="reply-id",
+            value={"answer": 42},
+            relates_to=ConversationReference(activity_id="related"),
+            expiration=now + timedelta(minutes=5),
+            listen_for=["yes", "no"],
+            text_highlights=[TextHighlight(text="Hello", occurrence=1)],
+            caller_id="urn:botframework:azure",
+        ),
+        Activity(
+            type=ActivityTypes.conversation_update,
+            from_property=TeamsChannelAccount(id="user-id", email="u@example.com"),
+            members_added=[TeamsChannelAccount(id="m", given_name="M")],
+        ),
+    ]
+
+
+def create_payloads():
+    return [
+        {},
+        {"type": "message", "text": "hi", "unknownKey": {"a": 1}},
+        {
+            "type": "message",
+            "id": 12,
+            "timestamp": "2024-05-01T12:30:15.123Z",
+            "localTimestamp": "2024-05-01T05:30:15.123-07:00",
+            "from": {"id": "user-id", "name": "User", "extra": True},
+            "conversation": {"isGroup": "true", "id": "conversation-id"},
+            "recipient": {},
+            "membersAdded": [{"id": "a"}, None],
+            "historyDisclosed": 1,
+            "attachments": [{"contentType": "text/plain", "content": "text"}],
+            "entities": [
+                {"type": "mention", "mentioned": {"id": "x"}, "text": "<at>x</at>"}
+            ],
+            "channelData": {"tenant": {"id": "t"}, "list": [1, "2", None]},
+            "value": ["a", {"b": None}],
+            "relatesTo": {"activityId": "related"},
+            "listenFor": ["yes"],
+            "suggestedActions": {"actions": [{"type": "imBack", "value": "yes"}]},
+        },
+    ]
+
+
+class TestCompiledModel(aiounittest.AsyncTestCase):
+    def test_serialize_matches_msrest(self):
+        for activity in create_activities():
+            expected = msrest_serialize(activity)
+            actual = activity.serialize()
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(list(expected), list(actual))
+
+    def test_deserialize_matches_msrest(self):
+        for payload in create_payloads():
+            expected = msrest_deserialize(Activity, deepcopy(payload))
+            actual = Activity.deserialize(deepcopy(payload))
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(type(expected.from_property), type(actual.from_property))
+
+    def test_round_trip(self):
+        for activity in create_activities():
+            data = activity.serialize()
+            expected = msrest_deserialize(Activity, deepcopy(data))
+            actual = Activity.deserialize(deepcopy(data))
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(msrest_serialize(expected), actual.serialize())
+
+    def test_nested_types_match_msrest(self):
+        models = [
+            ChannelAccount(id="id", name="name", properties={"a": [1]}),
+            ConversationAccount(is_group=False, id="id", tenant_id="t"),
+            Attachment(content_type="image/png", content_url="https://x"),
+            Entity(type="geo"),
+        ]
+        for model in models:
+            data = model.serialize()
+
+            self.assertEqual(msrest_serialize(model), data)
+            self.assertEqual(
+                msrest_deserialize(type(model), deepcopy(data)),
+                type(model).deserialize(deepcopy(data)),
+            )
+
+    def test_unknown_keys_are_additional_properties(self):
+        activity = Activity.deserialize({"type": "message", "customKey": "value"})
+
+        self.assertEqual({"customKey": "value"}, activity.additional_properties)
+        self.assertEqual({"type": "message"}, activity.serialize())
+
+    def test_invalid_data_raises_msrest_error(self):
+        payloads = [
+            {"from": "not an account"},
+            {"membersAdded": "not a list"},
+            {"timestamp": "not a date"},
+            '{"type": "message"}',
+        ]
+        for payload in payloads:
+            with self.assertRaises(DeserializationError):
+                msrest_deserialize(Activity, deepcopy(payload))
+            with self.assertRaises(DeserializationError):
+                Activity.deserialize(deepcopy(payload))
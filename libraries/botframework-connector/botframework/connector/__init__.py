@@ -16,6 +16,7 @@ from .http_client_base import HttpClientBase
 from .http_client_factory import HttpClientFactory
 from .http_request import HttpRequest
 from .http_response_base import HttpResponseBase
+from .http_session_manager import HttpSessionManager
 
 __all__ = [
     "AsyncBfPipeline",
@@ -27,6 +28,7 @@ __all__ = [
     "HttpClientFactory",
     "HttpRequest",
     "HttpResponseBase",
+    "HttpSessionManager",
 ]
 
 __version__ = VERSION
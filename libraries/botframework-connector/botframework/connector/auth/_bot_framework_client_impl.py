@@ -65,7 +65,11 @@ class _BotFrameworkClientImpl(BotFrameworkClient):
         )
 
         # Get token for the skill call
-        token = credentials.get_access_token() if credentials.microsoft_app_id else None
+        token = (
+            await credentials.get_access_token_async()
+            if credentials.microsoft_app_id
+            else None
+        )
 
         # Clone the activity so we can modify it before sending without impacting the original object.
         activity_copy = deepcopy(activity)
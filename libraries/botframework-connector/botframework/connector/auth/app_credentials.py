@@ -1,6 +1,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Tuple
+
 import requests
 from msrest.authentication import Authentication
 
@@ -17,6 +21,21 @@ class AppCredentials(Authentication):
     cache = {}
     __tenant = None
 
+    # Seconds before expiry at which a cached token is refreshed in the background
+    token_refresh_ahead = 300
+
+    # Seconds before expiry at which a cached token isn't used anymore, so that it doesn't expire in flight
+    token_expiry_margin = 60
+
+    # Optional async callable replacing the token endpoint for get_access_token_async.
+    # It's given the scopes and returns a token response with "access_token" and "expires_in",
+    # or "error" and "error_description", as MSAL does.
+    token_endpoint: Callable[[List[str]], Awaitable[dict]] = None
+
+    _token: Tuple[str, float] = None
+    _token_task: asyncio.Future = None
+    _token_refreshed_ahead: Tuple[str, float] = None
+
     def __init__(
         self,
         app_id: str = None,
@@ -89,7 +108,11 @@ class AppCredentials(Authentication):
         if not self._should_set_token(session):
             session.headers.pop("Authorization", None)
         else:
-            auth_token = self.get_access_token()
+            auth_token = self._get_cached_access_token()
+            if auth_token is None:
+                auth_token = self.get_access_token()
+            else:
+                self._refresh_token_ahead()
             header = "{} {}".format("Bearer", auth_token)
             session.headers["Authorization"] = header
 
@@ -110,3 +133,121 @@ class AppCredentials(Authentication):
         :return: The token
         """
         raise NotImplementedError()
+
+    async def get_access_token_async(self, force_refresh: bool = False) -> str:
+        """
+        Returns a token for the current AppCredentials without blocking the event loop.
+
+        .. remarks::
+            The token is cached until :attr:`token_expiry_margin` seconds before it expires, and refreshed in
+            the background once it expires within :attr:`token_refresh_ahead` seconds. A refreshed token that
+            still expires within that time isn't refreshed again before it stops being used. Concurrent calls share a single request for a new token.
+            Tokens are requested through :attr:`token_endpoint` if set, otherwise :meth:`_acquire_token`
+            runs on a worker thread.
+
+        :param force_refresh: True to request a new token even if one is cached
+        :return: The token
+        """
+        if not force_refresh:
+            auth_token = self._get_cached_access_token()
+            if auth_token is not None:
+                self._refresh_token_ahead()
+                return auth_token
+
+        # Concurrent callers share a single request, which isn't cancelled with any one of them
+        return await asyncio.shield(self._get_token_task(force_refresh))
+
+    def _acquire_token(self, force_refresh: bool = False) -> dict:
+        """
+        Requests a token synchronously. Returns a token response with "access_token" and optionally
+        "expires_in", or "error" and "error_description".
+        Credentials that can tell when their tokens expire should override this method.
+
+        :param force_refresh: True to request a new token rather than one cached by the token provider
+        """
+        return {"access_token": self.get_access_token(force_refresh)}
+
+    def _get_oauth_scopes(self) -> List[str]:
+        scope = self.oauth_scope
+        if not scope.endswith("/.default"):
+            scope += "/.default"
+        return [scope]
+
+    def _read_token_response(self, auth_token: dict) -> str:
+        if "access_token" in auth_token:
+            expires_in = auth_token.get("expires_in")
+            if isinstance(expires_in, (int, float)):
+                self._token = (
+                    auth_token["access_token"],
+                    time.monotonic() + expires_in,
+                )
+            return auth_token["access_token"]
+        error = auth_token["error"] if "error" in auth_token else "Unknown error"
+        error_description = (
+            auth_token["error_description"]
+            if "error_description" in auth_token
+            else "Unknown error description"
+        )
+        raise PermissionError(
+            f"Failed to get access token with error: {error}, error_description: {error_description}"
+        )
+
+    def _get_cached_access_token(self) -> str:
+        token = self._token
+        if token is None or token[1] - self.token_expiry_margin <= time.monotonic():
+            return None
+        return token[0]
+
+    def _refresh_token_ahead(self):
+        token = self._token
+        if (
+            token is None
+            or token is self._token_refreshed_ahead
+            or token[1] - self.token_refresh_ahead > time.monotonic()
+        ):
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Not called from the event loop, the token is refreshed when it expires
+            return
+
+        if not self._is_fetching_token():
+            self._token_task = asyncio.ensure_future(self._fetch_token_ahead())
+            # The cached token keeps being used if the refresh fails
+            self._token_task.add_done_callback(
+                lambda done: done.cancelled() or done.exception()
+            )
+
+    def _is_fetching_token(self) -> bool:
+        return (
+            self._token_task is not None
+            and not self._token_task.done()
+            and self._token_task.get_loop() is asyncio.get_event_loop()
+        )
+
+    def _get_token_task(self, force_refresh: bool = False) -> asyncio.Future:
+        if not self._is_fetching_token():
+            self._token_task = asyncio.ensure_future(self._fetch_token(force_refresh))
+        return self._token_task
+
+    async def _fetch_token_ahead(self) -> str:
+        # The token provider would return the cached token, a new one is requested
+        auth_token = await self._fetch_token(force_refresh=True)
+        token = self._token
+        if (
+            token is not None
+            and token[1] - self.token_refresh_ahead <= time.monotonic()
+        ):
+            # The new token expires as soon, it's refreshed once it stops being used
+            self._token_refreshed_ahead = token
+        return auth_token
+
+    async def _fetch_token(self, force_refresh: bool = False) -> str:
+        if self.token_endpoint is not None:
+            auth_token = await self.token_endpoint(self._get_oauth_scopes())
+        else:
+            auth_token = await asyncio.get_event_loop().run_in_executor(
+                None, self._acquire_token, force_refresh
+            )
+        return self._read_token_response(auth_token)
@@ -1,12 +1,17 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+import hashlib
 import json
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import List
-import requests
+from typing import Dict, List
+import aiohttp
 from jwt.algorithms import RSAAlgorithm
 import jwt
+from ..http_session_manager import HttpSessionManager
 from .claims_identity import ClaimsIdentity
 from .verify_options import VerifyOptions
 from .endorsements_validator import EndorsementsValidator
@@ -56,34 +61,47 @@ class JwtTokenExtractor:
         if schema != "Bearer" or not parameter:
             return None
 
+        validated = self.open_id_metadata.validated_tokens.get(parameter)
+        if validated is not None:
+            headers, payload = validated.headers, validated.payload
+        else:
+            unverified = jwt.api_jwt.decode_complete(
+                parameter, options={"verify_signature": False}
+            )
+            headers, payload = unverified["header"], unverified["payload"]
+
         # Issuer isn't allowed? No need to check signature
-        if not self._has_allowed_issuer(parameter):
+        if not self._has_allowed_issuer(payload):
             return None
 
-        try:
-            return await self._validate_token(
-                parameter, channel_id, required_endorsements
-            )
-        except Exception as error:
-            raise error
+        return await self._validate_token(
+            parameter, channel_id, required_endorsements, headers, validated
+        )
 
-    def _has_allowed_issuer(self, jwt_token: str) -> bool:
-        decoded = jwt.decode(jwt_token, options={"verify_signature": False})
-        issuer = decoded.get("iss", None)
+    def _has_allowed_issuer(self, payload: dict) -> bool:
+        issuer = payload.get("iss", None)
         if issuer in self.validation_parameters.issuer:
             return True
 
         return issuer == self.validation_parameters.issuer
 
     async def _validate_token(
-        self, jwt_token: str, channel_id: str, required_endorsements: List[str] = None
+        self,
+        jwt_token: str,
+        channel_id: str,
+        required_endorsements: List[str] = None,
+        headers: dict = None,
+        validated: "_ValidatedToken" = None,
     ) -> ClaimsIdentity:
         required_endorsements = required_endorsements or []
-        headers = jwt.get_unverified_header(jwt_token)
+        if headers is None:
+            headers = jwt.get_unverified_header(jwt_token)
 
         # Update the signing tokens from the last refresh
         key_id = headers.get("kid", None)
         metadata = await self.open_id_metadata.get(key_id)
+        if metadata is None:
+            raise Exception("Could not find the token signing key")
 
         if key_id and metadata.endorsements:
             # Verify that channelId is included in endorsements
@@ -101,6 +119,14 @@ class JwtTokenExtractor:
         if headers.get("alg", None) not in self.validation_parameters.algorithms:
             raise Exception("Token signing algorithm not in allowed list")
 
+        leeway = self.validation_parameters.clock_tolerance
+        if isinstance(leeway, timedelta):
+            leeway = leeway.total_seconds()
+
+        # A token already verified with this signing key only needs its time claims checked
+        if validated is not None and validated.is_valid(metadata, leeway):
+            return ClaimsIdentity(dict(validated.payload), True)
+
         options = {
             "verify_aud": False,
             "verify_exp": not self.validation_parameters.ignore_expiration,
@@ -113,46 +139,166 @@ class JwtTokenExtractor:
             options=options,
             algorithms=["RS256"],
         )
+        self.open_id_metadata.validated_tokens.add(
+            jwt_token, headers, decoded_payload, metadata
+        )
 
         claims = ClaimsIdentity(decoded_payload, True)
 
         return claims
 
 
+class _ValidatedToken:
+    def __init__(self, headers: dict, payload: dict, config: "_OpenIdConfig"):
+        self.headers = headers
+        self.payload = payload
+        self.config = config
+        self.expires_at = payload["exp"]
+
+    def is_valid(self, config: "_OpenIdConfig", leeway: float) -> bool:
+        # The signing key must not have been rotated since, and the token must be usable now
+        # with the caller's clock tolerance, as jwt.decode would check
+        now = time.time()
+        return (
+            self.config is config
+            and now < self.expires_at
+            and all(
+                not isinstance(self.payload.get(claim), (int, float))
+                or self.payload[claim] <= now + leeway
+                for claim in ("nbf", "iat")
+            )
+        )
+
+
+class _ValidatedTokenCache:
+    """
+    A bounded cache of the tokens whose signature was verified, so that the tokens sent again
+    by a channel skip signature verification until they expire.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._tokens: "OrderedDict[bytes, _ValidatedToken]" = OrderedDict()
+
+    def get(self, token: str) -> _ValidatedToken:
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        validated = self._tokens.get(key)
+        if validated is None:
+            return None
+
+        if validated.expires_at <= time.time():
+            del self._tokens[key]
+            return None
+
+        self._tokens.move_to_end(key)
+        return validated
+
+    def add(self, token: str, headers: dict, payload: dict, config: "_OpenIdConfig"):
+        # Tokens without a numeric expiration are never cached
+        if not isinstance(payload.get("exp"), (int, float)) or self.max_size <= 0:
+            return
+
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        self._tokens[key] = _ValidatedToken(headers, dict(payload), config)
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self.max_size:
+            self._tokens.popitem(last=False)
+
+
 class _OpenIdMetadata:
+    # Keys are refreshed in the background once they are older than refresh_interval - refresh_ahead,
+    # while the current keys keep being served. A failed refresh is retried after retry_interval.
+    refresh_interval = timedelta(days=1)
+    refresh_ahead = timedelta(hours=1)
+    retry_interval = timedelta(minutes=5)
+    request_timeout = 30
+
     def __init__(self, url):
         self.url = url
         self.keys = []
+        self.validated_tokens = _ValidatedTokenCache()
         self.last_updated = datetime.min
+        self._last_attempt = datetime.min
+        self._refresh_task: asyncio.Future = None
 
     async def get(self, key_id: str):
-        # If keys are more than 1 day old, refresh them
-        if self.last_updated < (datetime.now() - timedelta(days=1)):
+        now = datetime.now()
+        if not self.keys:
+            # Nothing to serve yet, wait for the keys
             await self._refresh()
+        elif self.last_updated < now - (self.refresh_interval - self.refresh_ahead):
+            self._refresh_in_background(now)
 
         key = self._find(key_id)
-        if not key and self.last_updated < (datetime.now() - timedelta(hours=1)):
+        if not key and self._last_attempt < (now - timedelta(hours=1)):
             # Refresh the cache if a key is not found (max once per hour)
-            await self._refresh()
+            try:
+                await self._refresh()
+            except Exception:  # pylint: disable=broad-except
+                # Keep serving the last known keys
+                pass
             key = self._find(key_id)
         return key
 
     async def _refresh(self):
-        response = requests.get(self.url)
-        response.raise_for_status()
-        keys_url = response.json()["jwks_uri"]
-        response_keys = requests.get(keys_url)
-        response_keys.raise_for_status()
+        # Concurrent callers share a single fetch, which isn't cancelled with any one of them
+        await asyncio.shield(self._get_refresh_task())
+
+    def _refresh_in_background(self, now: datetime):
+        if self._is_refreshing() or self._last_attempt > now - self.retry_interval:
+            return
+
+        task = self._get_refresh_task()
+        # The error of a background refresh is dropped, the last known keys are kept
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    def _is_refreshing(self) -> bool:
+        return (
+            self._refresh_task is not None
+            and not self._refresh_task.done()
+            and self._refresh_task.get_loop() is asyncio.get_event_loop()
+        )
+
+    def _get_refresh_task(self) -> asyncio.Future:
+        if not self._is_refreshing():
+            self._refresh_task = asyncio.ensure_future(self._fetch())
+        return self._refresh_task
+
+    async def _fetch(self):
+        self._last_attempt = datetime.now()
+        session = HttpSessionManager.get_session()
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        async with session.get(self.url, timeout=timeout) as response:
+            response.raise_for_status()
+            keys_url = (await response.json(content_type=None))["jwks_uri"]
+        async with session.get(keys_url, timeout=timeout) as response_keys:
+            response_keys.raise_for_status()
+            keys = (await response_keys.json(content_type=None))["keys"]
         self.last_updated = datetime.now()
-        self.keys = response_keys.json()["keys"]
+        self.keys = keys
+
+    @property
+    def keys(self) -> List[dict]:
+        return self._keys
+
+    @keys.setter
+    def keys(self, keys: List[dict]):
+        # Keys are parsed once per refresh and indexed by their id
+        configs: Dict[str, _OpenIdConfig] = {}
+        for key in keys:
+            try:
+                public_key = RSAAlgorithm.from_jwk(json.dumps(key))
+            except Exception:  # pylint: disable=broad-except
+                # Not a RSA key, it can't validate tokens
+                continue
+            configs[key.get("kid")] = _OpenIdConfig(
+                public_key, key.get("endorsements", [])
+            )
+        self._keys = keys
+        self._configs = configs
 
     def _find(self, key_id: str):
-        if not self.keys:
-            return None
-        key = [x for x in self.keys if x["kid"] == key_id][0]
-        public_key = RSAAlgorithm.from_jwk(json.dumps(key))
-        endorsements = key.get("endorsements", [])
-        return _OpenIdConfig(public_key, endorsements)
+        return self._configs.get(key_id)
 
 
 class _OpenIdConfig:
@@ -39,30 +39,26 @@ class MicrosoftAppCredentials(AppCredentials, ABC):
         Implementation of AppCredentials.get_token.
         :return: The access token for the given app id and password.
         """
+        if not force_refresh:
+            auth_token = self._get_cached_access_token()
+            if auth_token is not None:
+                return auth_token
 
-        scope = self.oauth_scope
-        if not scope.endswith("/.default"):
-            scope += "/.default"
-        scopes = [scope]
+        return self._read_token_response(self._acquire_token(force_refresh))
 
-        # Firstly, looks up a token from cache
+    def _acquire_token(self, force_refresh: bool = False) -> dict:
+        scopes = self._get_oauth_scopes()
+
+        # Firstly, looks up a token from cache, or gets a new one from AAD if force_refresh is set
         # Since we are looking for token for the current app, NOT for an end user,
         # notice we give account parameter as None.
-        auth_token = self.__get_msal_app().acquire_token_silent(scopes, account=None)
+        auth_token = self.__get_msal_app().acquire_token_silent(
+            scopes, account=None, force_refresh=force_refresh
+        )
         if not auth_token:
             # No suitable token exists in cache. Let's get a new one from AAD.
             auth_token = self.__get_msal_app().acquire_token_for_client(scopes=scopes)
-        if "access_token" in auth_token:
-            return auth_token["access_token"]
-        error = auth_token["error"] if "error" in auth_token else "Unknown error"
-        error_description = (
-            auth_token["error_description"]
-            if "error_description" in auth_token
-            else "Unknown error description"
-        )
-        raise PermissionError(
-            f"Failed to get access token with error: {error}, error_description: {error_description}"
-        )
+        return auth_token
 
     def __get_msal_app(self):
         if not self.app:
@@ -0,0 +1,60 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+
+import aiohttp
+
+
+class HttpSessionManager:
+    """
+    Provides the :class:`aiohttp.ClientSession` shared by the outbound HTTP calls of the SDK.
+
+    .. remarks::
+        The session keeps connections alive between requests, limits the number of connections
+        opened in total, and caches DNS lookups. The connections to a single host aren't limited
+        unless :attr:`connection_limit_per_host` is set. It is created on first use in the
+        running event loop, and created again if used from another loop or after being closed.
+        Call :meth:`close` when shutting down, or register it with the aiohttp application
+        that hosts the bot so that it is closed on cleanup.
+        Change the settings before the session is first used, or close it to apply new settings.
+    """
+
+    # The number of connections opened in total and to a single host, 0 for no limit
+    connection_limit = 100
+    connection_limit_per_host = 0
+    # The number of seconds DNS lookups and idle connections are kept
+    dns_cache_ttl = 300
+    keepalive_timeout = 30
+
+    _session: aiohttp.ClientSession = None
+    _session_loop: asyncio.AbstractEventLoop = None
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Gets the shared session, creating it in the running event loop if needed.
+
+        :return: The shared session. It must not be closed by the caller.
+        :rtype: :class:`aiohttp.ClientSession`
+        """
+        loop = asyncio.get_event_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=cls.connection_limit,
+                limit_per_host=cls.connection_limit_per_host,
+                ttl_dns_cache=cls.dns_cache_ttl,
+                keepalive_timeout=cls.keepalive_timeout,
+            )
+            cls._session = aiohttp.ClientSession(connector=connector)
+            cls._session_loop = loop
+        return cls._session
+
+    @classmethod
+    async def close(cls):
+        """
+        Closes the shared session and its connections.
+        """
+        session, cls._session, cls._session_loop = cls._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
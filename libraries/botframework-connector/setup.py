@@ -12,6 +12,7 @@ REQUIRES = [
     "PyJWT>=2.4.0",
     "botbuilder-schema==4.17.0",
     "msal>=1.31.1",
+    "aiohttp==3.10.11",
 ]
 
 root = os.path.abspath(os.path.dirname(__file__))
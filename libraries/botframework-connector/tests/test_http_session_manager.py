@@ -0,0 +1,81 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from botframework.connector import HttpSessionManager
+
+
+class TestHttpSessionManager:
+    @pytest.mark.asyncio
+    async def test_session_is_shared(self):
+        try:
+            session = HttpSessionManager.get_session()
+
+            assert HttpSessionManager.get_session() is session
+            assert session.connector.limit == HttpSessionManager.connection_limit
+            assert (
+                session.connector.limit_per_host
+                == HttpSessionManager.connection_limit_per_host
+            )
+        finally:
+            await HttpSessionManager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_creates_a_new_session(self):
+        session = HttpSessionManager.get_session()
+        await HttpSessionManager.close()
+
+        assert session.closed
+        new_session = HttpSessionManager.get_session()
+        assert new_session is not session
+        await HttpSessionManager.close()
+        # closing twice is harmless
+        await HttpSessionManager.close()
+
+    def test_session_is_created_per_event_loop(self):
+        def get_session(loop: asyncio.AbstractEventLoop):
+            async def get():
+                return HttpSessionManager.get_session()
+
+            return loop.run_until_complete(get())
+
+        first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first = get_session(first_loop)
+            second = get_session(second_loop)
+
+            assert first is not second
+            first_loop.run_until_complete(first.close())
+            second_loop.run_until_complete(HttpSessionManager.close())
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self):
+        ports = set()
+
+        async def handler(request):
+            ports.add(request.transport.get_extra_info("peername")[1])
+            return web.Response(text="ok")
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            for _ in range(5):
+                async with HttpSessionManager.get_session().get(
+                    server.make_url("/")
+                ) as response:
+                    assert await response.text() == "ok"
+
+            assert len(ports) == 1
+        finally:
+            await HttpSessionManager.close()
+            await server.close()
@@ -0,0 +1,240 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import jwt
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from botframework.connector import HttpSessionManager
+from botframework.connector.auth import JwtTokenExtractor, VerifyOptions
+from botframework.connector.auth.jwt_token_extractor import _OpenIdMetadata
+
+ISSUER = "https://api.botframework.com"
+
+
+class OpenIdStubServer:
+    """Serves OpenID metadata and signing keys from a local aiohttp server."""
+
+    def __init__(self):
+        self.keys = []
+        self.private_keys = {}
+        self.request_count = 0
+        self.available = True
+        self.delay = 0
+        app = web.Application()
+        app.router.add_get("/openid", self._metadata)
+        app.router.add_get("/keys", self._keys)
+        self._server = TestServer(app)
+
+    @property
+    def metadata_url(self) -> str:
+        return str(self._server.make_url("/openid"))
+
+    def add_key(self, kid: str, endorsements=None):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        key = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        key["kid"] = kid
+        if endorsements is not None:
+            key["endorsements"] = endorsements
+        self.keys.append(key)
+        self.private_keys[kid] = private_key
+
+    def create_token(self, kid: str, **claims) -> str:
+        payload = {"iss": ISSUER, "exp": int(time.time()) + 3600}
+        payload.update(claims)
+        return jwt.encode(
+            payload, self.private_keys[kid], algorithm="RS256", headers={"kid": kid}
+        )
+
+    async def start(self):
+        await self._server.start_server()
+
+    async def close(self):
+        await self._server.close()
+
+    async def _metadata(self, request):
+        self.request_count += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if not self.available:
+            return web.Response(status=503)
+        return web.json_response({"jwks_uri": str(request.url.with_path("/keys"))})
+
+    async def _keys(self, request):
+        return web.json_response({"keys": self.keys})
+
+
+@asynccontextmanager
+async def start_stub_server():
+    server = OpenIdStubServer()
+    server.add_key("key1", endorsements=["msteams"])
+    await server.start()
+    try:
+        yield server
+    finally:
+        JwtTokenExtractor.metadataCache.pop(server.metadata_url, None)
+        await HttpSessionManager.close()
+        await server.close()
+
+
+def create_extractor(metadata_url: str, clock_tolerance: int = 0) -> JwtTokenExtractor:
+    return JwtTokenExtractor(
+        VerifyOptions(
+            issuer=[ISSUER],
+            audience=None,
+            clock_tolerance=clock_tolerance,
+            ignore_expiration=False,
+        ),
+        metadata_url,
+        ["RS256"],
+    )
+
+
+class TestJwtTokenExtractor:
+    @pytest.mark.asyncio
+    async def test_validates_token_with_stub_keys(self):
+        async with start_stub_server() as stub_server:
+            extractor = create_extractor(stub_server.metadata_url)
+            token = stub_server.create_token("key1", appid="app-id")
+
+            identity = await extractor.get_identity_from_auth_header(
+                f"Bearer {token}", "msteams"
+            )
+
+            assert identity.is_authenticated
+            assert identity.claims["appid"] == "app-id"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_coalesced(self):
+        async with start_stub_server() as stub_server:
+            stub_server.delay = 0.05
+            metadata = _OpenIdMetadata(stub_server.metadata_url)
+
+            keys = await asyncio.gather(*[metadata.get("key1") for _ in range(10)])
+
+            assert all(key is not None for key in keys)
+            assert stub_server.request_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_background_before_expiry(self):
+        async with start_stub_server() as stub_server:
+            metadata = _OpenIdMetadata(stub_server.metadata_url)
+            await metadata.get("key1")
+            metadata.last_updated = datetime.now() - timedelta(hours=23, minutes=30)
+            metadata._last_attempt = (
+                metadata.last_updated
+            )  # pylint: disable=protected-access
+            stub_server.delay = 0.05
+
+            # served from the current keys without waiting for the refresh
+            assert await asyncio.wait_for(metadata.get("key1"), 0.04) is not None
+            await asyncio.sleep(0.2)
+
+            assert stub_server.request_count == 2
+            assert metadata.last_updated > datetime.now() - timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_keeps_last_known_keys_when_endpoint_is_down(self):
+        async with start_stub_server() as stub_server:
+            metadata = _OpenIdMetadata(stub_server.metadata_url)
+            await metadata.get("key1")
+            stale = datetime.now() - timedelta(days=2)
+            metadata.last_updated = stale
+            metadata._last_attempt = stale  # pylint: disable=protected-access
+            stub_server.available = False
+
+            assert await metadata.get("key1") is not None
+            await asyncio.sleep(0.1)
+            assert await metadata.get("key1") is not None
+
+            # the failed refresh isn't retried on every request
+            assert stub_server.request_count == 2
+            assert metadata.last_updated == stale
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_failure_is_raised(self):
+        async with start_stub_server() as stub_server:
+            stub_server.available = False
+            metadata = _OpenIdMetadata(stub_server.metadata_url)
+
+            with pytest.raises(Exception):
+                await metadata.get("key1")
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_skips_signature_verification(self):
+        async with start_stub_server() as stub_server:
+            token = stub_server.create_token("key1", appid="app-id")
+
+            with patch("jwt.decode", wraps=jwt.decode) as decode:
+                for _ in range(3):
+                    identity = await create_extractor(
+                        stub_server.metadata_url
+                    ).get_identity_from_auth_header(f"Bearer {token}", "msteams")
+                    assert identity.claims["appid"] == "app-id"
+
+            assert decode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_token_still_checks_endorsements(self):
+        async with start_stub_server() as stub_server:
+            extractor = create_extractor(stub_server.metadata_url)
+            token = stub_server.create_token("key1")
+            await extractor.get_identity_from_auth_header(f"Bearer {token}", "msteams")
+
+            with pytest.raises(Exception, match="endorsement"):
+                await extractor.get_identity_from_auth_header(
+                    f"Bearer {token}", "webchat"
+                )
+            with pytest.raises(Exception, match="endorsement"):
+                await extractor.get_identity_from_auth_header(
+                    f"Bearer {token}", "msteams", ["other"]
+                )
+
+    @pytest.mark.asyncio
+    async def test_cached_token_respects_clock_tolerance(self):
+        async with start_stub_server() as stub_server:
+            token = stub_server.create_token("key1", nbf=int(time.time()) + 120)
+            tolerant = create_extractor(stub_server.metadata_url, clock_tolerance=300)
+            assert await tolerant.get_identity_from_auth_header(
+                f"Bearer {token}", "msteams"
+            )
+
+            strict = create_extractor(stub_server.metadata_url)
+            with pytest.raises(jwt.ImmatureSignatureError):
+                await strict.get_identity_from_auth_header(f"Bearer {token}", "msteams")
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_not_served_from_cache(self):
+        async with start_stub_server() as stub_server:
+            extractor = create_extractor(stub_server.metadata_url)
+            token = stub_server.create_token("key1", exp=int(time.time()) + 1)
+            await extractor.get_identity_from_auth_header(f"Bearer {token}", "msteams")
+            await asyncio.sleep(1.1)
+
+            with pytest.raises(jwt.ExpiredSignatureError):
+                await extractor.get_identity_from_auth_header(
+                    f"Bearer {token}", "msteams"
+                )
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_id_is_rejected(self):
+        async with start_stub_server() as stub_server:
+            stub_server.add_key("key2")
+            token = stub_server.create_token("key2")
+            stub_server.keys.pop()
+            extractor = create_extractor(stub_server.metadata_url)
+
+            with pytest.raises(Exception, match="signing key"):
+                await extractor.get_identity_from_auth_header(
+                    f"Bearer {token}", "msteams"
+                )
@@ -1,11 +1,53 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+import threading
+
 import aiounittest
 
 from botframework.connector.auth import AuthenticationConstants, MicrosoftAppCredentials
 
 
+class TokenEndpointStub:
+    """Stands in for the AAD token endpoint of the credentials."""
+
+    def __init__(self, expires_in: int = 3600, delay: float = 0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.scopes = []
+        self.error = None
+
+    async def __call__(self, scopes):
+        self.scopes.append(scopes)
+        await asyncio.sleep(self.delay)
+        if self.error:
+            return {"error": self.error, "error_description": "stub error"}
+        return {
+            "access_token": f"token{len(self.scopes)}",
+            "expires_in": self.expires_in,
+        }
+
+
+class MsalAppStub:
+    """Stands in for the MSAL application, which caches the token it was given."""
+
+    def __init__(self, expires_in: int = 3600):
+        self.expires_in = expires_in
+        self.force_refresh = []
+
+    def acquire_token_silent(self, scopes, account, force_refresh=False):
+        self.force_refresh.append(force_refresh)
+        token = "token2" if force_refresh else "token1"
+        return {"access_token": token, "expires_in": self.expires_in}
+
+
+def create_credentials(endpoint: TokenEndpointStub) -> MicrosoftAppCredentials:
+    credentials = MicrosoftAppCredentials("some_app", "some_password")
+    credentials.token_endpoint = endpoint
+    return credentials
+
+
 class TestMicrosoftAppCredentials(aiounittest.AsyncTestCase):
     async def test_app_credentials(self):
         default_scope_case_1 = MicrosoftAppCredentials("some_app", "some_password")
@@ -34,3 +76,108 @@ class TestMicrosoftAppCredentials(aiounittest.AsyncTestCase):
             "some_app", "some_password", "some_tenant", custom_scope
         )
         assert custom_scope_case_2.oauth_scope == custom_scope
+
+    async def test_concurrent_token_requests_are_coalesced(self):
+        endpoint = TokenEndpointStub(delay=0.05)
+        credentials = create_credentials(endpoint)
+
+        tokens = await asyncio.gather(
+            *[credentials.get_access_token_async() for _ in range(10)]
+        )
+
+        assert tokens == ["token1"] * 10
+        assert endpoint.scopes == [
+            [AuthenticationConstants.TO_CHANNEL_FROM_BOT_OAUTH_SCOPE + "/.default"]
+        ]
+
+    async def test_cached_token_is_reused_and_refreshed_ahead(self):
+        endpoint = TokenEndpointStub()
+        credentials = create_credentials(endpoint)
+
+        assert await credentials.get_access_token_async() == "token1"
+        assert await credentials.get_access_token_async() == "token1"
+        assert credentials.get_access_token() == "token1"
+        assert len(endpoint.scopes) == 1
+
+        # expires within the refresh window, served while a new token is fetched
+        endpoint.expires_in = 120
+        assert await credentials.get_access_token_async(force_refresh=True) == "token2"
+        assert await credentials.get_access_token_async() == "token2"
+        endpoint.expires_in = 3600
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert len(endpoint.scopes) == 3
+        assert await credentials.get_access_token_async() == "token3"
+
+    async def test_token_refreshed_ahead_is_not_taken_from_the_msal_cache(self):
+        credentials = MicrosoftAppCredentials("some_app", "some_password")
+        credentials.app = MsalAppStub(expires_in=120)
+
+        assert await credentials.get_access_token_async() == "token1"
+        assert await credentials.get_access_token_async() == "token1"
+        await asyncio.sleep(0.05)
+
+        assert credentials.app.force_refresh == [False, True]
+        assert await credentials.get_access_token_async() == "token2"
+
+    async def test_token_refreshed_ahead_with_the_same_expiry(self):
+        endpoint = TokenEndpointStub(expires_in=120)
+        credentials = create_credentials(endpoint)
+
+        assert await credentials.get_access_token_async() == "token1"
+        assert await credentials.get_access_token_async() == "token1"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        # the new token expires as soon as the old one, it isn't refreshed again before it expires
+        for _ in range(5):
+            assert await credentials.get_access_token_async() == "token2"
+            await asyncio.sleep(0)
+        assert len(endpoint.scopes) == 2
+
+    async def test_token_is_not_used_near_its_expiry(self):
+        credentials = MicrosoftAppCredentials("some_app", "some_password")
+        credentials.app = MsalAppStub(expires_in=3600)
+
+        # no event loop refreshes the token of a synchronous caller ahead of time
+        assert credentials.get_access_token() == "token1"
+        assert credentials.get_access_token() == "token1"
+        assert len(credentials.app.force_refresh) == 1
+
+        # a token expiring within the margin could expire before the request reaches the service
+        credentials.app.expires_in = credentials.token_expiry_margin - 1
+        credentials.get_access_token(force_refresh=True)
+        credentials.get_access_token()
+        assert len(credentials.app.force_refresh) == 3
+
+    async def test_signed_session_uses_cached_token(self):
+        endpoint = TokenEndpointStub()
+        credentials = create_credentials(endpoint)
+        await credentials.get_access_token_async()
+
+        session = credentials.signed_session()
+
+        assert session.headers["Authorization"] == "Bearer token1"
+        assert len(endpoint.scopes) == 1
+
+    async def test_token_error_is_raised(self):
+        endpoint = TokenEndpointStub()
+        endpoint.error = "invalid_client"
+        credentials = create_credentials(endpoint)
+
+        with self.assertRaises(PermissionError):
+            await credentials.get_access_token_async()
+
+    async def test_token_is_acquired_off_the_event_loop(self):
+        threads = []
+
+        class StubCredentials(MicrosoftAppCredentials):
+            def _acquire_token(self, force_refresh: bool = False) -> dict:
+                threads.append(threading.current_thread())
+                return {"access_token": "token", "expires_in": 3600}
+
+        credentials = StubCredentials("some_app", "some_password")
+
+        assert await credentials.get_access_token_async() == "token"
+        assert threads and threads[0] is not threading.current_thread()
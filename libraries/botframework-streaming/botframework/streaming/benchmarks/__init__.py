@@ -0,0 +1,9 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""
+Micro-benchmarks of hot paths in botframework-streaming.
+
+Each module can be run on its own, for example::
+
+    python -m botframework.streaming.benchmarks.header_serializer_benchmark
+"""
@@ -0,0 +1,337 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""
+Load tests a streaming connection over an in-process web socket pair, through
+:class:`ProtocolAdapter`, :class:`PayloadSender` and :class:`PayloadReceiver`.
+
+Run with ``python -m botframework.streaming.benchmarks.connection_benchmark [--number N] [--output FILE]``.
+The results are written as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from .. import (
+    ProtocolAdapter,
+    ReceiveRequest,
+    RequestHandler,
+    StreamingRequest,
+    StreamingResponse,
+)
+from ..payloads import RequestManager
+from ..payload_transport import PayloadReceiver, PayloadSender
+from ..transport.web_socket import (
+    WebSocket,
+    WebSocketCloseStatus,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketState,
+    WebSocketTransport,
+)
+
+
+class InMemoryWebSocket(WebSocket):
+    """
+    One end of a web socket pair that exchanges messages through in-process queues.
+    """
+
+    def __init__(self):
+        self.peer: "InMemoryWebSocket" = None
+        self.bytes_sent = 0
+        self._messages: "asyncio.Queue[WebSocketMessage]" = asyncio.Queue()
+        self._state = WebSocketState.OPEN
+
+    @staticmethod
+    def create_pair() -> Tuple["InMemoryWebSocket", "InMemoryWebSocket"]:
+        first, second = InMemoryWebSocket(), InMemoryWebSocket()
+        first.peer, second.peer = second, first
+        return first, second
+
+    def dispose(self):
+        pass
+
+    async def close(self, close_status: WebSocketCloseStatus, status_description: str):
+        if self._state == WebSocketState.OPEN:
+            self._state = WebSocketState.CLOSED
+            self.peer._messages.put_nowait(  # pylint: disable=protected-access
+                WebSocketMessage(message_type=WebSocketMessageType.CLOSE, data=b"")
+            )
+
+    async def receive(self) -> WebSocketMessage:
+        return await self._messages.get()
+
+    async def send(
+        self, buffer: Any, message_type: WebSocketMessageType, end_of_message: bool
+    ):
+        if self._state != WebSocketState.OPEN:
+            raise RuntimeError("The web socket is closed")
+
+        # the sender can reuse its buffer once the send completes, as with a real socket
+        data = bytes(buffer)
+        self.bytes_sent += len(data)
+        self.peer._messages.put_nowait(  # pylint: disable=protected-access
+            WebSocketMessage(message_type=message_type, data=data)
+        )
+
+    @property
+    def status(self) -> WebSocketState:
+        return self._state
+
+
+class Scenario:
+    """
+    A kind of request sent during the benchmark.
+
+    :param name: The name of the results of the scenario
+    :param share: The number of requests of the scenario, as a share of the benchmark number
+    :param concurrency: The number of requests in flight at any time
+    :param attachments: The number of attachment streams of each request
+    :param attachment_length: The bytes of each attachment
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        share: float = 1.0,
+        concurrency: int = 1,
+        attachments: int = 0,
+        attachment_length: int = 0,
+    ):
+        self.name = name
+        self.share = share
+        self.concurrency = concurrency
+        self.attachments = attachments
+        self.attachment_length = attachment_length
+
+
+SCENARIOS = [
+    Scenario("small_activities", concurrency=8),
+    Scenario(
+        "large_attachments", share=0.05, attachments=1, attachment_length=512 * 1024
+    ),
+    Scenario(
+        "concurrent_streams",
+        share=0.5,
+        concurrency=64,
+        attachments=4,
+        attachment_length=16 * 1024,
+    ),
+]
+
+
+def create_activity_body(index: int) -> str:
+    return json.dumps(
+        {
+            "type": "message",
+            "id": f"activity-{index}",
+            "channelId": "directlinespeech",
+            "serviceUrl": "urn:botframework:websocket:directlinespeech",
+            "from": {"id": "user-id", "name": "User"},
+            "recipient": {"id": "bot-id", "name": "Bot"},
+            "conversation": {"id": f"conversation-{index % 16}"},
+            "text": "Hello, this is a benchmark message",
+            "locale": "en-US",
+        }
+    )
+
+
+class EchoRequestHandler(RequestHandler):
+    """
+    Reads the body and the attachments of each request, and answers with a small body.
+    """
+
+    async def process_request(
+        self,
+        request: ReceiveRequest,
+        logger: Any,  # pylint: disable=unused-argument
+        context: object,  # pylint: disable=unused-argument
+    ) -> StreamingResponse:
+        length = len(await request.read_body_as_str())
+        for content_stream in request.streams[1:]:
+            async for chunk in content_stream.stream:
+                length += len(chunk)
+
+        response = StreamingResponse.ok()
+        response.set_body(json.dumps({"id": "response-id", "length": length}))
+        return response
+
+
+def connect(
+    web_socket: WebSocket,
+    request_handler: RequestHandler = None,
+    coalesce_frames: bool = True,
+) -> ProtocolAdapter:
+    """
+    Runs a streaming connection over one end of the web socket pair, as :class:`WebSocketServer` does.
+    """
+    transport = WebSocketTransport(web_socket)
+    sender = PayloadSender(coalesce_frames=coalesce_frames)
+    receiver = PayloadReceiver()
+    adapter = ProtocolAdapter(request_handler, RequestManager(), sender, receiver)
+
+    sender.connect(transport)
+    asyncio.ensure_future(receiver.connect(transport))
+    return adapter
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_scenario(
+    client: ProtocolAdapter,
+    client_socket: InMemoryWebSocket,
+    scenario: Scenario,
+    requests: int,
+) -> Dict[str, float]:
+    """
+    Sends the requests of a scenario and measures them.
+
+    :return: The requests per second, the latency percentiles in milliseconds and the bytes per second
+    """
+    attachment = bytes(range(256)) * (scenario.attachment_length // 256)
+    latencies: List[float] = []
+    next_index = 0
+
+    async def send_requests():
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+
+            request = StreamingRequest.create_post("/api/messages")
+            request.set_body(create_activity_body(index))
+            for _ in range(scenario.attachments):
+                request.add_stream(attachment)
+
+            started = perf_counter()
+            response = await client.send_request(request)
+            for content_stream in response.streams:
+                await content_stream.stream.read_until_end()
+            latencies.append(perf_counter() - started)
+
+            if response.status_code != 200:
+                raise RuntimeError(f"Request failed with status {response.status_code}")
+
+    bytes_sent = client_socket.bytes_sent
+    started = perf_counter()
+    await asyncio.gather(
+        *[send_requests() for _ in range(min(scenario.concurrency, requests))]
+    )
+    elapsed = perf_counter() - started
+    bytes_sent = client_socket.bytes_sent - bytes_sent
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": scenario.concurrency,
+        "seconds": elapsed,
+        "requests_per_second": requests / elapsed,
+        "latency_p50_ms": percentile(latencies, 50) * 1000,
+        "latency_p99_ms": percentile(latencies, 99) * 1000,
+        "bytes_sent": bytes_sent,
+        "bytes_per_second": bytes_sent / elapsed,
+    }
+
+
+async def run_async(
+    number: int = 1000,
+    serve: Callable[[WebSocket], Awaitable] = None,
+    coalesce_frames: bool = True,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Runs every scenario over a single connection.
+
+    :param number: The number of requests the shares of the scenarios are taken from
+    :type number: int
+    :param serve: Starts the server end on its web socket, by default an :class:`EchoRequestHandler`
+    :param coalesce_frames: Whether the client coalesces the packets it writes
+    :type coalesce_frames: bool
+    :return: The measures of each scenario
+    """
+    client_socket, server_socket = InMemoryWebSocket.create_pair()
+
+    if serve:
+        await serve(server_socket)
+    else:
+        connect(server_socket, EchoRequestHandler(), coalesce_frames)
+    client = connect(client_socket, coalesce_frames=coalesce_frames)
+
+    results = {}
+    for scenario in SCENARIOS:
+        requests = max(1, int(number * scenario.share))
+        results[scenario.name] = await run_scenario(
+            client, client_socket, scenario, requests
+        )
+
+    return results
+
+
+def run(
+    number: int = 1000, coalesce_frames: bool = True
+) -> Dict[str, Dict[str, float]]:
+    """
+    Runs the benchmark with an :class:`EchoRequestHandler` as the server.
+
+    :param number: The number of requests the shares of the scenarios are taken from
+    :type number: int
+    :return: The measures of each scenario
+    """
+    return run_in_new_loop(run_async(number, coalesce_frames=coalesce_frames))
+
+
+def run_in_new_loop(benchmark: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Runs the benchmark in an event loop of its own, which leaves the event loop of the caller untouched.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(benchmark)
+    finally:
+        # the connections are still receiving, their tasks end with the event loop
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+
+
+def write_results(results: Dict[str, Any], output: str = None):
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if output:
+        with open(output, "w") as file:
+            file.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def create_argument_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--output", help="The file the JSON results are written to")
+    parser.add_argument(
+        "--no-coalesce-frames",
+        dest="coalesce_frames",
+        action="store_false",
+        help="Write every header and payload as a message of its own",
+    )
+    return parser
+
+
+def main():
+    args = create_argument_parser(__doc__).parse_args()
+
+    write_results(run(args.number, args.coalesce_frames), args.output)
+
+
+if __name__ == "__main__":
+    main()
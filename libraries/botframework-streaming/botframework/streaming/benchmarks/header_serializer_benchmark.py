@@ -0,0 +1,111 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""
+Compares the packed :class:`HeaderSerializer` with writing and reading the header byte by byte.
+
+Run with ``python -m botframework.streaming.benchmarks.header_serializer_benchmark [--number N]``.
+"""
+
+import argparse
+import timeit
+from typing import Callable, Dict, List
+from uuid import UUID, uuid4
+
+from ..payloads import HeaderSerializer
+from ..payloads.models import Header, PayloadTypes
+from ..transport import TransportConstants
+
+
+def create_header() -> Header:
+    header = Header(type=PayloadTypes.REQUEST, id=uuid4(), end=True)
+    header.payload_length = 168
+    return header
+
+
+def _byte_by_byte_serialize(header: Header, buffer: List[int]) -> int:
+    buffer[0] = list(header.type.encode())[0]
+    buffer[1] = HeaderSerializer.DELIMITER
+    length = list("{:06d}".format(header.payload_length).encode("ascii"))
+    buffer[2 : 2 + len(length)] = length
+    buffer[8] = HeaderSerializer.DELIMITER
+    identifier = list(str(header.id).encode("ascii"))
+    buffer[9 : 9 + len(identifier)] = identifier
+    buffer[45] = HeaderSerializer.DELIMITER
+    buffer[46] = HeaderSerializer.END if header.end else HeaderSerializer.NOT_END
+    buffer[47] = HeaderSerializer.TERMINATOR
+    return TransportConstants.MAX_HEADER_LENGTH
+
+
+def _byte_by_byte_deserialize(buffer: List[int]) -> Header:
+    header = Header(type=bytes([buffer[0]]).decode("ascii"))
+    if buffer[1] != HeaderSerializer.DELIMITER:
+        raise ValueError("Header type delimeter is malformed")
+    header.payload_length = int(bytes(buffer[2:8]).decode("ascii"))
+    if buffer[8] != HeaderSerializer.DELIMITER:
+        raise ValueError("Header length delimeter is malformed")
+    header.id = UUID(bytes(buffer[9:45]).decode("ascii"))
+    if buffer[45] != HeaderSerializer.DELIMITER:
+        raise ValueError("Header id delimeter is malformed")
+    if buffer[46] not in [HeaderSerializer.END, HeaderSerializer.NOT_END]:
+        raise ValueError("Header end is malformed")
+    header.end = buffer[46] == HeaderSerializer.END
+    if buffer[47] != HeaderSerializer.TERMINATOR:
+        raise ValueError("Header terminator is malformed")
+    return header
+
+
+def run(number: int = 1000000) -> Dict[str, float]:
+    """
+    Runs the benchmark.
+
+    :param number: The number of headers timed per case
+    :type number: int
+    :return: The average microseconds per header of each case
+    """
+    header = create_header()
+    size = TransportConstants.MAX_HEADER_LENGTH
+    list_buffer: List[int] = [0] * size
+    byte_buffer = bytearray(size)
+    HeaderSerializer.serialize(header, byte_buffer, 0)
+    _byte_by_byte_serialize(header, list_buffer)
+
+    cases: Dict[str, Callable[[], object]] = {
+        "serialize (byte by byte, list)": lambda: _byte_by_byte_serialize(
+            header, list_buffer
+        ),
+        "serialize (packed, list)": lambda: HeaderSerializer.serialize(
+            header, list_buffer, 0
+        ),
+        "serialize (packed, bytearray)": lambda: HeaderSerializer.serialize(
+            header, byte_buffer, 0
+        ),
+        "deserialize (byte by byte, list)": lambda: _byte_by_byte_deserialize(
+            list_buffer
+        ),
+        "deserialize (packed, list)": lambda: HeaderSerializer.deserialize(
+            list_buffer, 0, size
+        ),
+        "deserialize (packed, bytearray)": lambda: HeaderSerializer.deserialize(
+            byte_buffer, 0, size
+        ),
+    }
+
+    results = {}
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=number, repeat=3))
+        results[name] = seconds / number * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1000000)
+    args = parser.parse_args()
+
+    for name, microseconds in run(args.number).items():
+        print(f"{name:<45} {microseconds:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,76 +2,158 @@
 # Licensed under the MIT License.
 
 from asyncio import Lock, Semaphore
-from typing import List
+from typing import AsyncIterator, List
 
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.transport import Buffer, TransportConstants, as_buffer
 
 
 class PayloadStream:
+    """
+    The content of a stream payload, as it is received.
+
+    .. remarks::
+        The content can be read as a whole with `read_until_end`, or chunk by chunk with `async for`,
+        which holds at most `max_buffered_length` unread bytes received after the iteration started.
+        The receiver doesn't wait for a consumer, since that would hold every stream of the connection:
+        a stream exceeding the bound drops its content, and reading it raises a RuntimeError.
+    """
+
+    DEFAULT_MAX_BUFFERED_LENGTH = 256 * TransportConstants.MAX_PAYLOAD_LENGTH
+
     def __init__(self, assembler: PayloadStreamAssembler):
         self._assembler = assembler
-        self._buffer_queue: List[List[int]] = []
+        self._buffer_queue: List[memoryview] = []
         self._lock = Lock()
         self._data_available = Semaphore(0)
         self._producer_length = 0  # total length
         self._consumer_position = 0  # read position
-        self._active: List[int] = []
+        self._active: memoryview = None
         self._active_offset = 0
         self._end = False
+        self._max_buffered_length: int = None
+        self._bounded_position = 0  # the position the bound applies from
+        self._error: Exception = None
 
     def __len__(self):
         return self._producer_length
 
-    def give_buffer(self, buffer: List[int]):
+    def __aiter__(self) -> AsyncIterator[memoryview]:
+        return self.chunks()
+
+    def give_buffer(self, buffer: Buffer):
+        if self._error:
+            # the content of a failed stream is dropped
+            return
+
+        # the buffer is kept as is, the producer must not change it afterwards
+        buffer = memoryview(as_buffer(buffer))
         self._buffer_queue.append(buffer)
         self._producer_length += len(buffer)
 
+        if (
+            self._max_buffered_length is not None
+            and self._producer_length
+            - max(self._consumer_position, self._bounded_position)
+            > self._max_buffered_length
+        ):
+            self._error = RuntimeError(
+                f"The stream holds more than {self._max_buffered_length} unread bytes"
+            )
+            self._buffer_queue.clear()
+
         self._data_available.release()
 
     def done_producing(self):
-        self.give_buffer([])
+        self.give_buffer(b"")
 
-    def write(self, buffer: List[int], offset: int, count: int):
-        buffer_copy = buffer[offset : offset + count]
+    def write(self, buffer: Buffer, offset: int, count: int):
+        buffer_copy = bytes(as_buffer(buffer)[offset : offset + count])
         self.give_buffer(buffer_copy)
 
-    async def read(self, buffer: List[int], offset: int, count: int):
+    async def read(self, buffer: Buffer, offset: int, count: int):
+        chunk = await self._read_chunk(count)
+
+        buffer[offset : offset + len(chunk)] = chunk
+
+        return len(chunk)
+
+    async def read_until_end(self) -> bytearray:
+        result = bytearray(self._assembler.content_length)
+        view = memoryview(result)
+        current_size = 0
+
+        while not self._end:
+            count = await self.read(
+                view, current_size, self._assembler.content_length - current_size
+            )
+            current_size += count
+
+        return result
+
+    def chunks(
+        self, max_buffered_length: int = DEFAULT_MAX_BUFFERED_LENGTH
+    ) -> AsyncIterator[memoryview]:
+        """
+        Iterates the content as the chunks are received.
+
+        :param max_buffered_length: The unread bytes, received from now on, held before the stream fails
+        :type max_buffered_length: int
+        :return: Views of the received buffers, which aren't reused afterwards
+        """
+        self._max_buffered_length = max_buffered_length
+        # the content buffered before the iteration is already held
+        self._bounded_position = self._producer_length
+        return self._iterate_chunks()
+
+    async def _iterate_chunks(self) -> AsyncIterator[memoryview]:
+        try:
+            while not self._end:
+                chunk = await self._read_chunk(TransportConstants.MAX_LENGTH)
+                if chunk:
+                    yield chunk
+        finally:
+            # the stream doesn't fail once its consumer stops early
+            self._max_buffered_length = None
+
+    async def _read_chunk(self, count: int) -> memoryview:
+        if self._error:
+            raise self._error
+
         if self._end:
-            return 0
+            return memoryview(b"")
 
         if not self._active:
             await self._data_available.acquire()
+            if self._error:
+                raise self._error
             async with self._lock:
                 self._active = self._buffer_queue.pop(0)
 
+            # done_producing queues an empty buffer after the last one
+            if not self._active:
+                self._active = None
+                self._end = True
+                return memoryview(b"")
+
         available_count = min(len(self._active) - self._active_offset, count)
 
-        for index in range(available_count):
-            buffer[offset + index] = self._active[self._active_offset]
-            self._active_offset += 1
+        chunk = self._active[
+            self._active_offset : self._active_offset + available_count
+        ]
+        self._active_offset += available_count
 
         self._consumer_position += available_count
 
         if self._active_offset >= len(self._active):
-            self._active = []
+            self._active = None
             self._active_offset = 0
 
         if (
             self._assembler
+            and self._assembler.content_length is not None
             and self._consumer_position >= self._assembler.content_length
         ):
             self._end = True
 
-        return available_count
-
-    async def read_until_end(self):
-        result = [None] * self._assembler.content_length
-        current_size = 0
-
-        while not self._end:
-            count = await self.read(
-                result, current_size, self._assembler.content_length
-            )
-            current_size += count
-
-        return result
+        return chunk
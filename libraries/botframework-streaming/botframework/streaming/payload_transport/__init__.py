@@ -5,6 +5,7 @@
 from .payload_receiver import PayloadReceiver
 from .payload_sender import PayloadSender
 from .send_packet import SendPacket
+from .send_queue import SendQueueMetrics
 
 
-__all__ = ["PayloadReceiver", "PayloadSender", "SendPacket"]
+__all__ = ["PayloadReceiver", "PayloadSender", "SendPacket", "SendQueueMetrics"]
@@ -4,12 +4,13 @@
 import traceback
 
 from asyncio import iscoroutinefunction, isfuture
-from typing import Callable, List
+from typing import Callable
 
 import botframework.streaming as streaming
 from botframework.streaming.payloads import HeaderSerializer
 from botframework.streaming.payloads.models import Header, PayloadTypes
 from botframework.streaming.transport import (
+    Buffer,
     DisconnectedEventArgs,
     TransportConstants,
     TransportReceiverBase,
@@ -18,17 +19,13 @@ from botframework.streaming.transport import (
 
 class PayloadReceiver:
     def __init__(self):
-        self._get_stream: Callable[[Header], List[int]] = None
-        self._receive_action: Callable[[Header, List[int], int], None] = None
+        self._get_stream: Callable[[Header], Buffer] = None
+        self._receive_action: Callable[[Header, Buffer, int], None] = None
         self._receiver: TransportReceiverBase = None
         self._is_disconnecting = False
 
-        self._receive_header_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_HEADER_LENGTH
-        self._receive_content_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_PAYLOAD_LENGTH
+        self._receive_header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+        self._receive_content_buffer = bytearray(TransportConstants.MAX_PAYLOAD_LENGTH)
 
         self.disconnected: Callable[[object, DisconnectedEventArgs], None] = None
 
@@ -48,8 +45,8 @@ class PayloadReceiver:
 
     def subscribe(
         self,
-        get_stream: Callable[[Header], List[int]],
-        receive_action: Callable[[Header, List[int]], int],
+        get_stream: Callable[[Header], Buffer],
+        receive_action: Callable[[Header, Buffer], int],
     ):
         self._get_stream = get_stream
         self._receive_action = receive_action
@@ -95,10 +92,11 @@ class PayloadReceiver:
             try:
                 # read the header
                 header_offset = 0
+                header_view = memoryview(self._receive_header_buffer)
                 # TODO: this while is probalby not necessary
                 while header_offset < TransportConstants.MAX_HEADER_LENGTH:
                     length = await self._receiver.receive(
-                        self._receive_header_buffer,
+                        header_view,
                         header_offset,
                         TransportConstants.MAX_HEADER_LENGTH - header_offset,
                     )
@@ -119,11 +117,14 @@ class PayloadReceiver:
                 # read the payload
                 content_stream = self._get_stream(header)
 
+                # stream payloads are handed over, so they get a buffer of their own
                 buffer = (
-                    [None] * header.payload_length
+                    bytearray(header.payload_length)
                     if PayloadTypes.is_stream(header)
+                    or header.payload_length > len(self._receive_content_buffer)
                     else self._receive_content_buffer
                 )
+                view = memoryview(buffer)
                 offset = 0
 
                 if header.payload_length:
@@ -134,7 +135,7 @@ class PayloadReceiver:
                         )
 
                         # Send: Packet content
-                        length = await self._receiver.receive(buffer, offset, count)
+                        length = await self._receiver.receive(view, offset, count)
                         if length == 0:
                             # TODO: make custom exception
                             raise Exception(
@@ -143,10 +144,10 @@ class PayloadReceiver:
 
                         if content_stream is not None:
                             # write chunks to the content_stream if it's not a stream type
-                            # TODO: this has to be improved in custom buffer class (validate buffer ended)
                             if not PayloadTypes.is_stream(header):
-                                for index in range(offset, offset + length):
-                                    content_stream[index] = buffer[index]
+                                content_stream[offset : offset + length] = view[
+                                    offset : offset + length
+                                ]
 
                         offset += length
 
@@ -8,28 +8,44 @@ from botframework.streaming.transport import (
     DisconnectedEventArgs,
     TransportSenderBase,
     TransportConstants,
+    as_buffer,
 )
 from botframework.streaming.payloads import HeaderSerializer
 from botframework.streaming.payloads.models import Header
 
-from .send_queue import SendQueue
+from .send_queue import SendQueue, SendQueueMetrics
 from .send_packet import SendPacket
 
 
 # TODO: consider interface this class
 class PayloadSender:
-    def __init__(self):
+    """
+    Writes the payloads of a streaming connection to its transport.
+
+    :param max_queue_size: The number of packets queued before `send_payload` callers have to wait
+    :type max_queue_size: int
+    :param coalesce_frames: Whether packets queued together are written as a single transport send. The receiving
+     end must read the transport as a stream of bytes, rather than a header or payload per message.
+    :type coalesce_frames: bool
+    """
+
+    # the largest send that coalesced packets are gathered into
+    MAX_COALESCED_LENGTH = 4 * (
+        TransportConstants.MAX_HEADER_LENGTH + TransportConstants.MAX_PAYLOAD_LENGTH
+    )
+
+    def __init__(self, max_queue_size: int = 100, coalesce_frames: bool = False):
         self._connected_event = Event()
         self._sender: TransportSenderBase = None
         self._is_disconnecting: bool = False
-        self._send_header_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_HEADER_LENGTH
-        self._send_content_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_PAYLOAD_LENGTH
+        self._send_header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+        self._coalesce_frames = coalesce_frames
 
-        self._send_queue = SendQueue(action=self._write_packet)
+        self._send_queue = SendQueue(
+            action=self._write_packets,
+            max_size=max_queue_size,
+            size=PayloadSender._packet_length,
+        )
 
         self.disconnected: Callable[[object, DisconnectedEventArgs], None] = None
 
@@ -37,6 +53,13 @@ class PayloadSender:
     def is_connected(self) -> bool:
         return self._sender is not None
 
+    @property
+    def metrics(self) -> SendQueueMetrics:
+        """
+        The queue depth, wait time and bytes in flight of the packets sent.
+        """
+        return self._send_queue.metrics
+
     def connect(self, sender: TransportSenderBase):
         if self._sender:
             raise RuntimeError(f"{self.__class__.__name__} instance already connected.")
@@ -51,7 +74,14 @@ class PayloadSender:
         payload: object,
         is_length_known: bool,
         sent_callback: Callable[[Header], Awaitable],
-    ):
+    ) -> Awaitable:
+        """
+        Queues a packet to be written to the transport.
+
+        .. remarks::
+            The packet is always queued. The returned awaitable completes when the queue has room for it,
+            awaiting it keeps the callers from queueing faster than the transport writes.
+        """
         packet = SendPacket(
             header=header,
             payload=payload,
@@ -59,7 +89,7 @@ class PayloadSender:
             sent_callback=sent_callback,
         )
 
-        self._send_queue.post(packet)
+        return self._send_queue.post(packet)
 
     async def disconnect(self, event_args: DisconnectedEventArgs = None):
         did_disconnect = False
@@ -94,64 +124,93 @@ class PayloadSender:
             finally:
                 self._is_disconnecting = False
 
-    async def _write_packet(self, packet: SendPacket):
+    @staticmethod
+    def _packet_length(packet: SendPacket) -> int:
+        return TransportConstants.MAX_HEADER_LENGTH + (
+            packet.header.payload_length if packet.payload else 0
+        )
+
+    async def _write_packets(self, packets: List[SendPacket]):
         await self._connected_event.wait()
 
         try:
-            # determine if we know the payload length and end
-            if not packet.is_length_known:
-                count = packet.header.payload_length
-                packet.header.end = count == 0
-
-            header_length = HeaderSerializer.serialize(
-                packet.header, self._send_header_buffer, 0
-            )
-
-            # Send: Packet Header
-            length = await self._sender.send(self._send_header_buffer, 0, header_length)
-            if not length:
-                # TODO: make custom exception
-                raise Exception("TransportDisconnectedException")
-
-            offset = 0
-
-            # Send content in chunks
-            if packet.header.payload_length and packet.payload:
-                # If we already read the buffer, send that
-                # If we did not, read from the stream until we've sent that amount
+            frame = bytearray()
+
+            for packet in packets:
+                # determine if we know the payload length and end
                 if not packet.is_length_known:
-                    # Send: Packet content
-                    length = await self._sender.send(
-                        self._send_content_buffer, 0, packet.header.payload_length
-                    )
-                    if length == 0:
-                        # TODO: make custom exception
-                        raise Exception("TransportDisconnectedException")
+                    count = packet.header.payload_length
+                    packet.header.end = count == 0
+
+                if (
+                    self._coalesce_frames
+                    and packet.header.payload_length
+                    <= TransportConstants.MAX_PAYLOAD_LENGTH
+                ):
+                    if len(frame) + self._packet_length(packet) > (
+                        self.MAX_COALESCED_LENGTH
+                    ):
+                        await self._send(frame)
+                        frame = bytearray()
+                    self._append_packet(packet, frame)
                 else:
-                    while offset < packet.header.payload_length:
-                        count = min(
-                            packet.header.payload_length - offset,
-                            TransportConstants.MAX_PAYLOAD_LENGTH,
-                        )
-
-                        # copy the stream to the buffer
-                        # TODO: this has to be improved in custom buffer class (validate buffer ended)
-                        for index in range(count):
-                            self._send_content_buffer[index] = packet.payload[index]
-
-                        # Send: Packet content
-                        length = await self._sender.send(
-                            self._send_content_buffer, 0, count
-                        )
-                        if length == 0:
-                            # TODO: make custom exception
-                            raise Exception("TransportDisconnectedException")
-
-                        offset += count
-
-            if packet.sent_callback:
-                # TODO: should this really run in the background?
-                ensure_future(packet.sent_callback(packet.header))
+                    await self._send(frame)
+                    frame = bytearray()
+                    await self._write_packet(packet)
+
+            await self._send(frame)
+
+            # the callbacks can send more payloads, so they run outside of the queue processing
+            for packet in packets:
+                if packet.sent_callback:
+                    ensure_future(packet.sent_callback(packet.header))
         except Exception as exception:
             disconnected_args = DisconnectedEventArgs(reason=str(exception))
             await self.disconnect(disconnected_args)
+
+    def _append_packet(self, packet: SendPacket, frame: bytearray):
+        HeaderSerializer.serialize(packet.header, self._send_header_buffer, 0)
+        frame += self._send_header_buffer
+
+        if packet.header.payload_length and packet.payload:
+            payload = memoryview(as_buffer(packet.payload))
+            frame += payload[: packet.header.payload_length]
+
+    async def _send(self, frame: bytearray):
+        if not frame:
+            return
+
+        length = await self._sender.send(frame, 0, len(frame))
+        if not length:
+            # TODO: make custom exception
+            raise Exception("TransportDisconnectedException")
+
+    async def _write_packet(self, packet: SendPacket):
+        header_length = HeaderSerializer.serialize(
+            packet.header, self._send_header_buffer, 0
+        )
+
+        # Send: Packet Header
+        length = await self._sender.send(self._send_header_buffer, 0, header_length)
+        if not length:
+            # TODO: make custom exception
+            raise Exception("TransportDisconnectedException")
+
+        offset = 0
+
+        # Send content in chunks, as views of the payload so that it isn't copied
+        if packet.header.payload_length and packet.payload:
+            payload = memoryview(as_buffer(packet.payload))
+            while offset < packet.header.payload_length:
+                count = min(
+                    packet.header.payload_length - offset,
+                    TransportConstants.MAX_PAYLOAD_LENGTH,
+                )
+
+                # Send: Packet content
+                length = await self._sender.send(payload, offset, count)
+                if length == 0:
+                    # TODO: make custom exception
+                    raise Exception("TransportDisconnectedException")
+
+                offset += count
@@ -3,38 +3,142 @@
 
 import traceback
 
-from asyncio import Queue, ensure_future
-from typing import Awaitable, Callable
+from asyncio import Future, Queue, ensure_future, get_event_loop
+from collections import deque
+from time import perf_counter
+from typing import Awaitable, Callable, Deque, List, Tuple
+
+
+class SendQueueMetrics:
+    """
+    Measures the packets waiting in a :class:`SendQueue`.
+
+    .. remarks::
+        `queue_depth` counts the packets posted but not yet taken by a write, including the ones waiting for
+        room in the queue. `bytes_in_flight` counts the bytes of the packets posted but not yet written.
+        The wait time of a packet goes from the time it is posted to the time its write starts.
+    """
+
+    def __init__(self):
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.bytes_in_flight: int = 0
+        self.max_bytes_in_flight: int = 0
+        self.packets_written: int = 0
+        self.batches: int = 0
+        self.total_wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """
+        The average seconds the written packets waited in the queue.
+        """
+        return (
+            self.total_wait_time / self.packets_written if self.packets_written else 0.0
+        )
 
 
 class SendQueue:
-    def __init__(self, action: Callable[[object], Awaitable], timeout: int = 30):
+    """
+    Hands the posted items to an action, in order and in batches.
+
+    .. remarks::
+        The queue holds at most `max_size` items. `post` always accepts the item, and returns an awaitable that
+        completes once the item has room in the queue, so that callers awaiting it slow down with the transport.
+        The items waiting for room are bounded by the callers awaiting them, one each. Callers that don't await
+        it aren't slowed down, and their items wait in memory.
+        The action receives every item available when it's called, up to `max_batch_size`.
+    """
+
+    def __init__(
+        self,
+        action: Callable[[List[object]], Awaitable],
+        timeout: int = 30,
+        max_size: int = 100,
+        max_batch_size: int = 32,
+        size: Callable[[object], int] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("SendQueue max_size must be greater than 0")
+        if max_batch_size < 1:
+            raise ValueError("SendQueue max_batch_size must be greater than 0")
+
         self._action = action
 
-        self._queue = Queue()
+        self._queue = Queue(maxsize=max_size)
+        self._waiting: Deque[Tuple[object, float, Future]] = deque()
         self._timeout_seconds = timeout
+        self._max_batch_size = max_batch_size
+        self._size = size
+        self.metrics = SendQueueMetrics()
 
         # TODO: this have to be abstracted so can remove asyncio dependency
         ensure_future(self._process())
 
-    def post(self, item: object):
-        self._post_internal(item)
+    def post(self, item: object) -> Awaitable:
+        return self._post_internal(item)
+
+    def _post_internal(self, item: object) -> Future:
+        admitted = get_event_loop().create_future()
+        self._waiting.append((item, perf_counter(), admitted))
+
+        metrics = self.metrics
+        metrics.queue_depth += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+        if self._size:
+            metrics.bytes_in_flight += self._size(item)
+            metrics.max_bytes_in_flight = max(
+                metrics.max_bytes_in_flight, metrics.bytes_in_flight
+            )
+
+        self._admit()
+        return admitted
 
-    def _post_internal(self, item: object):
-        self._queue.put_nowait(item)
+    def _admit(self):
+        # items wait in post order, a new item never overtakes one waiting for room
+        while self._waiting and not self._queue.full():
+            item, posted_at, admitted = self._waiting.popleft()
+            self._queue.put_nowait((item, posted_at))
+            if not admitted.done():
+                admitted.set_result(None)
 
     async def _process(self):
         while True:
             try:
                 while True:
-                    item = await self._queue.get()
+                    batch = [await self._queue.get()]
+                    while len(batch) < self._max_batch_size and not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                    self._admit()
+
+                    items = [item for item, _ in batch]
+                    self._record_dequeued(batch)
                     try:
-                        await self._action(item)
+                        await self._action(items)
                     except Exception:
                         traceback.print_exc()
                     finally:
-                        self._queue.task_done()
+                        self._record_written(items)
+                        for _ in batch:
+                            self._queue.task_done()
             except Exception:
                 # AppInsights.TrackException(e)
                 traceback.print_exc()
                 return
+
+    def _record_dequeued(self, batch: List[Tuple[object, float]]):
+        metrics = self.metrics
+        now = perf_counter()
+        for _, posted_at in batch:
+            wait_time = now - posted_at
+            metrics.total_wait_time += wait_time
+            metrics.max_wait_time = max(metrics.max_wait_time, wait_time)
+        metrics.queue_depth -= len(batch)
+
+    def _record_written(self, items: List[object]):
+        metrics = self.metrics
+        metrics.packets_written += len(items)
+        metrics.batches += 1
+        if self._size:
+            metrics.bytes_in_flight -= sum(self._size(item) for item in items)
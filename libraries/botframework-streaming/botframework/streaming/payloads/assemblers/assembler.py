@@ -5,9 +5,8 @@
 from abc import ABC
 from uuid import UUID
 
-from typing import List
-
 from botframework.streaming.payloads.models import Header
+from botframework.streaming.transport import Buffer
 
 
 class Assembler(ABC):
@@ -18,13 +17,11 @@ class Assembler(ABC):
     def close(self):
         raise NotImplementedError()
 
-    def create_stream_from_payload(self) -> List[int]:
+    def create_stream_from_payload(self) -> Buffer:
         raise NotImplementedError()
 
-    def get_payload_as_stream(self) -> List[int]:
+    def get_payload_as_stream(self) -> Buffer:
         raise NotImplementedError()
 
-    def on_receive(
-        self, header: Header, stream: List[int], content_length: int
-    ) -> List[int]:
+    def on_receive(self, header: Header, stream: Buffer, content_length: int) -> Buffer:
         raise NotImplementedError()
@@ -2,11 +2,10 @@
 # Licensed under the MIT License.
 
 from uuid import UUID
-from typing import List
-
 import botframework.streaming as streaming
 import botframework.streaming.payloads as payloads
 from botframework.streaming.payloads.models import Header
+from botframework.streaming.transport import Buffer
 
 from .assembler import Assembler
 
@@ -37,7 +36,7 @@ class PayloadStreamAssembler(Assembler):
 
         return self._stream
 
-    def on_receive(self, header: Header, stream: List[int], content_length: int):
+    def on_receive(self, header: Header, stream: Buffer, content_length: int):
         if header.end:
             self.end = True
             self._stream.done_producing()
@@ -3,10 +3,11 @@
 
 import asyncio
 from uuid import UUID
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable
 
 import botframework.streaming as streaming
 import botframework.streaming.payloads as payloads
+from botframework.streaming.transport import Buffer, as_buffer
 from botframework.streaming.payloads.models import Header, ResponsePayload
 
 from .assembler import Assembler
@@ -31,18 +32,18 @@ class ReceiveResponseAssembler(Assembler):
         self._on_completed = on_completed
         self.identifier = header.id
         self._length = header.payload_length if header.end else None
-        self._stream: List[int] = None
+        self._stream: bytearray = None
 
-    def create_stream_from_payload(self) -> List[int]:
-        return [None] * (self._length or 0)
+    def create_stream_from_payload(self) -> bytearray:
+        return bytearray(self._length or 0)
 
-    def get_payload_as_stream(self) -> List[int]:
+    def get_payload_as_stream(self) -> bytearray:
         if self._stream is None:
             self._stream = self.create_stream_from_payload()
 
         return self._stream
 
-    def on_receive(self, header: Header, stream: List[int], content_length: int):
+    def on_receive(self, header: Header, stream: Buffer, content_length: int):
         if header.end:
             self.end = header.end
 
@@ -54,8 +55,8 @@ class ReceiveResponseAssembler(Assembler):
     def close(self):
         self._stream_manager.close_stream(self.identifier)
 
-    async def process_response(self, stream: List[int]):
-        response_payload = ResponsePayload().from_json(bytes(stream).decode("utf8"))
+    async def process_response(self, stream: Buffer):
+        response_payload = ResponsePayload().from_json(str(as_buffer(stream), "utf8"))
 
         response = streaming.ReceiveResponse(
             status_code=response_payload.status_code, streams=[]
@@ -64,7 +65,7 @@ class ReceiveResponseAssembler(Assembler):
         if response_payload.streams:
             for stream_description in response_payload.streams:
                 try:
-                    identifier = UUID(int=int(stream_description.id))
+                    identifier = UUID(stream_description.id)
                 except Exception:
                     raise ValueError(
                         f"Stream description id '{stream_description.id}' is not a Guid"
@@ -18,5 +18,5 @@ class CancelDisassembler:
 
         header.payload_length = 0
 
-        self._sender.send_payload(header, None, True, None)
+        await self._sender.send_payload(header, None, True, None)
         return
@@ -7,7 +7,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 from typing import List
 
-from botframework.streaming.transport import TransportConstants
+from botframework.streaming.transport import Buffer, TransportConstants, as_buffer
 from botframework.streaming.payload_transport import PayloadSender
 from botframework.streaming.payloads import ResponseMessageStream
 from botframework.streaming.payloads.models import (
@@ -23,7 +23,7 @@ class PayloadDisassembler(ABC):
         self.identifier = identifier
         self._task_completion_source = Future()
 
-        self._stream: List[int] = None
+        self._stream: memoryview = None
         self._stream_length: int = None
         self._send_offset: int = None
         self._is_end: bool = False
@@ -34,11 +34,11 @@ class PayloadDisassembler(ABC):
     def type(self) -> str:
         return self._type
 
-    async def get_stream(self) -> List[int]:
+    async def get_stream(self) -> Buffer:
         raise NotImplementedError()
 
     async def disassemble(self):
-        self._stream = await self.get_stream()
+        self._stream = memoryview(as_buffer(await self.get_stream()))
         self._stream_length = len(self._stream)
         self._send_offset = 0
 
@@ -49,16 +49,17 @@ class PayloadDisassembler(ABC):
         description = StreamDescription(id=str(stream.id))
 
         # TODO: This content type is hardcoded for POC, investigate how to proceed
-        content = bytes(stream.content).decode("utf8")
+        content_bytes = as_buffer(stream.content)
 
         try:
-            json.loads(content)
+            json.loads(str(content_bytes, "utf8"))
             content_type = "application/json"
         except ValueError:
             content_type = "text/plain"
 
         description.content_type = content_type
-        description.length = len(content)
+        # the length of the stream is in bytes, which can differ from the characters of the content
+        description.length = len(content_bytes)
 
         # TODO: validate statement below, also make the string a constant
         # content_length: int = stream.content.headers.get("Content-Length")
@@ -71,10 +72,9 @@ class PayloadDisassembler(ABC):
         return description
 
     @staticmethod
-    def serialize(item: Serializable, stream: List[int], length: List[int]):
+    def serialize(item: Serializable, stream: bytearray, length: List[int]):
         encoded_json = item.to_json().encode()
-        stream.clear()
-        stream.extend(list(encoded_json))
+        stream[:] = encoded_json
 
         length.clear()
         length.append(len(stream))
@@ -98,7 +98,11 @@ class PayloadDisassembler(ABC):
             )
             is_length_known = True
 
-        self.sender.send_payload(header, self._stream, is_length_known, self._on_send)
+        # the payload is a view of the part of the stream sent with this header
+        payload = self._stream[
+            self._send_offset : self._send_offset + header.payload_length
+        ]
+        await self.sender.send_payload(header, payload, is_length_known, self._on_send)
 
     async def _on_send(self, header: Header):
         self._send_offset += header.payload_length
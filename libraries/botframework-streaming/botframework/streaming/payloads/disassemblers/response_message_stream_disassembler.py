@@ -1,11 +1,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List
-
 from botframework.streaming.payload_transport import PayloadSender
 from botframework.streaming.payloads import ResponseMessageStream
 from botframework.streaming.payloads.models import PayloadTypes
+from botframework.streaming.transport import Buffer, as_buffer
 
 from .payload_disassembler import PayloadDisassembler
 
@@ -20,8 +19,6 @@ class ResponseMessageStreamDisassembler(PayloadDisassembler):
     def type(self) -> str:
         return PayloadTypes.STREAM
 
-    async def get_stream(self) -> List[int]:
+    async def get_stream(self) -> Buffer:
         # TODO: check if bypass is correct here or if serialization should take place.
-        # this is redundant -->stream: List[int] = list(str(self.content_stream.content).encode())
-
-        return self.content_stream.content
+        return as_buffer(self.content_stream.content)
@@ -1,18 +1,41 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from struct import Struct
 from uuid import UUID
-from typing import List
 
-from botframework.streaming.transport import TransportConstants
+from botframework.streaming.transport import Buffer, TransportConstants
 
-from .models import Header
+from .models import Header, PayloadTypes
 
 _CHAR_TO_BINARY_INT = {val.decode(): list(val)[0] for val in [b".", b"\n", b"1", b"0"]}
 
+# type, delimiter, length, delimiter, id, delimiter, end, terminator
+_HEADER_STRUCT = Struct("cc6sc36sccc")
+
+_TYPE_TO_BYTES = {
+    payload_type: payload_type.encode("ascii")
+    for payload_type in (
+        PayloadTypes.REQUEST,
+        PayloadTypes.RESPONSE,
+        PayloadTypes.STREAM,
+        PayloadTypes.CANCEL_ALL,
+        PayloadTypes.CANCEL_STREAM,
+    )
+}
+
 
-# TODO: consider abstracting the binary int list logic into a class for easier handling
 class HeaderSerializer:
+    """
+    Writes and reads the fixed-size header that precedes every payload on a streaming connection.
+
+    .. remarks::
+        A header is 48 ASCII bytes, for example `A.000168.68e999ca-a651-40f4-ad8f-3aaf781862b4.1\\n`.
+        It is packed into and unpacked from the buffer in a single operation with a precompiled
+        :class:`struct.Struct`. Buffers that aren't bytes-like, such as lists of ints, are written
+        and read through a bytes copy of the header.
+    """
+
     DELIMITER = _CHAR_TO_BINARY_INT["."]
     TERMINATOR = _CHAR_TO_BINARY_INT["\n"]
     END = _CHAR_TO_BINARY_INT["1"]
@@ -29,68 +52,53 @@ class HeaderSerializer:
     TERMINATOR_OFFSET = 47
 
     @staticmethod
-    def serialize(
-        header: Header,
-        buffer: List[int],
-        offset: int,  # pylint: disable=unused-argument
-    ) -> int:
-        # write type
-        buffer[HeaderSerializer.TYPE_OFFSET] = HeaderSerializer._char_to_binary_int(
-            header.type
-        )
-        buffer[HeaderSerializer.TYPE_DELIMITER_OFFSET] = HeaderSerializer.DELIMITER
-
-        # write length
-        length_binary_array: List[int] = list(
-            HeaderSerializer._int_to_formatted_encoded_str(
-                header.payload_length, "{:06d}"
-            )
-        )
-        HeaderSerializer._write_in_buffer(
-            length_binary_array, buffer, HeaderSerializer.LENGTH_OFFSET
+    def serialize(header: Header, buffer: Buffer, offset: int) -> int:
+        fields = (
+            _TYPE_TO_BYTES.get(header.type)
+            or bytes((HeaderSerializer._char_to_binary_int(header.type),)),
+            b".",
+            b"%06d" % header.payload_length,
+            b".",
+            str(header.id).encode("ascii"),
+            b".",
+            b"1" if header.end else b"0",
+            b"\n",
         )
-        buffer[HeaderSerializer.LENGTH_DELIMETER_OFFSET] = HeaderSerializer.DELIMITER
 
-        # write id
-        id_binary_array: List[int] = list(
-            HeaderSerializer._uuid_to_numeric_encoded_str(header.id)
-        )
-        HeaderSerializer._write_in_buffer(
-            id_binary_array, buffer, HeaderSerializer.ID_OFFSET
-        )
-        buffer[HeaderSerializer.ID_DELIMETER_OFFSET] = HeaderSerializer.DELIMITER
-
-        # write terminator
-        buffer[HeaderSerializer.END_OFFSET] = (
-            HeaderSerializer.END if header.end else HeaderSerializer.NOT_END
-        )
-        buffer[HeaderSerializer.TERMINATOR_OFFSET] = HeaderSerializer.TERMINATOR
+        if isinstance(buffer, (bytearray, memoryview)):
+            _HEADER_STRUCT.pack_into(buffer, offset, *fields)
+        else:
+            buffer[offset : offset + _HEADER_STRUCT.size] = _HEADER_STRUCT.pack(*fields)
 
         return TransportConstants.MAX_HEADER_LENGTH
 
     @staticmethod
-    def deserialize(
-        buffer: List[int], offset: int, count: int  # pylint: disable=unused-argument
-    ) -> Header:
+    def deserialize(buffer: Buffer, offset: int, count: int) -> Header:
         if count != TransportConstants.MAX_HEADER_LENGTH:
             raise ValueError("Cannot deserialize header, incorrect length")
 
-        header = Header(
-            type=HeaderSerializer._binary_int_to_char(
-                buffer[HeaderSerializer.TYPE_OFFSET]
-            )
-        )
-
-        if buffer[HeaderSerializer.TYPE_DELIMITER_OFFSET] != HeaderSerializer.DELIMITER:
+        if not isinstance(buffer, (bytes, bytearray, memoryview)):
+            buffer = bytes(buffer[offset : offset + count])
+            offset = 0
+
+        (
+            type_char,
+            type_delimiter,
+            length_str,
+            length_delimiter,
+            identifier_str,
+            identifier_delimiter,
+            end,
+            terminator,
+        ) = _HEADER_STRUCT.unpack_from(buffer, offset)
+
+        # the fields are checked in order, so that malformed headers raise the same errors as before
+        header = Header(type=type_char.decode("ascii"))
+
+        if type_delimiter != b".":
             raise ValueError("Header type delimeter is malformed")
 
-        length_str = HeaderSerializer._binary_array_to_str(
-            buffer[
-                HeaderSerializer.LENGTH_OFFSET : HeaderSerializer.LENGTH_OFFSET
-                + HeaderSerializer.LENGTH_LENGTH
-            ]
-        )
-
+        length_str = length_str.decode("ascii")
         try:
             length = int(length_str)
         except Exception:
@@ -98,19 +106,10 @@ class HeaderSerializer:
 
         header.payload_length = length
 
-        if (
-            buffer[HeaderSerializer.LENGTH_DELIMETER_OFFSET]
-            != HeaderSerializer.DELIMITER
-        ):
+        if length_delimiter != b".":
             raise ValueError("Header length delimeter is malformed")
 
-        identifier_str = HeaderSerializer._binary_array_to_str(
-            buffer[
-                HeaderSerializer.ID_OFFSET : HeaderSerializer.ID_OFFSET
-                + HeaderSerializer.ID_LENGTH
-            ]
-        )
-
+        identifier_str = identifier_str.decode("ascii")
         try:
             identifier = UUID(identifier_str)
         except Exception:
@@ -118,18 +117,15 @@ class HeaderSerializer:
 
         header.id = identifier
 
-        if buffer[HeaderSerializer.ID_DELIMETER_OFFSET] != HeaderSerializer.DELIMITER:
+        if identifier_delimiter != b".":
             raise ValueError("Header id delimeter is malformed")
 
-        if buffer[HeaderSerializer.END_OFFSET] not in [
-            HeaderSerializer.END,
-            HeaderSerializer.NOT_END,
-        ]:
+        if end not in (b"1", b"0"):
             raise ValueError("Header end is malformed")
 
-        header.end = buffer[HeaderSerializer.END_OFFSET] == HeaderSerializer.END
+        header.end = end == b"1"
 
-        if buffer[HeaderSerializer.TERMINATOR_OFFSET] != HeaderSerializer.TERMINATOR:
+        if terminator != b"\n":
             raise ValueError("Header terminator is malformed")
 
         return header
@@ -145,25 +141,3 @@ class HeaderSerializer:
             raise ValueError("Char to cast should be in the ASCII domain")
 
         return unicode_list[0]
-
-    @staticmethod
-    def _int_to_formatted_encoded_str(value: int, str_format: str) -> bytes:
-        return str_format.format(value).encode("ascii")
-
-    @staticmethod
-    def _uuid_to_numeric_encoded_str(value: UUID) -> bytes:
-        return str(value).encode("ascii")
-
-    @staticmethod
-    def _binary_int_to_char(binary_int: int) -> str:
-        return bytes([binary_int]).decode("ascii")
-
-    @staticmethod
-    def _binary_array_to_str(binary_array: List[int]) -> str:
-        return bytes(binary_array).decode("ascii")
-
-    @staticmethod
-    def _write_in_buffer(data: List[int], buffer: List[int], insert_index: int):
-        for byte_int in data:
-            buffer[insert_index] = byte_int
-            insert_index += 1
@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 from uuid import UUID
-from typing import Awaitable, Callable, Dict, List, Union
+from typing import Awaitable, Callable, Dict, Union
 
 from botframework.streaming.payloads.assemblers import (
     Assembler,
@@ -10,6 +10,7 @@ from botframework.streaming.payloads.assemblers import (
     ReceiveResponseAssembler,
 )
 from botframework.streaming.payloads.models import Header, PayloadTypes
+from botframework.streaming.transport import Buffer
 
 from .stream_manager import StreamManager
 
@@ -28,8 +29,8 @@ class PayloadAssemblerManager:
 
     def get_payload_stream(
         self, header: Header
-    ) -> Union[List[int], "streaming.PayloadStream"]:
-        # TODO: The return value SHOULDN'T be a union, we should interface List[int] into a BFStream class
+    ) -> Union[Buffer, "streaming.PayloadStream"]:
+        # TODO: The return value SHOULDN'T be a union, we should interface Buffer into a BFStream class
         if self._is_stream_payload(header):
             return self._stream_manager.get_payload_stream(header)
         if not self._active_assemblers.get(header.id):
@@ -41,9 +42,7 @@ class PayloadAssemblerManager:
 
         return None
 
-    def on_receive(
-        self, header: Header, content_stream: List[int], content_length: int
-    ):
+    def on_receive(self, header: Header, content_stream: Buffer, content_length: int):
         if self._is_stream_payload(header):
             self._stream_manager.on_receive(header, content_stream, content_length)
         else:
@@ -2,10 +2,11 @@
 # Licensed under the MIT License.
 
 from uuid import UUID
-from typing import Callable, Dict, List
+from typing import Callable, Dict
 
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.payloads.models import Header
+from botframework.streaming.transport import Buffer
 
 
 class StreamManager:
@@ -27,9 +28,7 @@ class StreamManager:
 
         return assembler.get_payload_as_stream()
 
-    def on_receive(
-        self, header: Header, content_stream: List[int], content_length: int
-    ):
+    def on_receive(self, header: Header, content_stream: Buffer, content_length: int):
         assembler = self._active_assemblers.get(header.id)
 
         if assembler:
@@ -4,6 +4,7 @@
 from typing import List
 
 from botframework.streaming.payloads import ContentStream
+from botframework.streaming.transport import as_buffer
 
 
 class ReceiveRequest:
@@ -24,6 +25,6 @@ class ReceiveRequest:
 
             # TODO: encoding double check
             stream = await content_stream.stream.read_until_end()
-            return bytes(stream).decode("utf-8-sig")
+            return str(as_buffer(stream), "utf-8-sig")
         except Exception as error:
             raise error
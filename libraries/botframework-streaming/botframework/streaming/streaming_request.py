@@ -65,9 +65,7 @@ class StreamingRequest:
         if not body:
             return
 
-        if isinstance(body, bytes):
-            pass
-        else:
+        if not isinstance(body, (bytes, bytearray, memoryview)):
             if isinstance(body, Serializable):
                 body = body.to_json()
             elif isinstance(body, Model):
@@ -75,7 +73,7 @@ class StreamingRequest:
 
             body = body.encode("ascii")
 
-        self.add_stream(list(body))
+        self.add_stream(body)
 
     def add_stream(self, content: object, stream_id: UUID = None):
         if not content:
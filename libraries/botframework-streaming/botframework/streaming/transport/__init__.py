@@ -4,11 +4,14 @@
 from .disconnected_event_args import DisconnectedEventArgs
 from .streaming_transport_service import StreamingTransportService
 from .transport_base import TransportBase
+from .transport_buffer import Buffer, as_buffer
 from .transport_constants import TransportConstants
 from .transport_receiver_base import TransportReceiverBase
 from .transport_sender_base import TransportSenderBase
 
 __all__ = [
+    "as_buffer",
+    "Buffer",
     "DisconnectedEventArgs",
     "StreamingTransportService",
     "TransportBase",
@@ -0,0 +1,23 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Iterable, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
+def as_buffer(data: Union[Buffer, Iterable[int]]) -> Buffer:
+    """
+    Returns binary data as a bytes-like object that can be sliced without copying.
+
+    .. remarks::
+        bytes, bytearray and memoryview are returned as is. Lists of ints, which were used for
+        binary data by earlier versions, are converted to bytes. None is returned as empty bytes.
+    """
+    if isinstance(data, _BUFFER_TYPES):
+        return data
+    if data is None:
+        return b""
+    return bytes(data)
@@ -19,7 +19,20 @@ from .web_socket_transport import WebSocketTransport
 
 
 class WebSocketServer:
-    def __init__(self, socket: WebSocket, request_handler: RequestHandler):
+    """
+    Serves a streaming connection over a web socket.
+
+    :param coalesce_frames: Whether packets queued together are written as a single web socket message. Only
+     set it if the client reads the messages as a stream of bytes, rather than a header or payload per message.
+    :type coalesce_frames: bool
+    """
+
+    def __init__(
+        self,
+        socket: WebSocket,
+        request_handler: RequestHandler,
+        coalesce_frames: bool = False,
+    ):
         if socket is None:
             raise TypeError(
                 f"'socket: {socket.__class__.__name__}' argument can't be None"
@@ -36,7 +49,7 @@ class WebSocketServer:
         self._web_socket_transport = WebSocketTransport(socket)
         self._request_handler = request_handler
         self._request_manager = RequestManager()
-        self._sender = PayloadSender()
+        self._sender = PayloadSender(coalesce_frames=coalesce_frames)
         self._sender.disconnected = self._on_connection_disconnected
         self._receiver = PayloadReceiver()
         self._receiver.disconnected = self._on_connection_disconnected
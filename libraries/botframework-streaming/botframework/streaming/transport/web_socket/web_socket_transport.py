@@ -2,9 +2,13 @@
 # Licensed under the MIT License.
 
 import traceback
-from typing import List
 
-from botframework.streaming.transport import TransportReceiverBase, TransportSenderBase
+from botframework.streaming.transport import (
+    Buffer,
+    TransportReceiverBase,
+    TransportSenderBase,
+    as_buffer,
+)
 
 from .web_socket import WebSocket
 from .web_socket_message_type import WebSocketMessageType
@@ -15,6 +19,8 @@ from .web_socket_state import WebSocketState
 class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
     def __init__(self, web_socket: WebSocket):
         self._socket = web_socket
+        # the part of the last message that hasn't been received yet
+        self._unread: memoryview = None
 
     @property
     def is_connected(self):
@@ -40,27 +46,29 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
                 traceback.print_exc()
 
     # TODO: might need to remove offset and count if no segmentation possible
-    # TODO: considering to create a BFTransportBuffer class to abstract the logic of binary buffers adapting to
-    #  current interfaces
-    async def receive(
-        self, buffer: List[int], offset: int = 0, count: int = None
-    ) -> int:
+    async def receive(self, buffer: Buffer, offset: int = 0, count: int = None) -> int:
         try:
             if self._socket:
-                result = await self._socket.receive()
-                buffer_index = offset
-                result_length = count if count is not None else len(result.data)
-                for result_index in range(result_length):
-                    buffer[buffer_index] = result.data[result_index]
-                    buffer_index += 1
-                if result.message_type == WebSocketMessageType.CLOSE:
-                    await self._socket.close(
-                        WebSocketCloseStatus.NORMAL_CLOSURE, "Socket closed"
-                    )
+                data = self._unread
+                if not data:
+                    result = await self._socket.receive()
+                    data = memoryview(as_buffer(result.data))
+                    if result.message_type == WebSocketMessageType.CLOSE:
+                        await self._socket.close(
+                            WebSocketCloseStatus.NORMAL_CLOSURE, "Socket closed"
+                        )
 
-                    # Depending on ws implementation library next line might not be necessary
-                    if self._socket.status == WebSocketState.CLOSED:
-                        self._socket.dispose()
+                        # Depending on ws implementation library next line might not be necessary
+                        if self._socket.status == WebSocketState.CLOSED:
+                            self._socket.dispose()
+
+                result_length = (
+                    min(count, len(data)) if count is not None else len(data)
+                )
+                # a single copy into the caller's buffer
+                buffer[offset : offset + result_length] = data[:result_length]
+                # a message can hold several headers and payloads, the rest is returned by the next calls
+                self._unread = data[result_length:]
 
                 return result_length
         except Exception as error:
@@ -69,16 +77,20 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
             # be thrown to cause a non-transport-connectivity failure.
             raise error
 
-    # TODO: might need to remove offset and count if no segmentation possible (or put them in BFTransportBuffer)
-    async def send(self, buffer: List[int], offset: int = 0, count: int = None) -> int:
+    # TODO: might need to remove offset and count if no segmentation possible
+    async def send(self, buffer: Buffer, offset: int = 0, count: int = None) -> int:
         try:
             if self._socket:
+                data = memoryview(as_buffer(buffer))
+                if count is None:
+                    count = len(data) - offset
+                # the slice is a view, the socket writes the caller's memory
                 await self._socket.send(
-                    buffer[offset:count] if count is not None else buffer,
+                    data[offset : offset + count],
                     WebSocketMessageType.BINARY,
                     True,
                 )
-                return count or len(buffer)
+                return count
         except Exception as error:
             # Exceptions of the three types below will also have set the socket's state to closed, which fires an
             # event consumers of this class are subscribed to and have handling around. Any other exception needs to
@@ -38,6 +38,7 @@ setup(
     license=package_info["__license__"],
     packages=[
         "botframework.streaming",
+        "botframework.streaming.benchmarks",
         "botframework.streaming.payloads",
         "botframework.streaming.payloads.assemblers",
         "botframework.streaming.payloads.disassemblers",
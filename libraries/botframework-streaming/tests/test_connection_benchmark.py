@@ -0,0 +1,55 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import json
+from unittest import TestCase
+
+from botframework.streaming.benchmarks import (
+    connection_benchmark,
+    header_serializer_benchmark,
+)
+
+
+class TestConnectionBenchmark(TestCase):
+    def test_benchmark_runs(self):
+        results = connection_benchmark.run(number=20)
+
+        self.assertEqual(
+            {"small_activities", "large_attachments", "concurrent_streams"},
+            set(results),
+        )
+        for measures in results.values():
+            self.assertGreater(measures["requests_per_second"], 0)
+            self.assertGreater(measures["bytes_per_second"], 0)
+            self.assertLessEqual(measures["latency_p50_ms"], measures["latency_p99_ms"])
+        self.assertEqual(20, results["small_activities"]["requests"])
+        self.assertGreater(results["large_attachments"]["bytes_sent"], 512 * 1024)
+        json.dumps(results)
+
+    def test_benchmark_runs_above_the_send_queue_size(self):
+        # the concurrent streams post more packets at once than the send queue of 100 holds
+        results = connection_benchmark.run(number=200)
+
+        concurrent_streams = results["concurrent_streams"]
+        self.assertEqual(100, concurrent_streams["requests"])
+        self.assertEqual(64, concurrent_streams["concurrency"])
+        self.assertGreater(concurrent_streams["bytes_per_second"], 0)
+
+    def test_benchmark_runs_without_coalescing(self):
+        results = connection_benchmark.run(number=2, coalesce_frames=False)
+
+        self.assertEqual(2, results["small_activities"]["requests"])
+
+    def test_percentile(self):
+        values = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(50, connection_benchmark.percentile(values, 50))
+        self.assertEqual(99, connection_benchmark.percentile(values, 99))
+        self.assertEqual(1, connection_benchmark.percentile(values[:1], 99))
+        self.assertEqual(0, connection_benchmark.percentile([], 50))
+
+    def test_header_serializer_benchmark_runs(self):
+        results = header_serializer_benchmark.run(number=1)
+
+        self.assertEqual(6, len(results))
+        self.assertTrue(all(microseconds > 0 for microseconds in results.values()))
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 import aiounittest
 
+from botframework.streaming import PayloadStream
 from botframework.streaming.payloads import ContentStream
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 
@@ -32,3 +33,69 @@ class TestResponses(aiounittest.AsyncTestCase):
         self.assertEqual(test_type, sut.content_type)
 
         sut.cancel()
+
+    async def test_payload_stream_iterates_chunks(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, uuid4(), length=6))
+        stream.give_buffer(bytearray(b"abc"))
+        stream.give_buffer(b"def")
+
+        chunks = [chunk async for chunk in stream]
+
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual([b"abc", b"def"], [bytes(chunk) for chunk in chunks])
+
+    async def test_payload_stream_chunks_end_when_done_producing(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, uuid4()))
+        stream.give_buffer(b"abc")
+        stream.done_producing()
+
+        chunks = [bytes(chunk) async for chunk in stream.chunks()]
+
+        self.assertEqual([b"abc"], chunks)
+
+    async def test_payload_stream_chunks_bound_buffering(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, uuid4(), length=12))
+        chunks = stream.chunks(max_buffered_length=4)
+
+        stream.give_buffer(b"abc")
+        self.assertEqual(b"abc", bytes(await chunks.__anext__()))
+
+        # the third buffer exceeds the bound while the second is unread, the stream fails
+        stream.give_buffer(b"def")
+        stream.give_buffer(b"ghi")
+        stream.give_buffer(b"jkl")
+
+        with self.assertRaises(RuntimeError):
+            await chunks.__anext__()
+
+    async def test_payload_stream_chunks_bound_starts_with_the_iteration(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, uuid4(), length=17))
+        stream.give_buffer(b"abc")
+        stream.give_buffer(b"def")
+        stream.give_buffer(b"ghi")
+
+        # the buffers given before the iteration don't count against the bound
+        chunks = stream.chunks(max_buffered_length=4)
+        self.assertEqual(b"abc", bytes(await chunks.__anext__()))
+        stream.give_buffer(b"jkl")
+        received = [bytes(await chunks.__anext__()) for _ in range(3)]
+        self.assertEqual([b"def", b"ghi", b"jkl"], received)
+
+        stream.give_buffer(b"mn")
+        stream.give_buffer(b"opq")
+        with self.assertRaises(RuntimeError):
+            await chunks.__anext__()
+
+    async def test_payload_stream_chunks_bound_ends_when_stopped(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, uuid4(), length=9))
+        stream.give_buffer(b"abc")
+
+        chunks = stream.chunks(max_buffered_length=2)
+        self.assertEqual(b"abc", bytes(await chunks.__anext__()))
+        await chunks.aclose()
+
+        stream.give_buffer(b"def")
+        stream.give_buffer(b"ghi")
+        buffer = bytearray(3)
+        self.assertEqual(3, await stream.read(buffer, 0, 3))
+        self.assertEqual(b"def", bytes(buffer))
@@ -134,3 +134,58 @@ class TestHeaderSerializer(TestCase):
 
         with pytest.raises(ValueError):
             HeaderSerializer.deserialize(buffer, 0, len(buffer))
+
+    def test_can_round_trip_bytearray_at_offset(self):
+        header = Header()
+        header.type = PayloadTypes.STREAM
+        header.payload_length = 4096
+        header.id = uuid4()
+        header.end = False
+
+        buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH + 10)
+        offset: int = 10
+
+        length = HeaderSerializer.serialize(header, memoryview(buffer), offset)
+        result = HeaderSerializer.deserialize(buffer, offset, length)
+
+        self.assertEqual(bytes(10), bytes(buffer[:offset]))
+        self.assertEqual(
+            f"S.004096.{str(header.id)}.0\n", buffer[offset:].decode("ascii")
+        )
+        self.assertEqual(header.type, result.type)
+        self.assertEqual(header.payload_length, result.payload_length)
+        self.assertEqual(header.id, result.id)
+        self.assertEqual(header.end, result.end)
+
+    def test_serialize_non_ascii_type_throws(self):
+        header = Header(type="é", id=uuid4(), end=True)
+        header.payload_length = 168
+
+        with pytest.raises(
+            ValueError, match="Char to cast should be in the ASCII domain"
+        ):
+            HeaderSerializer.serialize(header, bytearray(48), 0)
+
+    def test_deserialize_errors_are_the_same_for_all_buffers(self):
+        header_id: UUID = uuid4()
+        headers = {
+            f"Ax000168.{str(header_id)}.1\n": "Header type delimeter is malformed",
+            f"A.00p168.{str(header_id)}.1\n": "Header length is malformed",
+            f"A.-00168.{str(header_id)}.1\n": "Length must be greater or equal than 0",
+            f"A.000168x{str(header_id)}.1\n": "Header length delimeter is malformed",
+            "A.000168.68e9p9ca-a651-40f4-ad8f-3aaf781862b4.1\n": "Header id is malformed",
+            f"A.000168.{str(header_id)}x1\n": "Header id delimeter is malformed",
+            f"A.000168.{str(header_id)}.z\n": "Header end is malformed",
+            f"A.000168.{str(header_id)}.1c": "Header terminator is malformed",
+        }
+
+        for header, message in headers.items():
+            data = bytes(header, "ascii")
+            for buffer in (list(data), data, bytearray(data), memoryview(data)):
+                with pytest.raises(ValueError, match=message):
+                    HeaderSerializer.deserialize(buffer, 0, len(data))
+
+        data = bytes(f"A.0001\xe98.{str(header_id)}.1\n", "latin-1")
+        for buffer in (list(data), bytearray(data)):
+            with pytest.raises(UnicodeDecodeError):
+                HeaderSerializer.deserialize(buffer, 0, len(data))
@@ -1,10 +1,18 @@
+import asyncio
 from typing import List
+from uuid import uuid4
 
 import aiounittest
 
 from botframework.streaming import PayloadStream
 from botframework.streaming.payload_transport import PayloadReceiver
-from botframework.streaming.transport import TransportReceiverBase
+from botframework.streaming.payloads import HeaderSerializer
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.payloads.models import Header, PayloadTypes
+from botframework.streaming.transport import (
+    TransportConstants,
+    TransportReceiverBase,
+)
 
 
 class MockTransportReceiver(TransportReceiverBase):
@@ -34,6 +42,38 @@ class MockTransportReceiver(TransportReceiverBase):
         return len(resp_buffer)
 
 
+class BytesTransportReceiver(TransportReceiverBase):
+    """Serves the given bytes, then reports the transport as closed."""
+
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+
+    @property
+    def is_connected(self):
+        return self._offset < len(self._data)
+
+    async def close(self):
+        return
+
+    async def receive(self, buffer: object, offset: int, count: int) -> int:
+        length = min(count, len(self._data) - self._offset)
+        buffer[offset : offset + length] = self._data[
+            self._offset : self._offset + length
+        ]
+        self._offset += length
+        await asyncio.sleep(0)
+        return length
+
+
+def create_packet(payload_type: str, identifier, payload: bytes, end: bool) -> bytes:
+    header = Header(type=payload_type, id=identifier, end=end)
+    header.payload_length = len(payload)
+    header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+    HeaderSerializer.serialize(header, header_buffer, 0)
+    return bytes(header_buffer) + payload
+
+
 class MockStream(PayloadStream):
     # pylint: disable=super-init-not-called
     def __init__(self):
@@ -69,3 +109,43 @@ class TestBotFrameworkHttpClient(aiounittest.AsyncTestCase):
 
         assert bytes(mock_stream.buffer) == mock_payload
         assert receive_action_called
+
+    async def test_unread_stream_does_not_hold_other_payloads(self):
+        stream_id = uuid4()
+        response_id = uuid4()
+        chunk = bytes(TransportConstants.MAX_PAYLOAD_LENGTH)
+        packets = [
+            create_packet(PayloadTypes.STREAM, stream_id, chunk, False)
+            for _ in range(4)
+        ]
+        packets.append(create_packet(PayloadTypes.RESPONSE, response_id, b"{}", True))
+        packets.append(create_packet(PayloadTypes.STREAM, stream_id, chunk, True))
+
+        stream = PayloadStream(
+            PayloadStreamAssembler(None, stream_id, length=5 * len(chunk))
+        )
+        # the consumer of the stream never reads it
+        chunks = stream.chunks(max_buffered_length=2 * len(chunk))
+        received = []
+        responses = []
+
+        def get_stream(header: Header):
+            if PayloadTypes.is_stream(header):
+                return stream
+            return bytearray(header.payload_length)
+
+        def receive_action(header: Header, content_stream: object, length: int):
+            received.append(header.type)
+            if not PayloadTypes.is_stream(header):
+                responses.append((header.id, bytes(content_stream[:length])))
+
+        sut = PayloadReceiver()
+        sut.subscribe(get_stream, receive_action)
+        await asyncio.wait_for(
+            sut.connect(BytesTransportReceiver(b"".join(packets))), 1
+        )
+
+        assert responses == [(response_id, b"{}")]
+        assert len(received) == 6
+        with self.assertRaises(RuntimeError):
+            await chunks.__anext__()
@@ -1,4 +1,5 @@
-from asyncio import Semaphore
+import asyncio
+from asyncio import Event, Semaphore
 from typing import List
 from uuid import UUID, uuid4
 
@@ -58,3 +59,131 @@ class TestPayloadSender(aiounittest.AsyncTestCase):
         # Assert
         await sender.send_called.acquire()
         await sut.disconnect()
+
+
+class RecordingTransportSender(TransportSenderBase):
+    def __init__(self):
+        super().__init__()
+        self.buffers = []
+        self.can_send = Event()
+        self.can_send.set()
+
+    async def send(self, buffer: List[int], offset: int, count: int) -> int:
+        await self.can_send.wait()
+        self.buffers.append(bytes(buffer[offset : offset + count]))
+        return count
+
+    def close(self):
+        pass
+
+
+class TestPayloadSenderQueue(aiounittest.AsyncTestCase):
+    @staticmethod
+    def create_header(payload_length: int) -> Header:
+        header = Header(type="A", id=uuid4(), end=True)
+        header.payload_length = payload_length
+        return header
+
+    async def test_coalesces_queued_packets(self):
+        sut = PayloadSender(coalesce_frames=True)
+        sender = RecordingTransportSender()
+        sut.connect(sender)
+        sent = []
+
+        async def sent_callback(header: Header):
+            sent.append(header)
+
+        headers = [self.create_header(3) for _ in range(3)]
+        for header in headers:
+            sut.send_payload(header, b"abc", True, sent_callback)
+
+        while len(sent) < 3:
+            await asyncio.sleep(0)
+
+        self.assertEqual(1, len(sender.buffers))
+        frame = sender.buffers[0]
+        self.assertEqual(3 * 51, len(frame))
+        for index, header in enumerate(headers):
+            start = index * 51
+            self.assertEqual(
+                header.id, HeaderSerializer.deserialize(frame, start, 48).id
+            )
+            self.assertEqual(b"abc", frame[start + 48 : start + 51])
+        self.assertEqual(3, sut.metrics.packets_written)
+        self.assertEqual(1, sut.metrics.batches)
+        self.assertEqual(0, sut.metrics.bytes_in_flight)
+        self.assertEqual(3 * 51, sut.metrics.max_bytes_in_flight)
+
+        await sut.disconnect()
+
+    async def test_sends_header_and_payload_separately_by_default(self):
+        sut = PayloadSender()
+        sender = RecordingTransportSender()
+        sut.connect(sender)
+        sent = Event()
+
+        async def sent_callback(_: Header):
+            sent.set()
+
+        sut.send_payload(self.create_header(3), b"abc", True, sent_callback)
+        await sent.wait()
+
+        self.assertEqual([48, 3], [len(buffer) for buffer in sender.buffers])
+
+        await sut.disconnect()
+
+    async def test_full_queue_makes_callers_wait(self):
+        sut = PayloadSender(max_queue_size=2)
+        sender = RecordingTransportSender()
+        sender.can_send.clear()
+        sut.connect(sender)
+
+        admitted = [
+            sut.send_payload(self.create_header(3), b"abc", True, None)
+            for _ in range(5)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # two packets are being written, two are queued and the last one waits for room
+        self.assertEqual([True, True, True, True, False], [a.done() for a in admitted])
+        self.assertEqual(3, sut.metrics.queue_depth)
+        self.assertEqual(5 * 51, sut.metrics.bytes_in_flight)
+
+        sender.can_send.set()
+        await asyncio.wait_for(asyncio.gather(*admitted), 1)
+        while sut.metrics.packets_written < 5:
+            await asyncio.sleep(0)
+
+        self.assertEqual(10, len(sender.buffers))
+        self.assertEqual(0, sut.metrics.queue_depth)
+        self.assertEqual(5, sut.metrics.max_queue_depth)
+        self.assertGreater(sut.metrics.max_wait_time, 0)
+
+        await sut.disconnect()
+
+    async def test_concurrent_senders_wait_for_room(self):
+        sut = PayloadSender(max_queue_size=2)
+        sender = RecordingTransportSender()
+        sender.can_send.clear()
+        sut.connect(sender)
+
+        async def send():
+            await sut.send_payload(self.create_header(3), b"abc", True, None)
+
+        # many more senders than the queue holds, each awaiting its packet
+        senders = [asyncio.ensure_future(send()) for _ in range(25)]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # the senders past the queue and the batch being written wait, none fails
+        self.assertFalse(all(task.done() for task in senders))
+        self.assertFalse(any(task.done() and task.exception() for task in senders))
+
+        sender.can_send.set()
+        await asyncio.wait_for(asyncio.gather(*senders), 1)
+        while sut.metrics.packets_written < 25:
+            await asyncio.sleep(0)
+
+        self.assertEqual(50, len(sender.buffers))
+
+        await sut.disconnect()
@@ -101,7 +101,7 @@ class TestRequests(aiounittest.AsyncTestCase):
 
         self.assertIsNotNone(sut.streams)
         self.assertEqual(1, len(sut.streams))
-        self.assertIsInstance(sut.streams[0].content, list)
+        self.assertIsInstance(sut.streams[0].content, bytes)
         self.assertIsInstance(sut.streams[0].content[0], int)
         self.assertEqual("123", bytes(sut.streams[0].content).decode("utf-8-sig"))
 
@@ -118,7 +118,7 @@ class TestRequests(aiounittest.AsyncTestCase):
 
         self.assertIsNotNone(sut.streams)
         self.assertEqual(1, len(sut.streams))
-        self.assertIsInstance(sut.streams[0].content, list)
+        self.assertIsInstance(sut.streams[0].content, bytes)
         self.assertIsInstance(sut.streams[0].content[0], int)
 
         assert_activity = Activity.deserialize(
@@ -1,13 +1,14 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
 from typing import List
 from uuid import uuid4
 
 import aiounittest
 
 from botframework.streaming import PayloadStream, StreamingRequest
-from botframework.streaming.payloads import SendOperations
+from botframework.streaming.payloads import HeaderSerializer, SendOperations
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.payload_transport import PayloadSender
 from botframework.streaming.transport import TransportSenderBase
@@ -19,9 +20,12 @@ class MockTransportSender(TransportSenderBase):
         super().__init__()
         self.is_connected = True
         self.buffers = []
+        self.can_send = asyncio.Event()
+        self.can_send.set()
 
     async def send(self, buffer: List[int], offset: int, count: int) -> int:
-        self.buffers.append(buffer.copy())
+        await self.can_send.wait()
+        self.buffers.append(bytes(buffer[offset : offset + count]))
 
         return count
 
@@ -54,3 +58,80 @@ class TestSendOperations(aiounittest.AsyncTestCase):
 
         await sut.send_request(uuid4(), request)
         self.assertEqual(4, len(transport.buffers))
+
+    async def test_large_stream_is_sent_in_chunks(self):
+        sender = PayloadSender()
+        transport = MockTransportSender()
+        sender.connect(transport)
+
+        sut = SendOperations(sender)
+
+        content = bytes(range(256)) * 20
+        request = StreamingRequest.create_post("/a/b")
+        request.add_stream(content)
+
+        await sut.send_request(uuid4(), request)
+
+        # request header and payload, then two stream chunks with their headers
+        # the chunks after the first are sent as the previous one completes
+        while len(transport.buffers) < 6:
+            await asyncio.sleep(0)
+        self.assertEqual(6, len(transport.buffers))
+        first_header = HeaderSerializer.deserialize(transport.buffers[2], 0, 48)
+        second_header = HeaderSerializer.deserialize(transport.buffers[4], 0, 48)
+        self.assertEqual(4096, first_header.payload_length)
+        self.assertFalse(first_header.end)
+        self.assertEqual(len(content) - 4096, second_header.payload_length)
+        self.assertTrue(second_header.end)
+        self.assertEqual(content, transport.buffers[3] + transport.buffers[5])
+
+    async def test_large_stream_is_sent_while_the_queue_is_full(self):
+        sender = PayloadSender(max_queue_size=2)
+        transport = MockTransportSender()
+        transport.can_send.clear()
+        sender.connect(transport)
+
+        sut = SendOperations(sender)
+
+        content = bytes(range(256)) * 64
+        request = StreamingRequest.create_post("/a/b")
+        request.add_stream(content)
+
+        async def send_other_request():
+            other = StreamingRequest.create_post("/a/c")
+            other.add_stream(b"abc")
+            await sut.send_request(uuid4(), other)
+
+        # the other requests keep the queue full while the stream chunks are sent
+        sends = [asyncio.ensure_future(send_other_request()) for _ in range(10)]
+        sends.append(asyncio.ensure_future(sut.send_request(uuid4(), request)))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        transport.can_send.set()
+        await asyncio.wait_for(asyncio.gather(*sends), 1)
+
+        # request header and payload, then four stream chunks with their headers
+        # the other requests each send four buffers
+        while len(transport.buffers) < 10 + 10 * 4:
+            await asyncio.sleep(0)
+        chunks = [
+            transport.buffers[index + 1]
+            for index, buffer in enumerate(transport.buffers)
+            if len(buffer) == 48
+            and HeaderSerializer.deserialize(buffer, 0, 48).payload_length == 4096
+        ]
+        self.assertEqual(content, b"".join(chunks))
+
+    async def test_list_stream_is_still_accepted(self):
+        sender = PayloadSender()
+        transport = MockTransportSender()
+        sender.connect(transport)
+
+        sut = SendOperations(sender)
+
+        request = StreamingRequest.create_post("/a/b")
+        request.add_stream(list(b"abc"))
+
+        await sut.send_request(uuid4(), request)
+        self.assertEqual(4, len(transport.buffers))
+        self.assertEqual(b"abc", transport.buffers[3])
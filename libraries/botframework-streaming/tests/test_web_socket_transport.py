@@ -0,0 +1,99 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Any, List
+
+import aiounittest
+
+from botframework.streaming import PayloadStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.transport import as_buffer
+from botframework.streaming.transport.web_socket import (
+    WebSocket,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketState,
+    WebSocketTransport,
+)
+
+
+class MockWebSocket(WebSocket):
+    def __init__(self, messages: List[Any] = None):
+        self.sent = []
+        self._messages = messages or []
+
+    async def receive(self) -> WebSocketMessage:
+        return WebSocketMessage(
+            message_type=WebSocketMessageType.BINARY, data=self._messages.pop(0)
+        )
+
+    async def send(
+        self, buffer: Any, message_type: WebSocketMessageType, end_of_message: bool
+    ):
+        self.sent.append(buffer)
+
+    @property
+    def status(self) -> WebSocketState:
+        return WebSocketState.OPEN
+
+
+class TestWebSocketTransport(aiounittest.AsyncTestCase):
+    def test_as_buffer(self):
+        data = bytearray(b"abc")
+
+        self.assertIs(data, as_buffer(data))
+        self.assertEqual(b"abc", as_buffer([97, 98, 99]))
+        self.assertEqual(b"", as_buffer(None))
+
+    async def test_send_writes_a_view_of_the_buffer(self):
+        socket = MockWebSocket()
+        sut = WebSocketTransport(socket)
+        buffer = bytearray(b"0123456789")
+
+        self.assertEqual(4, await sut.send(buffer, 2, 4))
+
+        sent = socket.sent[0]
+        self.assertIsInstance(sent, memoryview)
+        self.assertEqual(b"2345", sent)
+        buffer[2] = ord("x")
+        self.assertEqual(b"x345", sent)
+
+    async def test_send_accepts_lists(self):
+        socket = MockWebSocket()
+        sut = WebSocketTransport(socket)
+
+        self.assertEqual(3, await sut.send([1, 2, 3], 0, 3))
+        self.assertEqual(bytes([1, 2, 3]), socket.sent[0])
+
+    async def test_receive_into_buffer(self):
+        sut = WebSocketTransport(MockWebSocket([b"abcd", [1, 2]]))
+        buffer = bytearray(10)
+
+        self.assertEqual(4, await sut.receive(memoryview(buffer), 3, 4))
+        self.assertEqual(b"\x00\x00\x00abcd\x00\x00\x00", buffer)
+
+        legacy_buffer = [None] * 4
+        self.assertEqual(2, await sut.receive(legacy_buffer, 1, 3))
+        self.assertEqual([None, 1, 2, None], legacy_buffer)
+
+    async def test_receive_returns_the_rest_of_a_message(self):
+        sut = WebSocketTransport(MockWebSocket([b"abcdef", b"gh"]))
+        buffer = bytearray(4)
+
+        self.assertEqual(4, await sut.receive(buffer, 0, 4))
+        self.assertEqual(b"abcd", buffer)
+        self.assertEqual(2, await sut.receive(buffer, 0, 4))
+        self.assertEqual(b"ef", buffer[:2])
+        self.assertEqual(2, await sut.receive(buffer, 0, 4))
+        self.assertEqual(b"gh", buffer[:2])
+
+    async def test_payload_stream_reads_buffers(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, None, length=7))
+        stream.give_buffer(bytearray(b"abc"))
+        stream.give_buffer([100, 101])
+        stream.write(b"xfgx", 1, 2)
+
+        result = await stream.read_until_end()
+
+        self.assertIsInstance(result, bytearray)
+        self.assertEqual(b"abcdefg", result)